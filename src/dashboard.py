@@ -1,14 +1,12 @@
 # dashboard.py
 import streamlit as st
 import pandas as pd
-from supabase import create_client
+from supabase import create_client, ClientOptions
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import os
-import matplotlib.colors as mcolors
+import time
 import ast
 
 
@@ -45,7 +43,14 @@ def init_connection():
         url = st.secrets["SUPABASE_URL"]
         key = st.secrets["SUPABASE_KEY"]
         
-        return create_client(supabase_url=url, supabase_key=key)
+        # Client di-cache oleh st.cache_resource, jadi session HTTP (keep-alive)
+        # milik PostgREST dipakai ulang di setiap rerun. Timeout dibatasi agar
+        # request kecil tidak menggantung terlalu lama.
+        options = ClientOptions(
+            postgrest_client_timeout=10,
+            storage_client_timeout=10,
+        )
+        return create_client(supabase_url=url, supabase_key=key, options=options)
     
     except Exception as e:
         st.error(f"Failed to connect to Supabase:: {e}. Ensure that secrets are set.")
@@ -53,35 +58,126 @@ def init_connection():
 
 supabase = init_connection()
 
+# --- DATA WATERMARK (CACHE KEY UNTUK load_data) ---
+@st.cache_data(ttl=30) # Probe murah, cukup dicek tiap 30 detik
+def get_data_watermark():
+    """Mengambil watermark data dari fungsi RPC 'products_watermark' di Supabase.
+
+    Fungsi di Postgres (dibuat sekali lewat SQL editor Supabase):
+        create or replace function products_watermark() returns text
+        language sql stable as $$
+            select max(processed_at)::text from products_current
+        $$;
+
+    Jika RPC belum tersedia / gagal, fallback ke bucket waktu 10 menit
+    (perilaku lama ttl=600).
+    """
+    if supabase is None: return None
+    try:
+        response = supabase.rpc('products_watermark').execute()
+        if response.data:
+            return str(response.data)
+    except Exception:
+        pass
+    return f"bucket-{int(time.time() // 600)}"
+
 # --- LOAD DATA FROM SUPABASE ---
-@st.cache_data(ttl=600) # Cache data for 10 minutes
-def load_data():
+# Hanya kolom yang benar-benar dipakai dashboard yang diambil dari Supabase
+DASHBOARD_COLUMNS = [
+    'product_hash', 'product_name', 'brand', 'series', 'processor_detail',
+    'processor_category', 'gpu', 'gpu_category', 'ram', 'storage', 'display',
+    'price_raw', 'price_in_millions'
+]
+CATEGORY_COLUMNS = [
+    'brand', 'series', 'processor_detail', 'processor_category',
+    'gpu', 'gpu_category', 'ram', 'storage'
+]
+
+def load_data(watermark):
+    """Data produk per watermark; error ditangani di sini, di luar cache."""
     if supabase is None:
         return pd.DataFrame() # Exit if connection fails
-    
+    try:
+        return _load_data_cached(watermark)
+    except Exception as e:
+        # Tidak di-cache: error sementara Supabase tidak membuat dashboard kosong sampai watermark berganti
+        st.error(f"Error loading data from Supabase: {e}")
+        return pd.DataFrame() # Return an empty DF so it doesn't crash
+
+@st.cache_data # Di-cache per watermark: tabel hanya diunduh ulang saat data berubah
+def _load_data_cached(watermark):
+    # Exception dibiarkan naik: st.cache_data tidak menyimpan hasil dari pemanggilan yang gagal
     st.info("☁️ Loading data from Supabase...")
     
+    # Retrieve data from the ‘products_current_dedup’ view in Supabase.
+    # Dedup + sort dikerjakan Postgres (DISTINCT ON + index), dibuat sekali lewat SQL editor:
+    #   create or replace view products_current_dedup as
+    #   select distinct on (product_name, brand) *
+    #   from products_current
+    #   where is_active = 1 and price_in_millions > 0 and price_in_millions < 150
+    #   order by product_name, brand, price_in_millions;
+    #   create index if not exists idx_products_current_name_brand_price
+    #   on products_current (product_name, brand, price_in_millions) where is_active = 1;
+    # Ensure that the ‘Max Rows’ setting in Supabase API Settings is > 10500
     try:
-        # Retrieve data from the ‘products_current’ table in Supabase
+        response = supabase.table('products_current_dedup').select(','.join(DASHBOARD_COLUMNS)).order('price_in_millions').execute()
+        deduped = True
+    except Exception:
+        # Fallback jika view belum dibuat: tabel asli, dedup di pandas (sekali per cache)
         # Use 1 (integer) instead of True (boolean) for the is_active filter
-        # Ensure that the ‘Max Rows’ setting in Supabase API Settings is > 10500
-        response = supabase.table('products_current').select('*, product_hash').eq('is_active', 1).execute()
-        
-        # The Supabase client returns a dictionary, which we convert to a DataFrame.
-        df = pd.DataFrame(response.data)
-
-        # --- Data Type Cleaning and Conversion (Important) ---
-        # Supabase returns everything as strings, so we convert the numeric types.
-        if not df.empty:
-            df['price_in_millions'] = pd.to_numeric(df['price_in_millions'], errors='coerce').fillna(0)
-            df['price_raw'] = pd.to_numeric(df['price_raw'], errors='coerce').fillna(0)
-            
-        st.success(f"✅ Loaded successfully from Supabase.")
-        return df
+        # Predikat harga wajar juga didorong ke server, bukan disaring di pandas
+        response = supabase.table('products_current')\
+            .select(','.join(DASHBOARD_COLUMNS))\
+            .eq('is_active', 1)\
+            .gt('price_in_millions', 0)\
+            .lt('price_in_millions', 150)\
+            .execute()
+        deduped = False
+    
+    # The Supabase client returns a list of dicts, which we convert to a DataFrame.
+    # from_records dengan kolom tetap: urutan kolom pasti, tanpa inferensi key per baris
+    df = pd.DataFrame.from_records(response.data, columns=DASHBOARD_COLUMNS)
+
+    # --- Data Type Cleaning and Conversion (Important) ---
+    # Supabase returns everything as strings, so we convert the numeric types.
+    if not df.empty:
+        df['price_in_millions'] = pd.to_numeric(df['price_in_millions'], errors='coerce').fillna(0)
+        df['price_raw'] = pd.to_numeric(df['price_raw'], errors='coerce').fillna(0)
+        # Normalisasi sekali di sini: hapus spasi ekstra RAM/Storage
+        for col in ['ram', 'storage']:
+            df[col] = df[col].str.strip()
+        # Kolom string berkardinalitas rendah disimpan sebagai category (kode int8/int16):
+        # hemat memori, groupby/value_counts/isin jalan di kode, dan opsi filter
+        # bisa diambil langsung dari .cat.categories
+        for col in CATEGORY_COLUMNS:
+            df[col] = df[col].astype('category')
+
+        # Kolom harga sebagai buffer kontigu untuk scan kolom (mean/min/max/histogram)
+        df['price_in_millions'] = np.ascontiguousarray(
+            df['price_in_millions'].to_numpy(dtype=np.float64)
+        )
+
+        if not deduped:
+            # Harga wajar sudah difilter di query (sama seperti view), tinggal dedup dan sort
+            df = df.drop_duplicates(subset=['product_name', 'brand']).sort_values('price_in_millions')
+
+        # --- Clean and validate the final price column (price_in_millions) ---
+        # Dikerjakan sekali per watermark di sini (ikut ter-cache), bukan di setiap rerun.
+        # Reasonable price filter (> 0 and < 150 million); NaN sudah jadi 0 di atas
+        price = df['price_in_millions']
+        df = df[price.gt(0) & price.lt(150)]
+
+        # Buang kategori yang sudah tidak punya baris setelah filter
+        for col in CATEGORY_COLUMNS:
+            df[col] = df[col].cat.remove_unused_categories()
+
+        # "Rechunk": setelah dedup, filter baris dan penggantian kolom di atas,
+        # copy sekali agar block terkonsolidasi dan kontigu sebelum masuk cache.
+        # (Frame hasil get_filtered sudah kontigu karena dibentuk lewat satu gather iloc.)
+        df = df.copy()
         
-    except Exception as e:
-        st.error(f"Error loading data from Supabase: {e}")
-        return pd.DataFrame() # Return an empty DF so it doesn't crash
+    st.success(f"✅ Loaded successfully from Supabase.")
+    return df
 
 # --- Load Changes Log (DENGAN PARSING JSON YANG LEBIH KUAT)
 def get_last_run_info():
@@ -161,8 +257,8 @@ def load_changes_log(run_id):
         if df_changes.empty: 
             return pd.DataFrame()
         
-        # Terapkan fungsi ekstraksi yang aman
-        df_changes['price_raw_log'] = df_changes['details_json'].apply(safe_extract_price)
+        # Terapkan fungsi ekstraksi yang aman (loop atas array NumPy, tanpa overhead Series.apply)
+        df_changes['price_raw_log'] = [safe_extract_price(v) for v in df_changes['details_json'].to_numpy(dtype=object)]
         
         return df_changes
     except Exception as e:
@@ -215,30 +311,123 @@ def prepare_changes_data(df_main, df_changes):
 
     return df_new, df_price
 
+def most_common(series):
+    """
+    Nilai terbanyak + jumlahnya dari satu kali value_counts (pengganti mode() + value_counts()).
+    sort=False pada category -> urutan kategori (alfabetis), jadi seri diputus ke nilai
+    terkecil, sama seperti mode().
+    """
+    counts = series.value_counts(sort=False)
+    top = counts.idxmax()
+    return top, int(counts[top])
+
+def category_mask(series, values):
+    """Mask bool NumPy untuk kolom category: membandingkan kode int, bukan string."""
+    codes = series.cat.categories.get_indexer(values)  # -1 untuk nilai yang tidak ada
+    return np.isin(series.cat.codes.to_numpy(), codes[codes >= 0])
+
+# --- Filtered Data (DI-CACHE PER KOMBINASI FILTER)
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_filtered(_df, watermark, selected_brands, price_range, selected_processor, selected_gpu):
+    """
+    Terapkan filter sidebar ke data utama.
+    _df tidak di-hash; watermark yang mewakili isi data, sisanya tuple/str filter.
+    """
+    # Satu mask bool NumPy (AND bitwise per kolom), lalu satu kali gather baris dengan iloc
+    price = _df['price_in_millions'].to_numpy()
+    mask = (price >= price_range[0]) & (price <= price_range[1])  # NaN otomatis False
+
+    # Brand filter
+    if selected_brands:
+        mask &= category_mask(_df['brand'], selected_brands)
+
+    # Processor category filter
+    if selected_processor != 'All':
+        mask &= category_mask(_df['processor_category'], [selected_processor])
+
+    # GPU category filter
+    if selected_gpu != 'All':
+        mask &= category_mask(_df['gpu_category'], [selected_gpu])
+
+    filtered_df = _df.iloc[mask]
+    return filtered_df
+
+# --- Product List (DI-CACHE PER KOMBINASI FILTER + SORT)
+PRODUCT_LIST_COLUMNS = {
+    'product_name': 'Product Name',
+    'brand': 'Brand',
+    'series': 'Series',
+    'processor_detail': 'Processor',
+    'gpu': 'GPU',
+    'ram': 'RAM',
+    'storage': 'Storage',
+    'display': 'Display',
+    'price_in_millions': 'Price (Rp)'
+}
+# label -> (kolom, ascending); None = urutan bawaan (data sudah terurut harga naik)
+PRODUCT_SORT_OPTIONS = {
+    "Price (Low to High)": None,
+    "Price (High to Low)": ('price_in_millions', False),
+    "Product Name (A-Z)": ('product_name', True),
+}
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_product_list(_filtered_df, watermark, filter_key, sort_option):
+    """Kolom tabel Product List (sudah di-rename) dalam urutan sort yang dipilih."""
+    product_list = _filtered_df[list(PRODUCT_LIST_COLUMNS)]
+    sort_spec = PRODUCT_SORT_OPTIONS[sort_option]
+    if sort_spec is not None:
+        column, ascending = sort_spec
+        product_list = product_list.sort_values(column, ascending=ascending, kind='stable')
+    return product_list.rename(columns=PRODUCT_LIST_COLUMNS)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_product_list_csv(_product_list, watermark, filter_key, sort_option):
+    """CSV (bytes) dari seluruh Product List untuk tombol download."""
+    return _product_list.to_csv(index=False).encode('utf-8')
+
+# --- Aggregates (DI-CACHE PER KOMBINASI FILTER)
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_aggregates(_filtered_df, watermark, filter_key):
+    """
+    Semua agregasi untuk tab dihitung sekali per kombinasi filter:
+    rata-rata harga per brand, jumlah pasangan processor-gpu, value counts RAM/Storage,
+    min/max harga.
+    """
+    # Baris dengan processor_category / gpu_category NaN tidak ikut pasangan
+    df_clean = _filtered_df.dropna(subset=['processor_category', 'gpu_category'])
+
+    # Value counts tanpa 'Unknown ...' (kolom category: buang kategori yang jumlahnya 0)
+    ram_counts = _filtered_df.loc[_filtered_df['ram'] != 'Unknown RAM', 'ram'].value_counts(sort=True, ascending=False)
+    storage_counts = _filtered_df.loc[_filtered_df['storage'] != 'Unknown Storage', 'storage'].value_counts(sort=True, ascending=False)
+
+    # Min/max harga (untuk range sumbu Y box plot), NumPy reduction sekali per filter
+    prices = _filtered_df['price_in_millions'].to_numpy()
+    price_min, price_max = (np.min(prices), np.max(prices)) if len(prices) else (None, None)
+
+    return {
+        "avg_price_by_brand": _filtered_df.groupby('brand', observed=True, sort=False)['price_in_millions'].mean().sort_values(ascending=False),
+        "proc_gpu_counts": df_clean.groupby(['processor_category', 'gpu_category'], observed=True, sort=False).size(),
+        # Urutan sumbu heatmap mengikuti kemunculan di data
+        "proc_order": pd.unique(df_clean['processor_category']).tolist(),
+        "gpu_order": pd.unique(df_clean['gpu_category']).tolist(),
+        "ram_counts": ram_counts[ram_counts > 0],
+        "storage_counts": storage_counts[storage_counts > 0],
+        "price_min": price_min,
+        "price_max": price_max,
+    }
+
 # Load data from Supabase
-df = load_data()
+DATA_WATERMARK = get_data_watermark()
+df = load_data(DATA_WATERMARK)
 
 # Check whether the data has been successfully loaded
 if df.empty:
     st.warning("Data is missing or failed to load. Check the logs above")
     st.stop()
 
-# --- Clean and validate the final price column (price_in_millions) ---
-# We don't need to process price_raw anymore, because this is clean data from ETL.
-    
-if 'price_in_millions' in df.columns:
-    # 1. Ensure that the value is numeric and not NaN.
-    df['price_in_millions'] = pd.to_numeric(df['price_in_millions'], errors='coerce')
-    df = df[df['price_in_millions'].notna()]
-    
-    # 2. Reasonable price filter (> 0 and < 150 million)
-    df = df[df['price_in_millions'] > 0]
-    df = df[df['price_in_millions'] < 150]  # Reasonable price filter (< 150 million)
-    
-    # 3. Remove duplicates dan sort
-    df = df.drop_duplicates(subset=['product_name', 'brand']).sort_values('price_in_millions')
-
-else:
+# Harga sudah dibersihkan & divalidasi di load_data (ter-cache per watermark)
+if 'price_in_millions' not in df.columns:
     st.error("Kolom price_in_millions tidak ditemukan dalam dataset")
     st.stop() # Stop execution if the main price column is missing
 
@@ -254,14 +443,15 @@ if not df.empty:
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("Total Products", len(df))
     col2.metric("Avg. Price (Rp)", f"{df['price_in_millions'].mean():,.2f}M")
-    col3.metric("Most Popular Brand", df['brand'].mode()[0])
-    col4.metric("Most Common RAM", df['ram'].mode()[0])
+    col3.metric("Most Popular Brand", most_common(df['brand'])[0])
+    col4.metric("Most Common RAM", most_common(df['ram'])[0])
 
     # Sidebar filters
     st.sidebar.header("📊 Filters")
 
     # Filter as before
-    all_brands = sorted(df['brand'].unique())
+    # Categories sudah unik dan terurut, tidak perlu unique() + sorted()
+    all_brands = df['brand'].cat.categories.tolist()
     selected_brands = st.sidebar.multiselect(
         "Select Brands:",
         options=all_brands,
@@ -278,72 +468,89 @@ if not df.empty:
         step=0.1
     )
 
-    processor_categories = ['All'] + sorted(df['processor_category'].unique().tolist())
+    processor_categories = ['All'] + df['processor_category'].cat.categories.tolist()
     selected_processor = st.sidebar.selectbox("Processor Category:", processor_categories)
 
-    gpu_categories = ['All'] + sorted(df['gpu_category'].unique().tolist())
+    gpu_categories = ['All'] + df['gpu_category'].cat.categories.tolist()
     selected_gpu = st.sidebar.selectbox("GPU Category:", gpu_categories)
 
-    # Apply filters
-    filtered_df = df.copy()  # Start from original df
+    # Apply filters (di-cache per kombinasi filter, lihat get_filtered)
+    # Kunci filter yang hashable (dipakai untuk semua cache turunan per kombinasi filter)
+    filter_key = (tuple(sorted(selected_brands)), tuple(price_range), selected_processor, selected_gpu)
+    filtered_df = get_filtered(df, DATA_WATERMARK, *filter_key)
 
-    # Brand filter
-    if selected_brands:
-        filtered_df = filtered_df[filtered_df['brand'].isin(selected_brands)]
-
-    # Price range filter
-    filtered_df = filtered_df[
-        (filtered_df['price_in_millions'] >= price_range[0]) & (filtered_df['price_in_millions'] <= price_range[1])
-    ]
+    # Ambil array harga sekali untuk KPI (mean) dan histogram,
+    # tanpa lewat mesin Series pandas berulang kali
+    price_arr = filtered_df['price_in_millions'].to_numpy(dtype=np.float64, copy=False)
 
-    # Ensure there are no NaN values in the price_in_millions column.
-    filtered_df = filtered_df[filtered_df['price_in_millions'].notnull()]
-
-    # Processor category filter
-    if selected_processor != 'All':
-        filtered_df = filtered_df[filtered_df['processor_category'] == selected_processor]
-
-    # GPU category filter
-    if selected_gpu != 'All':
-        filtered_df = filtered_df[filtered_df['gpu_category'] == selected_gpu]
+    # Agregasi groupby/value_counts untuk semua tab, sekali per kombinasi filter
+    aggregates = compute_aggregates(filtered_df, DATA_WATERMARK, filter_key)
     
     # Add Tab
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Price Analysis", "Specifications", "Distribution", "Product List", "What's New?"])
+    # st.tabs menjalankan semua isi tab di setiap rerun, jadi navigasi dibuat
+    # dengan radio dan hanya tab yang aktif yang dihitung & dirender
+    TABS = ["Price Analysis", "Specifications", "Distribution", "Product List", "What's New?"]
+    active_tab = st.radio(
+        "Section:",
+        TABS,
+        horizontal=True,
+        key='active_tab',
+        label_visibility='collapsed'
+    )
 
-    with tab1:
+    if active_tab == TABS[0]:
         st.subheader("📈 Laptop Price Distribution by Brand")
         if filtered_df.empty:
             st.warning("No data available for the selected filters.")
         else:
-            # Create a more visually appealing box plot
-            fig_price = px.box(
-                filtered_df,
-                x='brand',
-                y='price_in_millions',
-                color='brand',  # Color each brand differently
-                labels={'price_in_millions': 'Price (in Millions)', 'brand': 'Brand'},
-                points='outliers',
-                height=500,
-                width=1000  # Wider plot for better readability
-            )
-
-            # Customize the appearance
-            fig_price.update_traces(
-                marker=dict(size=4),  # Smaller outliers
-                line=dict(width=2)   # Thicker box lines
-            )
+            # Box plot dari statistik yang sudah diagregasi per brand:
+            # hanya q1/median/q3/fence (+ titik outlier) yang dikirim ke browser, bukan semua baris
+            price_by_brand = filtered_df.groupby('brand', observed=True, sort=False)['price_in_millions']
+            quartiles = price_by_brand.quantile([0.25, 0.5, 0.75]).unstack()
+            box_colors = px.colors.qualitative.Plotly
+
+            fig_price = go.Figure()
+            # Urutan brand mengikuti kemunculan di data (sama seperti px.box)
+            for i, (brand, prices) in enumerate(price_by_brand):
+                q1, median, q3 = quartiles.loc[brand]
+                lower_limit = q1 - 1.5 * (q3 - q1)
+                upper_limit = q3 + 1.5 * (q3 - q1)
+                values = prices.to_numpy()
+                is_outlier = (values < lower_limit) | (values > upper_limit)
+                inliers = values[~is_outlier]
+                color = box_colors[i % len(box_colors)]
+
+                fig_price.add_trace(go.Box(
+                    x=[brand], q1=[q1], median=[median], q3=[q3],
+                    lowerfence=[inliers.min()], upperfence=[inliers.max()],
+                    name=str(brand),
+                    marker=dict(color=color),
+                    line=dict(width=2)   # Thicker box lines
+                ))
+                if is_outlier.any():
+                    # Outlier digambar via WebGL (Scattergl), bukan SVG per titik
+                    fig_price.add_trace(go.Scattergl(
+                        x=[brand] * int(is_outlier.sum()),
+                        y=values[is_outlier],
+                        mode='markers',
+                        marker=dict(color=color, size=4),  # Smaller outliers
+                        name=str(brand),
+                        hovertemplate="Brand=%{x}<br>Price (in Millions)=%{y}<extra></extra>"
+                    ))
 
             # Update layout
             fig_price.update_layout(
                 showlegend=False,
-                xaxis=dict(tickangle=45),
+                height=500,
+                width=1000,  # Wider plot for better readability
+                xaxis=dict(title="Brand", tickangle=45),
                 yaxis=dict(
                     title="Price (in Millions)",
                     gridcolor='rgba(255, 255, 255, 0.2)',
                     zeroline=False,
                     range=[
-                        filtered_df['price_in_millions'].min() * 0.95,
-                        filtered_df['price_in_millions'].max() * 1.05
+                        aggregates['price_min'] * 0.95,
+                        aggregates['price_max'] * 1.05
                     ]
                 ),
                 plot_bgcolor='rgba(0, 0, 0, 0.8)',  # Dark background
@@ -366,68 +573,43 @@ if not df.empty:
                         [f'{bins[i]:.0f}-{bins[i+1]:.0f}Jt' for i in range(1, len(bins)-2)] + \
                         [f'> {bins[-2]:.0f}Jt']
 
-            # 2. Setup Visualization Style
-            plt.style.use('seaborn-v0_8-white') # Menggunakan style dasar yang bersih
-            fig, ax = plt.subplots(figsize=(14, 8), facecolor='#FAFAFA') # Background figure sedikit abu-abu sangat muda agar elegan
-            ax.set_facecolor('#FAFAFA') # Background axes sama
-
-            # Hitung histogram data (tanpa ditampilkan dulu)
-            n, bins, _ = ax.hist(filtered_df['price_in_millions'], bins=bins, alpha=0)
-
-            # 3. Pewarnaan Cerdas (Color Mapping by Height)
-            # Normalisasi data 'n' (jumlah) ke rentang 0-1 untuk colormap
-            norm = mcolors.Normalize(vmin=n.min(), vmax=n.max())
-            cmap = plt.cm.viridis # Pilihan warna: 'viridis', 'magma', 'cividis', 'coolwarm'
-            bar_colors = cmap(norm(n))
-
-            # 4. Plot Bar Chart
-            bin_centers = bins[:-1] + np.diff(bins)/2
-            # zorder=3 memastikan batang berada DI DEPAN garis grid
-            bars = ax.bar(bin_centers, n, width=bin_width*0.75, 
-                        color=bar_colors, edgecolor='white', linewidth=0.5, 
-                        alpha=0.95, zorder=3,
-                        # Menambahkan bayangan halus (opsional/simulasi via alpha)
-                        label='Laptop Count') 
-
-            # 5. Styling Grid & Spines (Garis Tepi)
-            ax.grid(axis='y', linestyle='--', alpha=0.4, color='gray', zorder=0) # Grid horizontal halus di belakang
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_visible(False) # Hilangkan garis kiri
-            ax.spines['bottom'].set_color('#444444')
-            ax.spines['bottom'].set_linewidth(1.2)
-
-            # Hilangkan tick marks di sumbu Y agar lebih bersih (karena sudah ada label angka di atas batang)
-            ax.tick_params(axis='y', length=0) 
-            ax.tick_params(axis='x', length=5, color='#444444')
-
-            # 6. Judul dan Label Axis
-            ax.set_title('Distribution of Laptop Prices', fontsize=20, fontweight='bold', color='#1A1A1A', pad=30)
-            ax.set_xlabel('Price Range (in Millions Rp)', fontsize=13, labelpad=15, color='#333333', fontweight='medium')
-            ax.set_ylabel('Number of Products', fontsize=13, labelpad=15, color='#333333', fontweight='medium')
-
-            # 7. Atur Label Sumbu X
-            ax.set_xticks(bin_centers)
-            ax.set_xticklabels(bin_labels, ha="center", fontsize=11, color='#333333')
-
-            # 8. Anotasi Angka di Atas Batang
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    ax.annotate(f'{int(height)}',
-                                xy=(bar.get_x() + bar.get_width() / 2, height),
-                                xytext=(0, 8),  # Jarak teks dari batang
-                                textcoords="offset points",
-                                ha='center', va='bottom', 
-                                fontsize=11, fontweight='bold', color='#2c3e50')
-
-            # 9. Tampilkan
-            plt.tight_layout(pad=3)
-            st.pyplot(fig)
+            # Hitung histogram langsung dengan NumPy (tanpa Figure Matplotlib)
+            n, bins = np.histogram(price_arr, bins=bins)
+
+            # 2. Plot Bar Chart dengan Plotly
+            # Plotly hanya mengirim trace JSON kecil ke browser, bukan PNG hasil render server
+            fig_hist = px.bar(
+                x=bin_labels,
+                y=n,
+                color=n,  # Pewarnaan berdasarkan tinggi batang
+                color_continuous_scale='Viridis',
+                text=[f'{int(v)}' if v > 0 else '' for v in n],  # Anotasi angka di atas batang
+                labels={'x': 'Price Range (in Millions Rp)', 'y': 'Number of Products'},
+                title='Distribution of Laptop Prices',
+                height=550
+            )
+            fig_hist.update_traces(
+                textposition='outside',
+                textfont=dict(size=12, color='#2c3e50'),
+                marker_line_color='white',
+                marker_line_width=0.5,
+                width=0.75,
+                hovertemplate="<b>Price Range:</b> %{x}<br><b>Count:</b> %{y}<extra></extra>"
+            )
+            fig_hist.update_layout(
+                coloraxis_showscale=False,
+                plot_bgcolor='#FAFAFA',
+                paper_bgcolor='#FAFAFA',
+                title=dict(font=dict(size=20, color='#1A1A1A')),
+                xaxis=dict(categoryorder='array', categoryarray=bin_labels),
+                yaxis=dict(gridcolor='rgba(128, 128, 128, 0.4)', griddash='dash'),
+                margin=dict(l=50, r=50, t=80, b=50)
+            )
+            st.plotly_chart(fig_hist, width='stretch')
 
             # Insight
             # Laptop Price Distribution by Brand
-            avg_price_by_brand = filtered_df.groupby('brand')['price_in_millions'].mean().sort_values(ascending=False)
+            avg_price_by_brand = aggregates['avg_price_by_brand']
             if not avg_price_by_brand.empty:
                 top_brand = avg_price_by_brand.index[0]
                 st.info(f"💡 Insight: {top_brand} has the highest average price.")
@@ -440,7 +622,7 @@ if not df.empty:
                 histogram_insight = f"The price range with the most products is **{most_common_range}**, containing {int(n[max_count_index])} different laptop models."
                 st.info(f"💡 Insight: {histogram_insight}")
 
-    with tab2:
+    elif active_tab == TABS[1]:
         st.subheader("💾 RAM & Storage Distribution")
         if filtered_df.empty:
             st.warning("No data available for the selected filters.")
@@ -448,89 +630,82 @@ if not df.empty:
             col1, col2 = st.columns(2)
 
             with col1:
-                # Filter 'Unknown RAM'
-                df_ram_filtered = filtered_df[filtered_df['ram'] != 'Unknown RAM'].copy()
-                
-                # Normalisasi: hapus spasi ekstra
-                df_ram_filtered['ram'] = df_ram_filtered['ram'].str.strip()
-
-                # Hitung value counts
-                ram_counts = df_ram_filtered['ram'].value_counts().reset_index()
-                ram_counts.columns = ['ram', 'count']
-
-                # Urutan berdasarkan count (descending)
-                ram_counts = ram_counts.sort_values('count', ascending=False)
+                # Value counts RAM (tanpa 'Unknown RAM') dari compute_aggregates
+                # value_counts sudah terurut berdasarkan count (descending)
+                ram_counts = aggregates['ram_counts'].rename_axis('ram').reset_index(name='count')
 
                 # Dapatkan urutan RAM berdasarkan count (descending) untuk mengunci plot
                 ram_order = ram_counts['ram'].tolist()
 
-                # Plot dengan Plotly
-                fig_ram = px.bar(
-                    ram_counts, # Gunakan DataFrame yang sudah dihitung dan diurutkan
-                    x='ram',
-                    y='count',
-                    title='RAM Distribution',
-                    labels={'ram': 'RAM', 'count': 'Count'},
-                    category_orders={'ram': ram_order} # Kunci urutan sesuai count
-                )
-                fig_ram.update_xaxes(tickangle=45)
-                # Tambahkan hover template
-                fig_ram.update_traces(
+                # Plot dengan go.Bar langsung: data sudah diagregasi, jadi tidak perlu
+                # pipeline DataFrame px.bar (bar chart statis, cukup tooltip)
+                fig_ram = go.Figure(go.Bar(
+                    x=ram_order,
+                    y=ram_counts['count'].tolist(),
+                    # Tambahkan hover template
                     hovertemplate="<b>RAM:</b> %{x}<br><b>Count:</b> %{y}<extra></extra>"
+                ))
+                fig_ram.update_layout(
+                    title='RAM Distribution',
+                    xaxis=dict(title='RAM', tickangle=45, type='category',
+                               categoryorder='array', categoryarray=ram_order),  # Kunci urutan sesuai count
+                    yaxis_title='Count'
                 )
                 st.plotly_chart(fig_ram, width='stretch')  
 
             with col2:
-                # Filter 'Unknown Storage'
-                df_storage_filtered = filtered_df[filtered_df['storage'] != 'Unknown Storage'].copy()
-                # Normalisasi: hapus spasi ekstra
-                df_storage_filtered['storage'] = df_storage_filtered['storage'].str.strip()
-
-                # Hitung value counts
-                storage_counts = df_storage_filtered['storage'].value_counts().reset_index()
-                storage_counts.columns = ['storage', 'count']
-
-                # Urutan berdasarkan count (descending)
-                storage_counts = storage_counts.sort_values('count', ascending=False)
+                # Value counts Storage (tanpa 'Unknown Storage') dari compute_aggregates
+                # value_counts sudah terurut berdasarkan count (descending)
+                storage_counts = aggregates['storage_counts'].rename_axis('storage').reset_index(name='count')
 
-                # Dapatkan urutan RAM berdasarkan count (descending) untuk mengunci plot
+                # Dapatkan urutan Storage berdasarkan count (descending) untuk mengunci plot
                 storage_order = storage_counts['storage'].tolist()
 
-                # Plot
-                fig_storage = px.bar(
-                    storage_counts,  # Gunakan DataFrame yang sudah dihitung
-                    x='storage',
-                    y='count',        # Tambahkan y='count' secara eksplisit
-                    title='Storage Distribution',
-                    labels={'storage': 'Storage', 'count': 'Count'},
-                    category_orders={'storage': storage_order}  # Kunci urutan
-                )
-                fig_storage.update_xaxes(tickangle=45)
-                # Tambahkan hover template
-                fig_storage.update_traces(
+                # Plot (go.Bar langsung dari hasil agregasi)
+                fig_storage = go.Figure(go.Bar(
+                    x=storage_order,
+                    y=storage_counts['count'].tolist(),
+                    # Tambahkan hover template
                     hovertemplate="<b>Storage:</b> %{x}<br><b>Count:</b> %{y}<extra></extra>"
+                ))
+                fig_storage.update_layout(
+                    title='Storage Distribution',
+                    xaxis=dict(title='Storage', tickangle=45, type='category',
+                               categoryorder='array', categoryarray=storage_order),  # Kunci urutan
+                    yaxis_title='Count'
                 )
                 st.plotly_chart(fig_storage, width='stretch') 
 
-    with tab3:
+    elif active_tab == TABS[2]:
         st.subheader("🔥 Processor vs GPU Category Distribution")
         if filtered_df.empty:
             st.warning("No data available for the selected filters.")
         else:
-            # Filter out rows where either processor_category or gpu_category is NaN
-            filtered_df_clean = filtered_df.dropna(subset=['processor_category', 'gpu_category'])
+            # Jumlah per pasangan (processor, gpu), baris NaN sudah dibuang di compute_aggregates
+            proc_gpu_counts = aggregates['proc_gpu_counts']
 
-            if filtered_df_clean.empty:
+            if proc_gpu_counts.empty:
                 st.warning("No data available for Processor vs GPU after removing missing values.")
             else:
-                # Create heatmap using px.density_heatmap (more robust)
-                fig_heatmap = px.density_heatmap(
-                    filtered_df_clean,
-                    x='gpu_category',
-                    y='processor_category',
-                    labels={'gpu_category': 'GPU Category', 'processor_category': 'Processor Category'},
-                    color_continuous_scale='Viridis',
-                    text_auto=True,
+                # Heatmap dari matriks jumlah yang sudah dipivot: browser hanya menerima
+                # grid hitungan, bukan semua baris mentah (urutan sumbu mengikuti kemunculan di data)
+                heatmap_counts = proc_gpu_counts.unstack(fill_value=0).reindex(
+                    index=aggregates['proc_order'],
+                    columns=aggregates['gpu_order'],
+                    fill_value=0
+                )
+                fig_heatmap = go.Figure(go.Heatmap(
+                    z=heatmap_counts.to_numpy(),
+                    x=heatmap_counts.columns.astype(str).tolist(),
+                    y=heatmap_counts.index.astype(str).tolist(),
+                    coloraxis='coloraxis',
+                    texttemplate='%{z}',
+                    hovertemplate="GPU Category=%{x}<br>Processor Category=%{y}<br>count=%{z}<extra></extra>"
+                ))
+                fig_heatmap.update_layout(
+                    coloraxis=dict(colorscale='Viridis', colorbar=dict(title='count')),
+                    xaxis_title='GPU Category',
+                    yaxis_title='Processor Category',
                     height=600,  # Tingkatkan tinggi agar lebih lega
                     width=1000   # Lebar tetap lebar
                 )
@@ -544,23 +719,29 @@ if not df.empty:
                 st.plotly_chart(fig_heatmap, width='stretch') 
 
                 # Insight
-                top_proc_gpu = filtered_df_clean.groupby(['processor_category', 'gpu_category']).size().idxmax()
+                top_proc_gpu = proc_gpu_counts.idxmax()
                 st.info(f"💡 Most common pairing: {top_proc_gpu[0]} + {top_proc_gpu[1]}")
 
                 # Optional: Add a bar chart of top processor-gpu combinations
                 st.subheader("📊 Top 10 Processor-GPU Combinations")
-                top_combos = filtered_df_clean.groupby(['processor_category', 'gpu_category']).size().reset_index(name='count').sort_values(by='count', ascending=False).head(10)
+                # nlargest sudah menghasilkan urutan count menurun; label dibuat sekali lewat
+                # assign + str.cat, lalu dibalik agar batang terbesar ada di atas (bar horizontal)
+                top_combos = proc_gpu_counts.nlargest(10).reset_index(name='count')
+                top_combos = top_combos.assign(
+                    label=top_combos['processor_category'].astype(str).str.cat(
+                        top_combos['gpu_category'].astype(str), sep=' + '
+                    )
+                ).iloc[::-1]
                 fig_combo = px.bar(
                     top_combos,
                     x='count',
-                    y=top_combos['processor_category'] + ' + ' + top_combos['gpu_category'],
+                    y='label',
                     orientation='h',
-                    labels={'y': 'Processor + GPU', 'x': 'Count'}
+                    labels={'label': 'Processor + GPU', 'count': 'Count'}
                 )
-                fig_combo.update_layout(yaxis={'categoryorder': 'total ascending'})
                 st.plotly_chart(fig_combo, width='stretch') 
 
-    with tab4:
+    elif active_tab == TABS[3]:
         st.subheader("📋 Detailed Product List")
         st.markdown("*Scroll horizontally to see all columns. Pagination is applied below.*")
 
@@ -570,7 +751,7 @@ if not df.empty:
             # --- LOGIKA PAGINATION ---
             total_rows = len(filtered_df)
             
-            # Pengaturan Baris per Halaman (Ditempatkan di dalam Tab 4)
+            # Pengaturan Baris per Halaman (hanya muncul saat Tab 4 aktif)
             st.sidebar.markdown("---")
             st.sidebar.subheader("Display Settings")
             rows_per_page = st.sidebar.number_input(
@@ -581,6 +762,11 @@ if not df.empty:
                 step=50,
                 key='rows_per_page'
             )
+            sort_option = st.sidebar.selectbox(
+                "Sort Products by:",
+                list(PRODUCT_SORT_OPTIONS),
+                key='product_sort'
+            )
 
             # Hitung jumlah halaman
             total_pages = int(np.ceil(total_rows / rows_per_page))
@@ -607,39 +793,35 @@ if not df.empty:
             start_row = (current_page - 1) * rows_per_page
             end_row = start_row + rows_per_page
 
-            # Dataframe yang ditampilkan hanya sebagian
-            display_df_raw = filtered_df.iloc[start_row:end_row].copy()
-            
+            # Sorting dikerjakan sekali di server pada frame terfilter (ter-cache),
+            # lalu hanya halaman aktif yang dikirim ke browser:
+            # pilih kolom dulu, lalu slice baris (tanpa .copy() tambahan)
+            # Harga tetap numerik (agar sorting tetap benar), format diterapkan saat render
+            product_list = get_product_list(filtered_df, DATA_WATERMARK, filter_key, sort_option)
+            display_df = product_list.iloc[start_row:end_row]
+
             with col_info:
-                st.info(f"Showing **{len(display_df_raw)}** of a total of **{total_rows}** filtered data rows (Page {current_page} of {total_pages}).")
-
-
-            # --- FORMATTING TAMPILAN DATAFRAME ---
-            display_df_raw['price'] = display_df_raw['price_in_millions'].apply(lambda x: f"{x:,.2f}M")
-
-            display_df = display_df_raw[[
-                'product_name', 'brand', 'series', 'processor_detail', 'gpu', 'ram', 
-                'storage', 'display', 'price'
-            ]].rename(columns={
-                'product_name': 'Product Name',
-                'brand': 'Brand',
-                'series': 'Series',
-                'processor_detail': 'Processor',
-                'gpu': 'GPU',
-                'ram': 'RAM',
-                'storage': 'Storage',
-                'display': 'Display',
-                'price': 'Price (Rp)'
-            })
+                st.info(f"Showing **{len(display_df)}** of a total of **{total_rows}** filtered data rows (Page {current_page} of {total_pages}).")
 
             # Tampilkan hanya data yang sudah dipaginasi
             st.dataframe(
                 display_df,
                 width='stretch',
-                height=400
+                height=400,
+                column_config={
+                    'Price (Rp)': st.column_config.NumberColumn(format="%.2fM")
+                }
             )
 
-    with tab5: # Jika di st.tabs Anda masih menggunakan `tab5`
+            # Export seluruh hasil filter (bukan hanya halaman aktif) sebagai CSV
+            st.download_button(
+                "⬇️ Download CSV",
+                data=get_product_list_csv(product_list, DATA_WATERMARK, filter_key, sort_option),
+                file_name="laptops_filtered.csv",
+                mime="text/csv"
+            )
+
+    elif active_tab == TABS[4]:
         st.subheader("✨ What's New Today?")
         # Panggil fungsi baru (mendapatkan ID dan Tanggal)
         LAST_RUN_ID, LAST_RUN_DATE = get_last_run_info()
@@ -677,13 +859,9 @@ if not df.empty:
                     columns={'product_name': 'Product Name', 'Harga Awal': 'Price'}
                 )
                 
-                # 2. Formatting harga
-                try:
-                    df_new_products['Price'] = df_new_products['Price'].apply(
-                        lambda x: f"Rp {x:,.0f}" if isinstance(x, (int, float)) else x
-                    )
-                except Exception as e:
-                    pass # Biarkan raw jika formatting gagal
+                # 2. Formatting harga (kolom sudah int dari prepare_changes_data,
+                # jadi cukup satu format string tanpa lambda + cek tipe per baris)
+                df_new_products['Price'] = df_new_products['Price'].map("Rp {:,.0f}".format)
 
                 st.success(f"Found **{len(df_new_products)}** new products.")
                 st.dataframe(
@@ -708,16 +886,9 @@ if not df.empty:
                 )
                 st.warning(f"Found **{len(df_price_updates)}** products with price changes.")
                 
-                # 2. Formatting harga
-                try:
-                    df_price_updates['Old Price'] = df_price_updates['Old Price'].apply(
-                        lambda x: f"Rp {x:,.0f}" if isinstance(x, (int, float)) else x
-                    )
-                    df_price_updates['New Price'] = df_price_updates['New Price'].apply(
-                        lambda x: f"Rp {x:,.0f}" if isinstance(x, (int, float)) else x
-                    )
-                except Exception as e:
-                    pass
+                # 2. Formatting harga (int dari prepare_changes_data)
+                for col in ['Old Price', 'New Price']:
+                    df_price_updates[col] = df_price_updates[col].map("Rp {:,.0f}".format)
 
                 # Tampilkan tabel
                 st.dataframe(
@@ -734,26 +905,28 @@ if not df.empty:
     st.subheader("📊 Summary Statistics")
     if not filtered_df.empty:
         col5, col6, col7 = st.columns(3)
+        top_ram, top_ram_count = most_common(filtered_df['ram'])
+        top_storage, top_storage_count = most_common(filtered_df['storage'])
 
         with col5:
             st.metric(
                 "Average Price",
-                f"Rp {filtered_df['price_in_millions'].mean():,.2f}M",
+                f"Rp {price_arr.mean():,.2f}M",
                 f"{len(filtered_df)} products"
             )
 
         with col6:
             st.metric(
                 "Most Common RAM",
-                filtered_df['ram'].mode().iloc[0] if not filtered_df.empty else "N/A",
-                f"{filtered_df['ram'].value_counts().iloc[0]} products" if not filtered_df.empty else "N/A"
+                top_ram,
+                f"{top_ram_count} products"
             )
 
         with col7:
             st.metric(
                 "Most Common Storage",
-                filtered_df['storage'].mode().iloc[0] if not filtered_df.empty else "N/A",
-                f"{filtered_df['storage'].value_counts().iloc[0]} products" if not filtered_df.empty else "N/A"
+                top_storage,
+                f"{top_storage_count} products"
             )
     else:
         st.warning("No data available for the selected filters.")
@@ -3,6 +3,8 @@ ETL with SCD Type 2 + Changes Log (production-ready)
 - Reads raw scraped SQLite DB (table: products_raw)
 - Runs feature extraction hooks (placeholder - reuse your existing functions or import them)
 - Computes product_hash (business key) in ETL
+    * product_hash is a BLAKE2b-128 hex digest (32 chars). Older runs stored SHA-256 (64 chars);
+      those rows are re-keyed once by migrate_product_hashes() before SCD2 comparison
 - Collapses raw into a snapshot (latest per product_hash)
 - Performs SCD Type 2 upsert logic:
     * If product_hash not in current -> insert new (is_active=1)
@@ -17,25 +19,35 @@ Configurable via parameters to run_etl(...)
 
 import os
 import re
+import functools
 import sqlite3
+import multiprocessing
+from pathlib import Path
 from datetime import datetime, timezone
 from typing import Tuple, Dict, Any
+import numpy as np
 import pandas as pd
 import hashlib
 import json
 
+try:
+    # orjson: C encoder, several times faster than json for the changes_log payloads
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
 from logger_setup import setup_logger
 from extractors import (
     get_brands,
-    extract_brand,
-    extract_series,
-    extract_processor,
-    standardize_processor,
-    extract_gpu,
-    standardize_gpu,
-    extract_ram,
-    extract_storage,
-    extract_display
+    extract_brands,
+    extract_specs,
+    SPEC_COLUMNS,
+    PROCESSOR_CATEGORIES,
+    GPU_CATEGORIES
 )
 
 logger = setup_logger("etl")
@@ -55,6 +67,32 @@ DEFAULTS = {
     "META_CHANGES_TABLE": "changes_log",
 }
 
+# Schema aliases of the history/meta DBs ATTACHed to the ETL connection (current DB is "main")
+HISTORY_SCHEMA = "hist"
+META_SCHEMA = "meta"
+
+# product_hash is a business key, not a security boundary: BLAKE2b-128 is much cheaper than SHA-256
+PRODUCT_HASH_DIGEST_SIZE = 16
+LEGACY_PRODUCT_HASH_LEN = 64  # hex length of SHA-256 keys written by older runs
+# Product-name normalization patterns, compiled once
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[^0-9a-zA-Z\s]')
+
+# Attributes compared between snapshot and current to detect a new SCD2 version
+TRACKED_COLS = [
+    'product_name', 'brand', 'series', 'processor_detail', 'processor_category',
+    'gpu', 'gpu_category', 'ram', 'storage', 'display', 'price_raw'
+]
+# Bit per tracked column for the dirty-column mask in scd2_apply
+TRACKED_COL_BITS = 1 << np.arange(len(TRACKED_COLS), dtype=np.int64)
+PRICE_BIT = int(TRACKED_COL_BITS[TRACKED_COLS.index('price_raw')])
+# Extracted feature columns, kept as category dtype in the snapshot: every extractor returns
+# one of a bounded set of canonical labels (a few hundred at most for processor_detail / gpu)
+CATEGORY_COLS = ['brand', 'series', 'processor_detail', 'processor_category', 'gpu', 'gpu_category',
+                 'ram', 'storage', 'display']
+# Below this many snapshot rows, process start-up costs more than parallel extraction saves
+PARALLEL_EXTRACT_MIN_ROWS = 2000
+
 # -------------------------
 # Utilities
 # -------------------------
@@ -69,12 +107,100 @@ def compute_product_hash(product_name: str) -> str:
     """
     if pd.isna(product_name):
         product_name = ""
-    s = str(product_name).lower().strip()
+    return _product_hash(str(product_name))
+
+@functools.lru_cache(maxsize=65536)
+def _product_hash(product_name: str) -> str:
+    """Cached core of compute_product_hash (NaN handled by the caller, so the key is always a str)."""
+    s = product_name.lower().strip()
     # collapse whitespace
-    s = re.sub(r'\s+', ' ', s)
+    s = _WS_RE.sub(' ', s)
     # optionally remove characters like quotes or repeated punctuation (but keep alnum & spaces)
-    s = re.sub(r'[^0-9a-zA-Z\s]', '', s)
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+    s = _PUNCT_RE.sub('', s)
+    return _digest(s)
+
+def _digest(s: str) -> str:
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=PRODUCT_HASH_DIGEST_SIZE).hexdigest()
+
+def compute_product_hash_series(product_names: pd.Series) -> pd.Series:
+    """
+    Vectorized version of compute_product_hash for a whole column.
+    Normalization runs once through pandas .str ops; blake2b runs once per distinct normalized name.
+    """
+    norm = (
+        product_names.fillna("").astype(str)
+        .str.lower()
+        .str.strip()
+        .str.replace(_WS_RE, ' ', regex=True)
+        .str.replace(_PUNCT_RE, '', regex=True)
+    )
+    # raw scrapes repeat names: hash the uniques, then broadcast back by code
+    codes, uniques = pd.factorize(norm)
+    hashes = np.array([_digest(s) for s in uniques], dtype=object)[codes]
+    return pd.Series(hashes, index=product_names.index, name='product_hash')
+
+def _norm_for_compare(col: pd.Series) -> pd.Series:
+    """Stripped string form of a column for change detection; missing values stay NaN."""
+    return col.astype(str).str.strip().where(col.notna())
+
+def compute_record_hash(df: pd.DataFrame) -> pd.Series:
+    """
+    Row fingerprint over TRACKED_COLS (BLAKE2b-128 hex), stored as record_hash.
+    Change detection becomes one string comparison per row instead of one per tracked column.
+    """
+    # \x00 marks a missing value so it never collides with an empty string
+    parts = [_norm_for_compare(df.reindex(columns=[col])[col]).fillna('\x00') for col in TRACKED_COLS]
+    joined = parts[0].str.cat(parts[1:], sep='\x1f')
+    hashes = [_digest(s) for s in joined.to_numpy(dtype=object)]
+    return pd.Series(hashes, index=df.index, name='record_hash')
+
+def _open_sqlite(db_path: str) -> sqlite3.Connection:
+    """
+    Read-write connection for the current/history/meta DBs (pragmas: see _set_write_pragmas).
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA temp_store=MEMORY")
+    _set_write_pragmas(conn, "main")
+    return conn
+
+def _set_write_pragmas(conn: sqlite3.Connection, schema: str) -> None:
+    # Rollback journal, bukan WAL: SQLite hanya membuat transaksi lintas file ATTACH atomik
+    # (lewat super-journal) di mode rollback; di WAL setiap file di-commit sendiri-sendiri.
+    # TRUNCATE juga mengembalikan file lama yang masih WAL. Satu commit per run, jadi fsync
+    # dari synchronous=FULL murah.
+    conn.execute(f"PRAGMA {schema}.journal_mode=TRUNCATE")
+    conn.execute(f"PRAGMA {schema}.synchronous=FULL")
+    conn.execute(f"PRAGMA {schema}.cache_size=-65536")      # 64 MB page cache
+    conn.execute(f"PRAGMA {schema}.mmap_size=268435456")    # 256 MB mmap
+
+def open_etl_connection(current_db: str, history_db: str, meta_db: str) -> sqlite3.Connection:
+    """
+    Single read-write connection for the whole SCD2 + meta step:
+    current DB is "main", history and meta are ATTACHed as HISTORY_SCHEMA / META_SCHEMA.
+    With the rollback journal set by _set_write_pragmas, the SCD2 write transaction in
+    scd2_apply commits current, history and changes_log atomically across the three files.
+    Steps that commit on their own before it (table DDL, migrate_product_hashes) are idempotent,
+    and record_run_meta attaches run_id in a later transaction to any changes_log rows still
+    without one, so a run interrupted between commits can simply be re-run.
+    """
+    conn = _open_sqlite(current_db)
+    for db_path, schema in ((history_db, HISTORY_SCHEMA), (meta_db, META_SCHEMA)):
+        conn.execute(f"ATTACH DATABASE ? AS {schema};", (db_path,))
+        _set_write_pragmas(conn, schema)
+    return conn
+
+def _open_sqlite_readonly(db_path: str) -> sqlite3.Connection:
+    """
+    Read-only connection for a single large scan (raw DB).
+    mode=ro skips write locking; larger page cache + mmap avoid repeated pread() syscalls.
+    """
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    conn.execute("PRAGMA cache_size=-65536")      # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")    # 256 MB mmap
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA query_only=1")
+    return conn
 
 def ensure_dirs(*paths):
     for p in paths:
@@ -85,6 +211,12 @@ def ensure_dirs(*paths):
 # -------------------------
 # Schema helpers: create tables if not exist
 # -------------------------
+def ensure_column(conn: sqlite3.Connection, table_name: str, column: str, decl: str, schema: str = "main") -> None:
+    """Add a column to a table created by an older version of this schema (no-op if present)."""
+    existing = {row[1] for row in conn.execute(f"PRAGMA {schema}.table_info({table_name});")}
+    if column not in existing:
+        conn.execute(f"ALTER TABLE {schema}.{table_name} ADD COLUMN {column} {decl};")
+
 def ensure_current_table(conn: sqlite3.Connection, table_name: str = DEFAULTS["CURRENT_TABLE"]) -> None:
     cur = conn.cursor()
     cur.execute(f"""
@@ -92,6 +224,7 @@ def ensure_current_table(conn: sqlite3.Connection, table_name: str = DEFAULTS["C
         product_id INTEGER PRIMARY KEY AUTOINCREMENT,
         raw_id INTEGER,
         product_hash TEXT,
+        record_hash TEXT,
         product_name TEXT,
         brand TEXT,
         series TEXT,
@@ -112,15 +245,46 @@ def ensure_current_table(conn: sqlite3.Connection, table_name: str = DEFAULTS["C
     """)
     # Indexes to speed lookups
     cur.execute(f"CREATE INDEX IF NOT EXISTS idx_{table_name}_hash ON {table_name}(product_hash);")
+    # Index untuk query dashboard: produk aktif per brand dan rentang harga
+    cur.execute(f"CREATE INDEX IF NOT EXISTS idx_{table_name}_active_brand_price ON {table_name}(is_active, brand, price_in_millions);")
+    # Index untuk scan baris aktif per product_hash (load current, rekonsiliasi duplikat)
+    cur.execute(f"CREATE INDEX IF NOT EXISTS idx_{table_name}_active_hash ON {table_name}(is_active, product_hash, valid_from DESC);")
+    ensure_column(conn, table_name, "record_hash", "TEXT")
     conn.commit()
 
-def ensure_history_table(conn: sqlite3.Connection, table_name: str = DEFAULTS["HISTORY_TABLE"]) -> None:
+def ensure_single_active_version(conn: sqlite3.Connection, closed_at: str,
+                                 table_name: str = DEFAULTS["CURRENT_TABLE"]) -> None:
+    """
+    Enforce at most one active row per product_hash with a partial UNIQUE index.
+    Duplicates left by older runs are closed first (keep the latest valid_from), otherwise the index can't be built.
+    """
+    # One statement: rank active rows per product_hash (latest valid_from first), close all but rank 1
+    with conn:
+        closed = conn.execute(f"""
+            UPDATE {table_name}
+            SET is_active = 0, valid_to = ?
+            WHERE product_id IN (
+                SELECT product_id FROM (
+                    SELECT product_id,
+                           ROW_NUMBER() OVER (PARTITION BY product_hash ORDER BY valid_from DESC, product_id DESC) AS rn
+                    FROM {table_name}
+                    WHERE is_active = 1
+                ) WHERE rn > 1
+            );
+        """, (closed_at,)).rowcount
+        conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS uniq_{table_name}_active_hash ON {table_name}(product_hash) WHERE is_active = 1;")
+    if closed > 0:
+        logger.warning(f"Closed {closed} extra active rows sharing a product_hash.")
+
+def ensure_history_table(conn: sqlite3.Connection, table_name: str = DEFAULTS["HISTORY_TABLE"],
+                         schema: str = "main") -> None:
     cur = conn.cursor()
     cur.execute(f"""
-    CREATE TABLE IF NOT EXISTS {table_name} (
+    CREATE TABLE IF NOT EXISTS {schema}.{table_name} (
         history_id INTEGER PRIMARY KEY AUTOINCREMENT,
         raw_id INTEGER,
         product_hash TEXT,
+        record_hash TEXT,
         product_name TEXT,
         brand TEXT,
         series TEXT,
@@ -139,15 +303,19 @@ def ensure_history_table(conn: sqlite3.Connection, table_name: str = DEFAULTS["H
         is_active INTEGER DEFAULT 0
     );
     """)
-    cur.execute(f"CREATE INDEX IF NOT EXISTS idx_{table_name}_hash ON {table_name}(product_hash);")
+    cur.execute(f"CREATE INDEX IF NOT EXISTS {schema}.idx_{table_name}_hash_valid_to ON {table_name}(product_hash, valid_to);")
+    # product_hash-only index is a prefix of the one above
+    cur.execute(f"DROP INDEX IF EXISTS {schema}.idx_{table_name}_hash;")
+    ensure_column(conn, table_name, "record_hash", "TEXT", schema)
     conn.commit()
 
 def ensure_meta_tables(conn: sqlite3.Connection,
                        runs_table: str = DEFAULTS["META_RUNS_TABLE"],
-                       changes_table: str = DEFAULTS["META_CHANGES_TABLE"]) -> None:
+                       changes_table: str = DEFAULTS["META_CHANGES_TABLE"],
+                       schema: str = "main") -> None:
     cur = conn.cursor()
     cur.execute(f"""
-    CREATE TABLE IF NOT EXISTS {runs_table} (
+    CREATE TABLE IF NOT EXISTS {schema}.{runs_table} (
         run_id INTEGER PRIMARY KEY AUTOINCREMENT,
         run_at TEXT,
         input_db TEXT,
@@ -156,7 +324,7 @@ def ensure_meta_tables(conn: sqlite3.Connection,
     );
     """)
     cur.execute(f"""
-    CREATE TABLE IF NOT EXISTS {changes_table} (
+    CREATE TABLE IF NOT EXISTS {schema}.{changes_table} (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         run_id INTEGER,
         product_hash TEXT,
@@ -167,39 +335,94 @@ def ensure_meta_tables(conn: sqlite3.Connection,
     """)
     conn.commit()
 
+def migrate_product_hashes(conn: sqlite3.Connection, table_name: str) -> int:
+    """
+    One-shot cut-over from SHA-256 to BLAKE2b product_hash.
+    Rows still carrying a legacy 64-char key are re-keyed from their product_name,
+    so existing products keep matching the snapshot instead of showing up as discontinued + new.
+    Returns the number of rows re-keyed (0 once the table is migrated).
+    """
+    legacy = pd.read_sql_query(
+        f"SELECT rowid AS rid, product_name FROM {table_name} WHERE length(product_hash) = ?;",
+        conn, params=(LEGACY_PRODUCT_HASH_LEN,)
+    )
+    if legacy.empty:
+        return 0
+    new_hashes = compute_product_hash_series(legacy['product_name'])
+    conn.executemany(
+        f"UPDATE {table_name} SET product_hash = ? WHERE rowid = ?;",
+        zip(new_hashes.tolist(), legacy['rid'].tolist())
+    )
+    conn.commit()
+    logger.info(f"🔑 Re-keyed {len(legacy)} legacy SHA-256 product_hash rows in {table_name} to BLAKE2b.")
+    return len(legacy)
+
+# -------------------------
+# Feature extraction
+# -------------------------
+def extract_spec_features(names, specs=extract_specs) -> list:
+    """
+    Spec tuples (ordered like SPEC_COLUMNS) for a chunk of product names.
+    Top-level so it can be pickled into multiprocessing workers.
+    """
+    # specs terikat sebagai default arg: lookup lokal, bukan global, di setiap iterasi
+    return [specs(name) for name in names]
+
+def extract_features_parallel(names: np.ndarray) -> list:
+    """
+    Split product names into one chunk per CPU and extract specs in a process pool.
+    Small snapshots (or single-core hosts) run inline in the current process.
+    """
+    n_workers = os.cpu_count() or 1
+    if n_workers == 1 or len(names) < PARALLEL_EXTRACT_MIN_ROWS:
+        return extract_spec_features(names)
+
+    chunks = np.array_split(names, n_workers)
+    # fork: worker mewarisi tabel regex/automaton yang sudah dikompilasi saat import (spawn dan
+    # forkserver, default Linux sejak Python 3.14, akan mengimpor ulang extractors di tiap worker)
+    start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+    context = multiprocessing.get_context(start_method)
+    with context.Pool(n_workers) as pool:
+        results = pool.map(extract_spec_features, chunks)
+        # close + join (bukan terminate saat keluar dari with): worker keluar normal dan
+        # mengosongkan antrian log-nya ke listener di proses utama
+        pool.close()
+        pool.join()
+    # array_split keeps order, so concatenating the chunks lines up with the input rows
+    return [row for chunk_rows in results for row in chunk_rows]
+
 # -------------------------
 # Core ETL logic
 # -------------------------
 def load_raw_as_df(raw_db_path: str, raw_table: str = DEFAULTS["RAW_TABLE"]) -> pd.DataFrame:
     """
-    Load raw scraped table into DataFrame.
+    Load raw scraped table into DataFrame (only the columns below are selected).
     Expected columns: raw_id (or id), product_name, price_raw, scraped_at (timestamp)
     If scraped_at missing, set to now.
     """
-    conn = sqlite3.connect(raw_db_path)
+    conn = _open_sqlite_readonly(raw_db_path)
     try:
-        df = pd.read_sql_query(f"SELECT * FROM {raw_table};", conn)
+        # Only the four needed columns are pulled from SQLite (aliases resolved in SQL, not in pandas)
+        cols = {row[1].lower(): row[1] for row in conn.execute(f"PRAGMA table_info({raw_table});")}
+        # product_name / price_raw expected - otherwise raise
+        if 'product_name' not in cols or 'price_raw' not in cols:
+            raise ValueError("Raw table must include 'product_name' and 'price_raw' columns")
+        # rename common aliases
+        raw_id_col = cols.get('raw_id') or cols.get('id') or 'rowid'
+        # If scraped_at missing, set to now
+        scraped_at_col = cols.get('scraped_at') or '?'
+        params = () if 'scraped_at' in cols else (now_iso(),)
+        df = pd.read_sql_query(
+            f"SELECT {raw_id_col} AS raw_id, {cols['product_name']} AS product_name, "
+            f"{cols['price_raw']} AS price_raw, {scraped_at_col} AS scraped_at FROM {raw_table};",
+            conn, params=params
+        )
     except Exception as e:
         logger.exception("Failed to read raw table. Check table name and DB content.")
         conn.close()
         raise
     conn.close()
 
-    # Normalize column names
-    cols = {c.lower(): c for c in df.columns}
-    # rename common aliases
-    rename_map = {}
-    if 'id' in cols and 'raw_id' not in cols:
-        rename_map[cols['id']] = 'raw_id'
-    if 'scraped_at' not in df.columns:
-        df['scraped_at'] = now_iso()
-    # product_name / price_raw expected - otherwise raise
-    if 'product_name' not in df.columns or 'price_raw' not in df.columns:
-        raise ValueError("Raw table must include 'product_name' and 'price_raw' columns")
-
-    # keep relevant columns
-    df = df.rename(columns=rename_map)
-    df = df[['raw_id', 'product_name', 'price_raw', 'scraped_at']].copy()
     # ensure types
     df['scraped_at'] = pd.to_datetime(df['scraped_at'], errors='coerce').fillna(pd.Timestamp(now_iso()))
     df['price_raw'] = pd.to_numeric(df['price_raw'], errors='coerce').fillna(0).astype(int)
@@ -212,10 +435,12 @@ def prepare_snapshot(df_raw: pd.DataFrame) -> pd.DataFrame:
     From raw DataFrame produce snapshot: the latest record for each product_hash.
     Adds product_hash & price_in_millions & processed_at.
     Also collapses duplicates by computing latest scraped_at.
+    If df_raw already carries product_hash (computed in run_etl), it is reused.
     """
     df = df_raw.copy()
     # compute product_hash in ETL (business key)
-    df['product_hash'] = df['product_name'].apply(compute_product_hash)
+    if 'product_hash' not in df.columns:
+        df['product_hash'] = compute_product_hash_series(df['product_name'])
     # set processed_at
     processed = now_iso()
     df['processed_at'] = processed
@@ -223,21 +448,66 @@ def prepare_snapshot(df_raw: pd.DataFrame) -> pd.DataFrame:
     # sort by scraped_at descending so latest come first
     df = df.sort_values(['product_hash', 'scraped_at'], ascending=[True, False])
 
-    # collapse: keep first (latest) per product_hash
-    df_snapshot = df.groupby('product_hash', as_index=False).first()
+    # collapse: keep first (latest) row per product_hash - already sorted, so one drop_duplicates pass
+    df_snapshot = df.drop_duplicates(subset='product_hash', keep='first')
 
     # remove obviously empty names
     df_snapshot = df_snapshot[df_snapshot['product_name'].str.strip() != ""].reset_index(drop=True)
 
     return df_snapshot
 
+# Column order of rows built by _current_rows (everything except the autoincrement product_id)
+CURRENT_INSERT_COLS = [
+    'raw_id', 'product_hash', 'record_hash', 'product_name', 'brand', 'series', 'processor_detail', 'processor_category',
+    'gpu', 'gpu_category', 'ram', 'storage', 'display', 'price_raw', 'price_in_millions', 'processed_at',
+    'valid_from', 'valid_to', 'is_active'
+]
+# UPSERT against the partial unique index: if an active version is still there,
+# it is overwritten in place instead of leaving two active rows
+CURRENT_INSERT_SQL = (
+    f"INSERT INTO {DEFAULTS['CURRENT_TABLE']} ({','.join(CURRENT_INSERT_COLS)}) "
+    f"VALUES ({','.join(['?'] * len(CURRENT_INSERT_COLS))}) "
+    f"ON CONFLICT(product_hash) WHERE is_active = 1 DO UPDATE SET "
+    + ", ".join(f"{col} = excluded.{col}" for col in CURRENT_INSERT_COLS if col != 'product_hash')
+    + ";"
+)
+CLOSE_ACTIVE_SQL = f"UPDATE {DEFAULTS['CURRENT_TABLE']} SET valid_to = ?, is_active = 0 WHERE product_hash = ? AND is_active = 1;"
+REFRESH_RECORD_HASH_SQL = f"UPDATE {DEFAULTS['CURRENT_TABLE']} SET record_hash = ? WHERE product_hash = ? AND is_active = 1;"
+CHANGES_INSERT_SQL = (
+    f"INSERT INTO {META_SCHEMA}.{DEFAULTS['META_CHANGES_TABLE']} "
+    f"(run_id, product_hash, change_type, details_json, changed_at) VALUES (?, ?, ?, ?, ?);"
+)
+
+def _py(value: Any) -> Any:
+    """NumPy scalar -> plain Python value (sqlite3 / json friendly); missing -> None."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
+
+def _column_changed(new: pd.Series, old: pd.Series) -> pd.Series:
+    """Elementwise 'value differs' after normalization; missing on both sides counts as equal."""
+    new_norm, old_norm = _norm_for_compare(new), _norm_for_compare(old)
+    return new_norm.ne(old_norm) & ~(new_norm.isna() & old_norm.isna())
+
+def _current_rows(rows: pd.DataFrame, run_at: str) -> list:
+    """New active products_current rows (tuples ordered like CURRENT_INSERT_COLS) from snapshot rows."""
+    rows = rows.reindex(columns=CURRENT_INSERT_COLS).assign(valid_from=run_at, valid_to=None, is_active=1)
+    return [tuple(_py(v) for v in row) for row in rows.itertuples(index=False, name=None)]
+
+def _history_rows(rows: pd.DataFrame, valid_to: str) -> Tuple[list, list]:
+    """
+    Archival products_history rows: copies of closed current rows (indexed by product_hash) with valid_to set.
+    Returns (columns, row tuples) ready for executemany.
+    """
+    # remove product_id to avoid conflicts
+    rows = rows.drop(columns=['product_id'], errors='ignore').reset_index().assign(valid_to=valid_to, is_active=0)
+    return list(rows.columns), [tuple(_py(v) for v in row) for row in rows.itertuples(index=False, name=None)]
+
 def scd2_apply(snapshot: pd.DataFrame,
-               current_db: str,
-               history_db: str,
-               meta_db: str,
+               conn: sqlite3.Connection,
                run_at: str) -> Dict[str, int]:
     """
-    Apply SCD2 logic:
+    Apply SCD2 logic on a connection from open_etl_connection():
      - load current table
      - compare by product_hash
      - detect new products / price updates / attribute updates / discontinued
@@ -246,242 +516,159 @@ def scd2_apply(snapshot: pd.DataFrame,
     """
     stats = {"new_products": 0, "price_updates": 0, "attribute_updates": 0, "discontinued": 0, "unchanged": 0, "duplicates_in_raw": 0}
 
-    # ensure directories exist
-    ensure_dirs(current_db, history_db, meta_db)
+    history_table = f"{HISTORY_SCHEMA}.{DEFAULTS['HISTORY_TABLE']}"
 
     # load current
-    conn_cur = sqlite3.connect(current_db)
-    ensure_current_table(conn_cur)
-    cur = conn_cur.cursor()
+    ensure_current_table(conn)
+    migrate_product_hashes(conn, DEFAULTS['CURRENT_TABLE'])
+    ensure_single_active_version(conn, run_at)
 
     try:
-        current_df = pd.read_sql_query(f"SELECT * FROM {DEFAULTS['CURRENT_TABLE']} WHERE is_active=1;", conn_cur)
+        current_df = pd.read_sql_query(f"SELECT * FROM {DEFAULTS['CURRENT_TABLE']} WHERE is_active=1;", conn)
     except Exception:
         # empty if table exists but no rows
         current_df = pd.DataFrame(columns=[
-            'product_id','raw_id','product_hash','product_name','brand','series','processor_detail','processor_category',
+            'product_id','raw_id','product_hash','record_hash','product_name','brand','series','processor_detail','processor_category',
             'gpu','gpu_category','ram','storage','display','price_raw','price_in_millions','processed_at','valid_from','valid_to','is_active'
         ])
-    # map current by product_hash
-    current_map = {}
-    if not current_df.empty:
-        # normalize index by product_hash
-        current_df['product_hash'] = current_df['product_hash'].astype(str)
-        current_map = current_df.set_index('product_hash').to_dict('index')
+    # index current by product_hash (hash-based lookups, no per-row dicts);
+    # unique because the partial index allows one active row per product_hash
+    current_df['product_hash'] = current_df['product_hash'].astype(str)
+    current_df = current_df.set_index('product_hash')
+    # rows written before record_hash existed: fingerprint them from their stored columns first,
+    # so the upgrade run only compares column by column where the hashes really differ
+    missing_hash = current_df['record_hash'].isna()
+    backfilled = compute_record_hash(current_df.loc[missing_hash])
+    current_df.loc[missing_hash, 'record_hash'] = backfilled
+    record_hash_updates = list(zip(backfilled.tolist(), backfilled.index.tolist()))
 
     # prepare history DB
-    conn_hist = sqlite3.connect(history_db)
-    ensure_history_table(conn_hist)
+    ensure_history_table(conn, schema=HISTORY_SCHEMA)
+    migrate_product_hashes(conn, history_table)
 
     # prepare meta DB
-    conn_meta = sqlite3.connect(meta_db)
-    ensure_meta_tables(conn_meta)
-    meta_cur = conn_meta.cursor()
+    ensure_meta_tables(conn, schema=META_SCHEMA)
 
-    # Build a set of product_hash in snapshot and current
-    snapshot_hashes = set(snapshot['product_hash'].tolist())
-    current_hashes = set(current_map.keys())
+    # Semua perubahan dikumpulkan dulu, lalu ditulis dengan executemany dalam
+    # satu transaksi untuk ketiga DB (satu commit, bukan per baris)
+    closed_hashes = []       # product_hash whose active row gets closed (valid_to) and archived
+    current_inserts = []     # new active rows for current
+    meta_inserts = []        # changes_log rows: (product_hash, change_type, details), serialized at write time
 
     # --- Detect discontinued: those in current but not in snapshot ---
-    discontinued_hashes = current_hashes.difference(snapshot_hashes)
-    for ph in discontinued_hashes:
-        row = current_map[ph]
-        # update current row: set valid_to, is_active=0
-        valid_to = run_at
-        try:
-            cur.execute(f"""
-                UPDATE {DEFAULTS['CURRENT_TABLE']}
-                SET valid_to = ?, is_active = 0
-                WHERE product_hash = ? AND is_active = 1;
-            """, (valid_to, ph))
-            conn_cur.commit()
-            stats['discontinued'] += 1
-            # also insert into history for archival (copy row with valid_to)
-            history_row = dict(row)
-            history_row['product_hash'] = ph
-            history_row['valid_to'] = valid_to
-            history_row['is_active'] = 0
-            # remove product_id to avoid conflicts
-            history_row.pop('product_id', None)
-            # insert into history table
-            cols = ",".join(history_row.keys())
-            placeholders = ",".join(["?"]*len(history_row))
-            conn_hist.execute(f"INSERT INTO {DEFAULTS['HISTORY_TABLE']} ({cols}) VALUES ({placeholders})",
-                              tuple(history_row.values()))
-            conn_hist.commit()
-
-            # meta log
-            meta_cur.execute(f"INSERT INTO {DEFAULTS['META_CHANGES_TABLE']} (run_id, product_hash, change_type, details_json, changed_at) VALUES (?, ?, ?, ?, ?)",
-                             (None, ph, 'discontinued', json.dumps({'note': 'no longer present in latest snapshot'}), run_at))
-            conn_meta.commit()
-        except Exception:
-            logger.exception(f"Failed to mark discontinued product: {ph}")
-
-    # --- Upsert logic: iterate snapshot rows ---
-    # We'll decide change_type by comparing a subset of tracked attributes:
-    tracked_cols = ['product_name','brand','series','processor_detail','processor_category','gpu','gpu_category','ram','storage','display','price_raw']
-    for _, srow in snapshot.iterrows():
-        ph = srow['product_hash']
-        # if not in current -> new product
-        if ph not in current_map:
-            # insert into current
-            insert_row = {
-                'raw_id': int(srow.get('raw_id')) if not pd.isna(srow.get('raw_id')) else None,
-                'product_hash': ph,
-                'product_name': srow.get('product_name'),
-                'brand': srow.get('brand') if 'brand' in srow else None,
-                'series': srow.get('series') if 'series' in srow else None,
-                'processor_detail': srow.get('processor_detail') if 'processor_detail' in srow else None,
-                'processor_category': srow.get('processor_category') if 'processor_category' in srow else None,
-                'gpu': srow.get('gpu') if 'gpu' in srow else None,
-                'gpu_category': srow.get('gpu_category') if 'gpu_category' in srow else None,
-                'ram': srow.get('ram') if 'ram' in srow else None,
-                'storage': srow.get('storage') if 'storage' in srow else None,
-                'display': srow.get('display') if 'display' in srow else None,
-                'price_raw': int(srow.get('price_raw')) if not pd.isna(srow.get('price_raw')) else None,
-                'price_in_millions': float(srow.get('price_in_millions')) if not pd.isna(srow.get('price_in_millions')) else None,
-                'processed_at': srow.get('processed_at'),
-                'valid_from': run_at,
-                'valid_to': None,
-                'is_active': 1
-            }
-            cols = ",".join(insert_row.keys())
-            placeholders = ",".join(["?"]*len(insert_row))
-            cur_vals = tuple(insert_row.values())
-            cur.execute(f"INSERT INTO {DEFAULTS['CURRENT_TABLE']} ({cols}) VALUES ({placeholders});", cur_vals)
-            conn_cur.commit()
-            stats['new_products'] += 1
-
-            # meta log
-            meta_cur.execute(f"INSERT INTO {DEFAULTS['META_CHANGES_TABLE']} (run_id, product_hash, change_type, details_json, changed_at) VALUES (?, ?, ?, ?, ?)",
-                             (None, ph, 'new', json.dumps({'price_raw': insert_row['price_raw']}), run_at))
-            conn_meta.commit()
-
-        else:
-            # exists in current active row: compare tracked attributes
-            cur_row = current_map[ph]
-            # comparison: for price change or any tracked attribute difference
-            changed = {}
-            for col in tracked_cols:
-                sval = srow.get(col) if col in srow else None
-                crow = cur_row.get(col)
-                # normalize types for comparison
-                sval_norm = None if pd.isna(sval) else str(sval).strip()
-                crow_norm = None if crow is None else str(crow).strip()
-                if sval_norm != crow_norm:
-                    changed[col] = {'old': crow, 'new': sval}
-            if not changed:
-                stats['unchanged'] += 1
-                # nothing to do
-            else:
-                # Close previous active record (set valid_to and is_active=0)
-                try:
-                    cur.execute(f"""
-                        UPDATE {DEFAULTS['CURRENT_TABLE']}
-                        SET valid_to = ?, is_active = 0
-                        WHERE product_hash = ? AND is_active = 1;
-                    """, (run_at, ph))
-                    conn_cur.commit()
-                except Exception:
-                    logger.exception(f"Failed to close previous active row for {ph}")
-
-                # Insert new current record with new attributes
-                insert_row = {
-                    'raw_id': int(srow.get('raw_id')) if not pd.isna(srow.get('raw_id')) else None,
-                    'product_hash': ph,
-                    'product_name': srow.get('product_name'),
-                    'brand': srow.get('brand') if 'brand' in srow else None,
-                    'series': srow.get('series') if 'series' in srow else None,
-                    'processor_detail': srow.get('processor_detail') if 'processor_detail' in srow else None,
-                    'processor_category': srow.get('processor_category') if 'processor_category' in srow else None,
-                    'gpu': srow.get('gpu') if 'gpu' in srow else None,
-                    'gpu_category': srow.get('gpu_category') if 'gpu_category' in srow else None,
-                    'ram': srow.get('ram') if 'ram' in srow else None,
-                    'storage': srow.get('storage') if 'storage' in srow else None,
-                    'display': srow.get('display') if 'display' in srow else None,
-                    'price_raw': int(srow.get('price_raw')) if not pd.isna(srow.get('price_raw')) else None,
-                    'price_in_millions': float(srow.get('price_in_millions')) if not pd.isna(srow.get('price_in_millions')) else None,
-                    'processed_at': srow.get('processed_at'),
-                    'valid_from': run_at,
-                    'valid_to': None,
-                    'is_active': 1
-                }
-                cols = ",".join(insert_row.keys())
-                placeholders = ",".join(["?"]*len(insert_row))
-                conn_cur.execute(f"INSERT INTO {DEFAULTS['CURRENT_TABLE']} ({cols}) VALUES ({placeholders});", tuple(insert_row.values()))
-                conn_cur.commit()
-
-                # Also copy previous version into history with its valid_to (if not already copied)
-                # We can copy by selecting from current history prior to update — but to keep simple, insert an archival row:
-                history_row = dict(cur_row)
-                history_row['product_hash'] = ph
-                history_row.pop('product_id', None)
-                history_row['valid_to'] = run_at
-                history_row['is_active'] = 0
-                cols_h = ",".join(history_row.keys())
-                placeholders_h = ",".join(["?"]*len(history_row))
-                conn_hist.execute(f"INSERT INTO {DEFAULTS['HISTORY_TABLE']} ({cols_h}) VALUES ({placeholders_h});", tuple(history_row.values()))
-                conn_hist.commit()
-
-                # classify change
-                if 'price_raw' in changed and len(changed) == 1:
-                    stats['price_updates'] += 1
-                    change_type = 'price_update'
-                else:
-                    stats['attribute_updates'] += 1
-                    change_type = 'attribute_update'
-
-                # meta log
-                meta_cur.execute(f"INSERT INTO {DEFAULTS['META_CHANGES_TABLE']} (run_id, product_hash, change_type, details_json, changed_at) VALUES (?, ?, ?, ?, ?)",
-                                 (None, ph, change_type, json.dumps(changed), run_at))
-                conn_meta.commit()
-
-    # ----- finalize: ensure only one active row per product_hash -----
-    # (This is a safeguard: in case duplicates exist, close extra ones by keeping the latest valid_from)
-    try:
-        # For each product_hash find active rows count >1 and keep latest
-        active_duplicates = pd.read_sql_query(
-            f"SELECT product_hash, COUNT(*) as cnt FROM {DEFAULTS['CURRENT_TABLE']} WHERE is_active=1 GROUP BY product_hash HAVING cnt > 1;",
-            conn_cur
+    discontinued_hashes = current_df.index[~current_df.index.isin(snapshot['product_hash'])].tolist()
+    closed_hashes.extend(discontinued_hashes)
+    stats['discontinued'] += len(discontinued_hashes)
+    note = {'note': 'no longer present in latest snapshot'}
+    meta_inserts.extend((ph, 'discontinued', note) for ph in discontinued_hashes)
+
+    # --- Upsert logic: classify snapshot rows with one merge against current ---
+    # We'll decide change_type by comparing a subset of tracked attributes (TRACKED_COLS)
+    if 'record_hash' not in snapshot.columns:
+        snapshot = snapshot.assign(record_hash=compute_record_hash(snapshot))
+    snap = snapshot.reindex(columns=list(dict.fromkeys(
+        ['product_hash', 'record_hash', 'raw_id', 'price_in_millions', 'processed_at'] + TRACKED_COLS
+    )))
+    joined = snap.merge(
+        current_df.reindex(columns=['record_hash'] + TRACKED_COLS).reset_index(),
+        on='product_hash', how='left', suffixes=('', '_old'), indicator=True
+    )
+    # the left merge fills new products with NaN (as does a NULL in current), which turns
+    # integer columns like price_raw into float64: '8500000.0' != '8500000' would flag every
+    # unchanged price. Nullable Int64 keeps the integer text form and NA for missing values.
+    for col in TRACKED_COLS:
+        if pd.api.types.is_integer_dtype(snap[col].dtype):
+            old = pd.to_numeric(joined[f'{col}_old'], errors='coerce')
+            if (old.dropna() % 1 == 0).all():
+                joined[f'{col}_old'] = old.astype('Int64')
+    in_current = (joined['_merge'] == 'both').to_numpy()
+    new_mask = ~in_current
+    # record_hash equal -> unchanged; only the rest needs a column-by-column look
+    candidate_mask = in_current & joined['record_hash'].ne(joined['record_hash_old']).to_numpy()
+    candidates = joined.loc[candidate_mask]
+    diff = pd.DataFrame(
+        {col: _column_changed(candidates[col], candidates[f'{col}_old']) for col in TRACKED_COLS},
+        index=candidates.index
+    )
+    # bitmask of dirty columns per row (bit i = TRACKED_COLS[i] changed)
+    dirty = np.zeros(len(joined), dtype=np.int64)
+    dirty[candidate_mask] = diff.to_numpy(dtype=np.int64) @ TRACKED_COL_BITS
+    changed_mask = dirty != 0
+    stats['new_products'] += int(new_mask.sum())
+    stats['unchanged'] += int((in_current & ~changed_mask).sum())
+
+    # same attributes but stale/missing record_hash: just refresh the stored fingerprint
+    refresh = joined.loc[candidate_mask & ~changed_mask, ['record_hash', 'product_hash']]
+    record_hash_updates.extend(refresh.itertuples(index=False, name=None))
+
+    # if not in current -> new product
+    new_rows = _current_rows(joined.loc[new_mask], run_at)
+    current_inserts.extend(new_rows)
+    hash_idx, price_idx = CURRENT_INSERT_COLS.index('product_hash'), CURRENT_INSERT_COLS.index('price_raw')
+    for row in new_rows:
+        # meta log
+        meta_inserts.append((row[hash_idx], 'new', {'price_raw': row[price_idx]}))
+
+    # exists in current but tracked attributes changed -> close previous, insert new version
+    changed_rows = joined.loc[changed_mask]
+    current_inserts.extend(_current_rows(changed_rows, run_at))
+    # classify change: price-only when the dirty mask is exactly the price_raw bit
+    changed_dirty = dirty[changed_mask]
+    price_only = changed_dirty == PRICE_BIT
+    stats['price_updates'] += int(price_only.sum())
+    stats['attribute_updates'] += int((~price_only).sum())
+    # Close previous active record (set valid_to and is_active=0), archived below
+    closed_hashes.extend(changed_rows['product_hash'].tolist())
+    # column-level details only for the (small) changed subset
+    for i, ph, mask, is_price in zip(changed_rows.index, changed_rows['product_hash'], changed_dirty, price_only):
+        changed = {
+            col: {'old': _py(joined.at[i, f'{col}_old']), 'new': _py(joined.at[i, col])}
+            for col, bit in zip(TRACKED_COLS, TRACKED_COL_BITS) if mask & bit
+        }
+        # meta log
+        meta_inserts.append((ph, 'price_update' if is_price else 'attribute_update', changed))
+
+    # --- Write all changes: one transaction across current/history/meta ---
+    # close old versions first, then insert the new active ones
+    with conn:
+        # fingerprints first: the refresh only touches active rows, so backfilled hashes
+        # also land on the versions closed below
+        if record_hash_updates:
+            conn.executemany(REFRESH_RECORD_HASH_SQL, record_hash_updates)
+        conn.executemany(CLOSE_ACTIVE_SQL, [(run_at, ph) for ph in closed_hashes])
+        if current_inserts:
+            conn.executemany(CURRENT_INSERT_SQL, current_inserts)
+        if closed_hashes:
+            # archive the closed versions (copied straight from current_df) into history
+            history_cols, history_inserts = _history_rows(current_df.loc[closed_hashes], run_at)
+            conn.executemany(
+                f"INSERT INTO {history_table} ({','.join(history_cols)}) "
+                f"VALUES ({','.join(['?'] * len(history_cols))});",
+                history_inserts
+            )
+        conn.executemany(
+            CHANGES_INSERT_SQL,
+            [(None, ph, change_type, _dumps(details), run_at) for ph, change_type, details in meta_inserts]
         )
-        if not active_duplicates.empty:
-            logger.warning(f"Found {len(active_duplicates)} product_hash with multiple active rows. Reconciling...")
-            for _, row in active_duplicates.iterrows():
-                ph = row['product_hash']
-                rows_active = pd.read_sql_query(f"SELECT product_id, valid_from FROM {DEFAULTS['CURRENT_TABLE']} WHERE is_active=1 AND product_hash = ? ORDER BY valid_from DESC;", conn_cur, params=(ph,))
-                # keep first (latest), close the rest
-                keep = rows_active.iloc[0]['product_id']
-                to_close = rows_active['product_id'].tolist()[1:]
-                for pid in to_close:
-                    conn_cur.execute(f"UPDATE {DEFAULTS['CURRENT_TABLE']} SET is_active=0, valid_to=? WHERE product_id=?;", (run_at, pid))
-            conn_cur.commit()
-    except Exception:
-        logger.exception("Failed during duplicate active reconciliation.")
-
-    # close connections
-    conn_hist.close()
-    conn_cur.close()
-    conn_meta.close()
+    # refresh planner statistics after the bulk writes so the active/hash indexes get picked
+    conn.execute(f"ANALYZE main.{DEFAULTS['CURRENT_TABLE']};")
 
     return stats
 
-def record_run_meta(meta_db: str, input_db: str, rows_input: int, stats: Dict[str, int], run_at: str) -> int:
+def record_run_meta(conn: sqlite3.Connection, input_db: str, rows_input: int, stats: Dict[str, int], run_at: str) -> int:
     """
-    Insert a run record into meta_db.etl_runs and update meta_changes entries with run_id.
+    Insert a run record into meta.etl_runs and update meta_changes entries with run_id.
+    Uses the same connection as scd2_apply (meta DB attached as META_SCHEMA).
     Returns run_id.
     """
-    conn = sqlite3.connect(meta_db)
-    ensure_meta_tables(conn)
-    cur = conn.cursor()
+    ensure_meta_tables(conn, schema=META_SCHEMA)
     stats_json = json.dumps(stats)
-    cur.execute(f"INSERT INTO {DEFAULTS['META_RUNS_TABLE']} (run_at, input_db, rows_input, stats_json) VALUES (?, ?, ?, ?);", (run_at, input_db, rows_input, stats_json))
-    conn.commit()
-    run_id = cur.lastrowid
+    with conn:
+        cur = conn.execute(f"INSERT INTO {META_SCHEMA}.{DEFAULTS['META_RUNS_TABLE']} (run_at, input_db, rows_input, stats_json) VALUES (?, ?, ?, ?);", (run_at, input_db, rows_input, stats_json))
+        run_id = cur.lastrowid
 
-    # attach run_id to changes_log rows that had run_id NULL
-    cur.execute(f"UPDATE {DEFAULTS['META_CHANGES_TABLE']} SET run_id = ? WHERE run_id IS NULL;", (run_id,))
-    conn.commit()
-    conn.close()
+        # attach run_id to changes_log rows that had run_id NULL
+        conn.execute(f"UPDATE {META_SCHEMA}.{DEFAULTS['META_CHANGES_TABLE']} SET run_id = ? WHERE run_id IS NULL;", (run_id,))
     return run_id
 
 # -------------------------
@@ -509,51 +696,55 @@ def run_etl(input_db_path: str = DEFAULTS["INPUT_DB"],
         logger.exception("Failed loading raw data.")
         return {"status": "error", "msg": str(e)}
 
-    # small dedupe check: count distinct product_hash after compute - used for stats
-    df_raw['product_hash_temp'] = df_raw['product_name'].apply(compute_product_hash)
-    distinct_after_hash = df_raw['product_hash_temp'].nunique()
+    # compute product_hash once: used for the dedupe stats and reused by prepare_snapshot
+    df_raw['product_hash'] = compute_product_hash_series(df_raw['product_name'])
+    distinct_after_hash = df_raw['product_hash'].nunique()
     duplicates_removed = rows_input - distinct_after_hash
     if duplicates_removed > 0:
         logger.warning(f"⚠️ Dibuang {duplicates_removed} data duplikat berdasarkan business key (hash).")
 
-    # 2) prepare snapshot (this also computes final product_hash and processed_at)
+    # 2) prepare snapshot (reuses product_hash, sets processed_at)
     snapshot = prepare_snapshot(df_raw)
     logger.info("🛠️ Menjalankan Feature Extraction & Snapshot preparation... (snapshot rows: %d)" % len(snapshot))
 
     # --- FEATURE EXTRACTION ---
-    # Extract brand, series, processor, GPU, RAM, storage, display dari product_name
+    # Extract brand, series, processor, GPU, RAM, storage, display dari product_name.
+    # Snapshot sudah di-collapse per product_hash, jadi setiap product_name diklasifikasi sekali saja
+    # (tidak perlu drop_duplicates + merge lagi di sini)
     brands_list = get_brands()
     
+    # Brand: satu regex gabungan untuk semua brand, vectorized lewat .str
     logger.info("📝 Extracting brand...")
-    snapshot['brand'] = snapshot['product_name'].apply(lambda x: extract_brand(x, brands_list))
-    
-    logger.info("📝 Extracting series...")
-    snapshot['series'] = snapshot['product_name'].apply(extract_series)
-    
-    logger.info("📝 Extracting processor...")
-    snapshot['processor_detail'] = snapshot['product_name'].apply(extract_processor)
-    snapshot['processor_category'] = snapshot['processor_detail'].apply(standardize_processor)
-    
-    logger.info("📝 Extracting GPU...")
-    snapshot['gpu'] = snapshot['product_name'].apply(extract_gpu)
-    snapshot['gpu_category'] = snapshot['gpu'].apply(standardize_gpu)
-    
-    logger.info("📝 Extracting RAM...")
-    snapshot['ram'] = snapshot['product_name'].apply(extract_ram)
-    
-    logger.info("📝 Extracting storage...")
-    snapshot['storage'] = snapshot['product_name'].apply(extract_storage)
-    
-    logger.info("📝 Extracting display...")
-    snapshot['display'] = snapshot['product_name'].apply(extract_display)
+    snapshot['brand'] = extract_brands(snapshot['product_name'], brands_list)
+
+    # Fitur lain: satu loop per product_name (bukan delapan .apply terpisah),
+    # dibagi ke semua core CPU untuk snapshot yang besar
+    logger.info("📝 Extracting series, processor, GPU, RAM, storage, display...")
+    features = pd.DataFrame.from_records(
+        extract_features_parallel(snapshot['product_name'].to_numpy(dtype=object)),
+        columns=SPEC_COLUMNS,
+        index=snapshot.index
+    )
+    snapshot = snapshot.join(features)
+    # Fitur hasil ekstraksi berkardinalitas rendah: simpan sebagai category (kode int + satu kamus)
+    category_dtypes = {col: 'category' for col in CATEGORY_COLS}
+    # Kategori prosesor/GPU berasal dari himpunan label tetap, jadi kamusnya sama di setiap run
+    category_dtypes['processor_category'] = pd.CategoricalDtype(PROCESSOR_CATEGORIES)
+    category_dtypes['gpu_category'] = pd.CategoricalDtype(GPU_CATEGORIES)
+    snapshot = snapshot.astype(category_dtypes)
+    snapshot['record_hash'] = compute_record_hash(snapshot)
     
     logger.info("✅ Feature extraction completed")
 
-    # 3) Apply SCD2 logic
-    stats = scd2_apply(snapshot, current_db_path, history_db_path, meta_db_path, run_at)
-
-    # 4) Record meta run (attach run_id to changes rows)
-    run_id = record_run_meta(meta_db_path, input_db_path, rows_input, stats, run_at)
+    # 3) Apply SCD2 logic + 4) record meta run (attach run_id to changes rows), on one connection
+    conn = open_etl_connection(current_db_path, history_db_path, meta_db_path)
+    try:
+        stats = scd2_apply(snapshot, conn, run_at)
+        # scd2_apply only sees the collapsed snapshot; the raw duplicate count comes from the hash pass above
+        stats['duplicates_in_raw'] = int(duplicates_removed)
+        run_id = record_run_meta(conn, input_db_path, rows_input, stats, run_at)
+    finally:
+        conn.close()
     logger.info(f"Run logged to meta_db with run_id: {run_id}")
 
     logger.info(f"=== ETL SELESAI. Stats: {stats} ===")
@@ -38,6 +38,11 @@ MAIN FUNCTIONS:
    - standardize_processor()       : Standardizing processor output
    - standardize_gpu()             : Standardizing GPU output
 
+4. COMBINED EXTRACTION:
+   - extract_all()                 : All features from one product name in a single call
+   - extract_specs()               : Same as extract_all() without the brand
+   - extract_brands()              : Vectorized extract_brand() for a whole Series (RE2 if installed)
+
 KEY FEATURES:
 ------------
 ✓ Robust Pattern Matching      : Using regex to handle text variations
@@ -65,11 +70,26 @@ IMPORTANT NOTES:
 ================================================================================
 """
 
+import logging
 import re
+from functools import lru_cache
 import pandas as pd
 from logger_setup import setup_logger
 
-logger = setup_logger("extractors")
+try:
+    # google-re2: DFA-based matching (no backtracking) for the brand union regex
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    # pyahocorasick: one linear scan for many literal keywords (brand prologue of extract_series)
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Extractors run once per product row: only warnings by default (LOG_LEVEL=DEBUG to trace)
+logger = setup_logger("extractors", logging.WARNING)
 
 
 def get_brands():
@@ -82,800 +102,955 @@ def get_brands():
         'Infinix', 'Jumper', 'SPC'
     ]
 
+# Legion models are listed without the Lenovo prefix.
+# Brand patterns are lowercase and run on lowercased text, without re.IGNORECASE.
+_LEGION_MODEL_RE = re.compile(r'\blegion\s*\d')
+
+def _brand_pattern(brand_list):
+    """Union of all brands (lowercased, deduplicated) as whole words, in brand_list order."""
+    # nama brand umumnya alfanumerik; hanya yang mengandung tanda baca yang di-escape
+    names = dict.fromkeys(b.lower() for b in brand_list)
+    return r'\b(' + '|'.join(b if b.isalnum() else re.escape(b) for b in names) + r')\b'
+
+@lru_cache(maxsize=8)
+def _brand_matcher(brands):
+    """
+    Compiled union regex plus lowercase match -> (position in brands, spelling in brands).
+    Cached per brand tuple so the pattern is built once, not on every call.
+    """
+    # duplikat beda kapital pakai yang pertama
+    rank = {}
+    for i, brand in enumerate(brands):
+        rank.setdefault(brand.lower(), (i, brand))
+    return re.compile(_brand_pattern(brands)), rank
+
+@lru_cache(maxsize=8)
+def _brand_re2(brands):
+    """RE2 build of the _brand_matcher union, cached per brand tuple like the stdlib one."""
+    return re2.compile(_brand_pattern(brands))
+
+def _pick_brand(found, rank):
+    """First brand in brand_list order among the union-regex matches, else 'Other'."""
+    if not isinstance(found, list) or not found:
+        return 'Other'
+    return min(rank[m.lower()] for m in found)[1]
+
 def extract_brand(product_name, brand_list):
     """
     Extract the brand from the product name based on the given brand list.
     """
     # Ensuring that product_name is a string
     if not isinstance(product_name, str):
-        logger.debug(f"Invalid product_name type: {type(product_name)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Invalid product_name type: {type(product_name)}")
         return 'Other'
     
     # Text normalization for better search results
-    product_text = product_name.strip()
-    
+    return _extract_brand(product_name.strip(), tuple(brand_list))
+
+# Scraped catalogs repeat the same product_name (variants, re-listings), and every
+# extractor is a pure function of the name, so results are memoized per name.
+EXTRACTOR_CACHE_SIZE = 131072
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _extract_brand(product_text, brands):
+    """Cached core of extract_brand (stripped str + brand tuple, so the key is hashable)."""
+    text_lower = product_text.lower()
      # Special check for Lenovo Legion models
-    if re.search(r'\bLegion\s*\d', product_text, re.IGNORECASE):
-        logger.debug(f"Brand detected: Lenovo (Legion) from '{product_name}'")
+    if _LEGION_MODEL_RE.search(text_lower):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Brand detected: Lenovo (Legion) from '{product_text}'")
         return 'Lenovo'
 
-    for brand in brand_list:
-        if re.search(r'\b' + re.escape(brand) + r'\b', product_text, re.IGNORECASE):
-            logger.debug(f"Brand detected: {brand} from '{product_name}'")
-            return brand
+    # One pass of the union regex; the first brand in brand_list order still wins
+    brand_re, rank = _brand_matcher(brands)
+    brand = _pick_brand(brand_re.findall(text_lower), rank)
+    if brand != 'Other':
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Brand detected: {brand} from '{product_text}'")
+        return brand
     
-    logger.debug(f"Brand not found in '{product_name}', returning 'Other'")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Brand not found in '{product_text}', returning 'Other'")
     return 'Other'
 
-def extract_series(product_name: str) -> str:
+def _re2_rule_set(patterns, flags=0):
     """
-    Extracts laptop series from product_name (Final v15 - Auto Enhanced from Suggestions)
+    One RE2 Set over an ordered list of patterns (None without RE2). A single pass
+    reports every pattern that matches anywhere in the text; a plain alternation
+    would only report the leftmost match, not the highest-priority pattern.
     """
-    
-    if not isinstance(product_name, str) or product_name.strip() == "":
-        return "Unknown"
-
-    name_lower = product_name.lower()
-    name_norm = re.sub(r"[\-_/]+", " ", name_lower)
-
-    # === Deteksi brand (mendeteksi brand yang muncul paling awal dalam string) ===
-    brands = ["advan", "acer", "asus", "apple", "avita", "axioo", "dell", "hp",
-              "huawei", "infinix", "lenovo", "msi", "microsoft", "samsung",
-              "spc", "tecno", "toshiba", "xiaomi", "zyrex", "jumper"]
-    
-    first_match_pos = float('inf')
-    detected_brand = None
-    for b in brands:
-        pos = name_lower.find(b)
-        if pos != -1 and pos < first_match_pos:
-            first_match_pos = pos
-            detected_brand = b
-
-    # === Jika brand tidak ditemukan, cek apakah mengandung kata kunci lenovo YANG EKSKLUSIF ===
-    if not detected_brand:
-        # Cek apakah mengandung kata kunci lenovo
-        lenovo_keywords = ["legion", "thinkpad", "thinkbook", "yoga", "ideapad", "flex", "v series", "v14", "v15", "loq"]
-        found_lenovo_kw = None
-        for kw in lenovo_keywords:
-            if kw in name_lower:
-                found_lenovo_kw = kw
-                break
-        
-        if found_lenovo_kw:
-            # Cek apakah mengandung brand lain (selain lenovo_keywords)
-            found_other_brand = False
-            for b in brands:
-                if b != "lenovo" and b in name_lower:
-                    found_other_brand = True
-                    break
-
-            if not found_other_brand:
-                detected_brand = "lenovo"
-
-    if not detected_brand:
-        return "Unknown"
-
-    # === ASUS Handling ===
-    if detected_brand == "asus":
-        # --- PRIORITY 1: Chromebook ---
-        if "chromebook" in name_lower:
-            return "Chromebook"
-
-        # --- PRIORITY 2: Zenbook ---
-        if "zenbook" in name_lower:
-            return "Zenbook"
-
-        # --- PRIORITY 3: Asus Gaming ---
-        if "asus gaming" in name_lower:
-            return "Asus Gaming"
-
-        # --- PRIORITY 4: Vivobook S (dengan model kode khusus) ---
-        if (
-            "vivobook s" in name_lower
-            or re.search(r"\bs\d{3}|um\d{3}", name_lower)
-            or re.search(r"k413f[aeq]|k413eq", name_lower)  # Tambahkan k413eq
-        ):
-            return "Vivobook S"
-
-        # --- PRIORITY 5: Advantage Edition ---
-        if "advantage edition" in name_lower:
-            if "tuf" in name_lower or re.search(r"fa617", name_lower):
-                return "TUF Gaming"
-            if "rog" in name_lower or re.search(r"g513qy", name_lower):
-                return "ROG Strix"
-        
-        # --- PRIORITY 6: ROG Strix ---
-        if (
-            re.search(r"\brog\b", name_lower)
-            or "zephyrus" in name_lower
-            or re.search(r"\bg5\d{2}|g7\d{2}|gx\d{3}|gz\d{3}", name_lower)
-        ):
-            return "ROG Strix"
-
-        # --- PRIORITY 7: TUF Gaming ---
-        if (
-            re.search(r"\btuf\b", name_lower)
-            or re.search(r"\btu\b", name_lower)
-            or re.search(r"fx\d{3}|fa\d{3}|fx6\d{2}|fa6\d{2}", name_lower)
-        ):
-            return "TUF Gaming"
-
-        # --- PRIORITY 8: ProArt Studiobook ---
-        if "creator" in name_lower or "proart" in name_lower or "pz" in name_lower:
-            return "ProArt Studiobook"
-
-        # --- PRIORITY 9: ExpertBook P & B ---
-        if re.search(r"\bp1\d{3}|expertbook p", name_lower):
-            return "ExpertBook P"
-        if re.search(r"\bbu\d{3}|b9|expertbook b", name_lower):
-            return "ExpertBook B"
-
-        # --- PRIORITY 10: Pro Series ---
-        if re.search(r"asus pro|pro y\d{3}|pro p\d{3}", name_lower):
-            return "Pro Series"
-
-        # --- PRIORITY 11: Vivobook Pro, Go, Flip ---
-        if "vivobook pro" in name_lower or re.search(r"\bv\d{4}", name_lower):
-            return "Vivobook Pro"
-        if "vivobook go" in name_lower or re.search(r"\bl\d{3,4}|e\d{3,4}", name_lower):
-            return "Vivobook Go"
-        if "vivobook flip" in name_lower or re.search(r"\btp\d{3}", name_lower):
-            return "Vivobook Flip"
-        if "vivobook" in name_lower:
-            return "Vivobook"
-
-        # --- PRIORITY 12: A-Series, X Series, M-Series, E-Series, BR Series ---
-        if re.search(r"\ba\d{3,4}", name_lower):
-            return "Vivobook (A-Series)"
-        if re.search(r"\bx\d{3,4}", name_lower):
-            return "X Series"
-        if re.search(r"\bm\d{3,4}", name_lower):
-            return "Vivobook (M-Series)"
-        if re.search(r"\be\d{3,4}", name_lower):
-            return "Vivobook (E-Series)"
-        if re.search(r"\bbr\d{3}", name_lower):
-            return "BR Series"
-
-        # --- ADVANTAGE EDITION FIXES ---
-        if "advantage edition" in name_lower:
-            if re.search(r"fa617", name_lower) or "a16" in name_lower:
-                return "TUF Gaming"
-            if re.search(r"g513qy", name_lower) or "g15" in name_lower:
-                return "ROG Strix"
-
-        # --- NEW: Specific model code detection ---
-        if re.search(r"fa617", name_lower):
-            return "TUF Gaming"
-        if re.search(r"g513qy", name_lower):
-            return "ROG Strix"
-
-        # --- EXPERTBOOK & PROART ---
-        if "expertbook" in name_lower:
-            return "ExpertBook"
-        if "proart" in name_lower:
-            return "ProArt Studiobook"
-
-        # --- AUTO-ADDED (SAFE PATCH) ---
-        if re.search(r"advantage|fa617ns|r7x2j6s|r7x2j6t|r7x2c6t", name_lower):
-            return "TUF Gaming"
-        if re.search(r"g513qy|advantage edition", name_lower):
-            return "ROG Strix"
-
-        return "Unknown"
-
-    # === Acer ===
-    elif detected_brand == "acer":
-        if "aspire" in name_lower: return "Aspire"
-        if "swift" in name_lower: return "Swift"
-        if "nitro" in name_lower: return "Nitro"
-        if "predator" in name_lower: return "Predator"
-        if "spin" in name_lower: return "Spin"
-        if "concept" in name_lower: return "Concept"
-        if "switch" in name_lower: return "Switch"
-        if "travelmate" in name_lower: return "TravelMate"
-        if "one" in name_lower: return "One"
-        if "mate" in name_lower: return "Mate"
-        if "chromebook" in name_lower: return "Chromebook"
-        return "Unknown"
-
-    # === Lenovo (Revisi Final - Logika Jelas & Efektif) ===
-    elif detected_brand == "lenovo":
-        # 1. Normalisasi nama
-        raw = product_name
-        name_lower = raw.lower()
-        name_clean = re.sub(r'[_/\\\(\)\[\]\.,:"]', ' ', name_lower)
-        name_clean = re.sub(r'[^a-z0-9\s\-]', ' ', name_clean)
-        name_clean = re.sub(r'\s+', ' ', name_clean).strip()
-
-        # 2. Daftar prioritas tinggi: Seri yang paling spesifik dulu
-        priority_patterns = [
-            # Yoga Pro
-            (r'\byoga\s+pro\b', "Yoga Pro"),
-            # Yoga
-            (r'\byoga\b', "Yoga"),
-            # Legion Pro
-            (r'\blegion\s+pro\b', "Legion Pro"),
-            # Legion Slim
-            (r'\blegion\s+slim\b', "Legion Slim"),
-            # Legion
-            (r'\blegion\b', "Legion"),  # <-- Ini harus cocok
-            # ThinkBook
-            (r'\bthinkbook\b', "ThinkBook"),
-            # ThinkPad
-            (r'\bthinkpad\b', "ThinkPad"),
-            # IdeaPad Pro
-            (r'\bideapad\s+pro\b', "IdeaPad Pro"),
-            # IdeaPad 5 2in1
-            (r'\bideapad\s+5\s+2in1\b', "IdeaPad Slim"),  # Diasumsikan Slim karena "5 2in1"
-            # IdeaPad D330 (series khusus)
-            (r'\bideapad\s+d330\b', "IdeaPad"),
-            # IdeaPad Slim 5, 3, 7, 1, dll (versi fleksibel)
-            (r'\bideapad\s+slim\s+5\b', "IdeaPad Slim"),
-            (r'\bideapad\s+slim\s+3\b', "IdeaPad Slim"),
-            (r'\bideapad\s+slim\s+7\b', "IdeaPad Slim"),
-            (r'\bideapad\s+slim\s+1\b', "IdeaPad Slim"),
-            # IdeaPad Slim generik (ini untuk kasus seperti "ideapad slim 1 11 05id")
-            (r'\bideapad\s+slim\s+\d', "IdeaPad Slim"),
-            # IdeaPad Slim generik (fallback setelah spesifik)
-            (r'\bideapad\s+slim\b', "IdeaPad Slim"),
-            # IdeaPad Slim Xi (misal: slim 3i, slim 5i)
-            (r'\bideapad\s+slim\s+\d+i\b', "IdeaPad Slim"),
-            # Slim 1, 3, 5, 7 (tanpa "ideapad" di depan)
-            (r'\bslim\s+1\b', "IdeaPad Slim"),
-            (r'\bslim\s+3\b', "IdeaPad Slim"),
-            (r'\bslim\s+5\b', "IdeaPad Slim"),
-            (r'\bslim\s+7\b', "IdeaPad Slim"),
-            # Slim Xi (misal: slim 3i, slim 5i)
-            (r'\bslim\s+\d+i\b', "IdeaPad Slim"),
-            # IdeaPad Xi (misal: IP 5i, IP 3i)
-            (r'\bip\s+\d+i\b', "IdeaPad"),
-            # IdeaPad Flex (baru - untuk "Flex 5", "Flex 7", dll)
-            (r'\bflex\s+5\b', "IdeaPad Flex"),
-            (r'\bflex\s+7\b', "IdeaPad Flex"),
-            # IdeaPad 1, 3 (tanpa "slim")
-            (r'\bideapad\s+1\b', "IdeaPad"),
-            (r'\bideapad\s+3\b', "IdeaPad"),
-            # IdeaPad Flex (fallback umum)
-            (r'\bideapad\s+flex\b', "IdeaPad Flex"),
-            # IdeaPad
-            (r'\bideapad\b', "IdeaPad"),
-            # LOQ
-            (r'\bloq\b', "LOQ"),
-            # Chromebook
-            (r'\bchromebook\b', "Chromebook"),
-            # V Series (baru)
-            (r'\bv14\s+g2\b', "V Series"),
-            (r'\bv15\s+g2\b', "V Series"),
-            (r'\bv16\s+g2\b', "V Series"),
-            # V Series (fallback untuk v14, v15, v16, dll)
-            (r'\bv\d{2}\b', "V Series"),
-            # IdeaPad (fallback umum untuk model seperti v14-01id, d330, dsb)
-            (r'\b\d{2,}[a-z]{2,}\d+\b', "IdeaPad"),
-        ]
-
-        for pattern, series in priority_patterns:
-            if re.search(pattern, name_clean, re.IGNORECASE):
-                return series
-
-        # 3. Jika tidak ada yang cocok, kembalikan "Unknown"
-        return "Unknown"
-        
-    # === HP ===
-    elif detected_brand == "hp":
+    if re2 is None:
+        return None
+    options = re2.Options()
+    options.case_sensitive = not flags & re.IGNORECASE
+    rule_set = re2.Set.SearchSet(options)
+    for pattern in patterns:
+        rule_set.Add(pattern)
+    rule_set.Compile()
+    return rule_set
+
+def _rule_candidates(rule_set, literals, text):
+    """Indices of the rules worth trying on text, in priority order."""
+    # RE2 classes (\b, \d, \s) are ASCII-only, so non-ASCII text uses the literal prefilter
+    if rule_set is None or not text.isascii():
+        # each table lists the literal its rule needs ('' = none); without it the rule cannot match
+        return [i for i, literal in enumerate(literals) if literal in text]
+    return sorted(rule_set.Match(text) or ())
+
+# ---------------------------------------------------------------------------
+# extract_series patterns, compiled once at import instead of on every call.
+# Consecutive checks that return the same series are merged into one pattern.
+# ---------------------------------------------------------------------------
+def _compile_priority_rules(rules, flags=0):
+    """
+    Compile an ordered (pattern, label) list; the first rule that matches anywhere wins.
+    Returns (compiled rules, RE2 set or None).
+    """
+    compiled = tuple((re.compile(pattern, flags), label) for pattern, label in rules)
+    return compiled, _re2_rule_set([pattern for pattern, _ in rules], flags)
+
+def _first_rule_label(rules, text):
+    """Label of the first matching rule from _compile_priority_rules, or None."""
+    compiled, rule_set = rules
+    if rule_set is not None and text.isascii():
+        hits = rule_set.Match(text)
+        return compiled[min(hits)][1] if hits else None
+    for pattern, label in compiled:
+        if pattern.search(text):
+            return label
+    return None
+
+_SERIES_BRANDS = ("advan", "acer", "asus", "apple", "avita", "axioo", "dell", "hp",
+                  "huawei", "infinix", "lenovo", "msi", "microsoft", "samsung",
+                  "spc", "tecno", "toshiba", "xiaomi", "zyrex", "jumper")
+# Brand paling awal dalam string: tidak ada brand yang jadi prefix brand lain,
+# jadi match paling kiri dari alternation = posisi find() terkecil
+_SERIES_BRAND_RE = re.compile('|'.join(_SERIES_BRANDS))
+_LENOVO_KEYWORDS = ("legion", "thinkpad", "thinkbook", "yoga", "ideapad", "flex",
+                    "v series", "v14", "v15", "loq")
+_LENOVO_KEYWORD_RE = re.compile('|'.join(_LENOVO_KEYWORDS))
+
+def _keyword_automaton(keywords):
+    """Aho-Corasick automaton mapping each keyword to itself (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+_SERIES_BRAND_AC = _keyword_automaton(_SERIES_BRANDS)
+_LENOVO_KEYWORD_AC = _keyword_automaton(_LENOVO_KEYWORDS)
+
+def _detect_series_brand(name_lower):
+    """Brand (from _SERIES_BRANDS) that appears earliest in name_lower, or None."""
+    if _SERIES_BRAND_AC is None:
+        brand_match = _SERIES_BRAND_RE.search(name_lower)
+        return brand_match.group(0) if brand_match else None
+    # iter() yields (end index, keyword); start = end - len + 1
+    hits = [(end - len(b) + 1, b) for end, b in _SERIES_BRAND_AC.iter(name_lower)]
+    return min(hits)[1] if hits else None
+
+def _has_lenovo_keyword(name_lower):
+    """True if name_lower contains one of the Lenovo-only sub-brand keywords."""
+    if _LENOVO_KEYWORD_AC is None:
+        return _LENOVO_KEYWORD_RE.search(name_lower) is not None
+    return next(_LENOVO_KEYWORD_AC.iter(name_lower), None) is not None
+
+# ASUS
+_ASUS_VIVOBOOK_S_RE = re.compile(r"\bs\d{3}|um\d{3}|k413f[aeq]|k413eq")
+_ASUS_ROG_RE = re.compile(r"\brog\b|\bg5\d{2}|g7\d{2}|gx\d{3}|gz\d{3}")
+_ASUS_TUF_RE = re.compile(r"\btuf\b|\btu\b|fx\d{3}|fa\d{3}|fx6\d{2}|fa6\d{2}")
+_ASUS_EXPERTBOOK_P_RE = re.compile(r"\bp1\d{3}|expertbook p")
+_ASUS_EXPERTBOOK_B_RE = re.compile(r"\bbu\d{3}|b9|expertbook b")
+_ASUS_PRO_SERIES_RE = re.compile(r"asus pro|pro y\d{3}|pro p\d{3}")
+_ASUS_VIVOBOOK_PRO_RE = re.compile(r"\bv\d{4}")
+_ASUS_VIVOBOOK_GO_RE = re.compile(r"\bl\d{3,4}|e\d{3,4}")
+_ASUS_VIVOBOOK_FLIP_RE = re.compile(r"\btp\d{3}")
+_ASUS_MODEL_PREFIX_RULES = _compile_priority_rules([
+    (r"\ba\d{3,4}", "Vivobook (A-Series)"),
+    (r"\bx\d{3,4}", "X Series"),
+    (r"\bm\d{3,4}", "Vivobook (M-Series)"),
+    (r"\be\d{3,4}", "Vivobook (E-Series)"),
+    (r"\bbr\d{3}", "BR Series"),
+])
+_ASUS_TUF_FALLBACK_RE = re.compile(r"advantage|fa617ns|r7x2j6s|r7x2j6t|r7x2c6t")
+
+# Lenovo: semua karakter selain huruf kecil, angka, spasi dan '-' jadi spasi
+_LENOVO_CLEAN_RE = re.compile(r'[^a-z0-9\s\-]+')
+
+# Seri yang paling spesifik dulu
+_LENOVO_PRIORITY_PATTERNS = _compile_priority_rules([
+    # Yoga Pro
+    (r'\byoga\s+pro\b', "Yoga Pro"),
+    # Yoga
+    (r'\byoga\b', "Yoga"),
+    # Legion Pro
+    (r'\blegion\s+pro\b', "Legion Pro"),
+    # Legion Slim
+    (r'\blegion\s+slim\b', "Legion Slim"),
+    # Legion
+    (r'\blegion\b', "Legion"),  # <-- Ini harus cocok
+    # ThinkBook
+    (r'\bthinkbook\b', "ThinkBook"),
+    # ThinkPad
+    (r'\bthinkpad\b', "ThinkPad"),
+    # IdeaPad Pro
+    (r'\bideapad\s+pro\b', "IdeaPad Pro"),
+    # IdeaPad 5 2in1
+    (r'\bideapad\s+5\s+2in1\b', "IdeaPad Slim"),  # Diasumsikan Slim karena "5 2in1"
+    # IdeaPad D330 (series khusus)
+    (r'\bideapad\s+d330\b', "IdeaPad"),
+    # IdeaPad Slim 5, 3, 7, 1, dll (versi fleksibel)
+    (r'\bideapad\s+slim\s+5\b', "IdeaPad Slim"),
+    (r'\bideapad\s+slim\s+3\b', "IdeaPad Slim"),
+    (r'\bideapad\s+slim\s+7\b', "IdeaPad Slim"),
+    (r'\bideapad\s+slim\s+1\b', "IdeaPad Slim"),
+    # IdeaPad Slim generik (ini untuk kasus seperti "ideapad slim 1 11 05id")
+    (r'\bideapad\s+slim\s+\d', "IdeaPad Slim"),
+    # IdeaPad Slim generik (fallback setelah spesifik)
+    (r'\bideapad\s+slim\b', "IdeaPad Slim"),
+    # IdeaPad Slim Xi (misal: slim 3i, slim 5i)
+    (r'\bideapad\s+slim\s+\d+i\b', "IdeaPad Slim"),
+    # Slim 1, 3, 5, 7 (tanpa "ideapad" di depan)
+    (r'\bslim\s+1\b', "IdeaPad Slim"),
+    (r'\bslim\s+3\b', "IdeaPad Slim"),
+    (r'\bslim\s+5\b', "IdeaPad Slim"),
+    (r'\bslim\s+7\b', "IdeaPad Slim"),
+    # Slim Xi (misal: slim 3i, slim 5i)
+    (r'\bslim\s+\d+i\b', "IdeaPad Slim"),
+    # IdeaPad Xi (misal: IP 5i, IP 3i)
+    (r'\bip\s+\d+i\b', "IdeaPad"),
+    # IdeaPad Flex (baru - untuk "Flex 5", "Flex 7", dll)
+    (r'\bflex\s+5\b', "IdeaPad Flex"),
+    (r'\bflex\s+7\b', "IdeaPad Flex"),
+    # IdeaPad 1, 3 (tanpa "slim")
+    (r'\bideapad\s+1\b', "IdeaPad"),
+    (r'\bideapad\s+3\b', "IdeaPad"),
+    # IdeaPad Flex (fallback umum)
+    (r'\bideapad\s+flex\b', "IdeaPad Flex"),
+    # IdeaPad
+    (r'\bideapad\b', "IdeaPad"),
+    # LOQ
+    (r'\bloq\b', "LOQ"),
+    # Chromebook
+    (r'\bchromebook\b', "Chromebook"),
+    # V Series (baru)
+    (r'\bv14\s+g2\b', "V Series"),
+    (r'\bv15\s+g2\b', "V Series"),
+    (r'\bv16\s+g2\b', "V Series"),
+    # V Series (fallback untuk v14, v15, v16, dll)
+    (r'\bv\d{2}\b', "V Series"),
+    # IdeaPad (fallback umum untuk model seperti v14-01id, d330, dsb)
+    (r'\b\d{2,}[a-z]{2,}\d+\b', "IdeaPad"),
+])
+# Setiap pola di atas butuh salah satu kata kunci ini atau sebuah digit (V Series / kode model);
+# tanpa itu seluruh tangga pola pasti gagal, jadi cukup satu scan untuk menolaknya
+_LENOVO_SERIES_GATE_RE = re.compile(r'yoga|legion|think|ideapad|slim|ip|flex|loq|chromebook|\d')
+
+# HP
+_HP_PAV_GAMING_RE = re.compile(r"pav.*gaming")  # mencakup "pav gaming"
+_HP_200_SERIES_RE = re.compile(r"\b(?:240r|250|255)\s+g[0-9]|240r g9|250 g8|255 g8")
+_HP_LAPTOP_RE = re.compile(r"hp\s+15s|hp\s+15\s+(?:core|fd1)|hp\s+14[-]\w{2}\d+|14-(?:ep|em|cf|fq)")
+_HP_ESSENTIAL_RE = re.compile(r"hp\s?14s|240 g\d|245 g\d|hp\s+14\s+[a-z]")
+
+# MSI model codes
+_MSI_MODEL_RULES = _compile_priority_rules([
+    (r"\bgf\d{2}", "Katana"),  # GF series = Katana/Thin
+    (r"\bgl\d{2}", "Pulse"),   # GL series = Pulse
+    (r"\bgp\d{2}", "Leopard"), # GP series = Leopard
+    (r"\bge\d{2}", "Raider"),  # GE series = Raider
+    (r"\bgs\d{2}", "Stealth"), # GS series = Stealth
+    (r"\bgt\d{2}", "Titan"),   # GT series = Titan
+    (r"ws\d{2}|wf\d{2}", "Workstation"),  # WS / WF series
+    (r"b13v|b14v|a13v", "Pulse"),  # Pulse series models
+    (r"b12u|a12u|d7w|d2x", "Crosshair"),  # Crosshair (AI) series models
+    (r"c1v", "Pulse"),  # Pulse AI models
+])
+
+_ZYREX_DTECH_RE = re.compile(r"d.?tech")
+_DELL_INSPIRON_RE = re.compile(r"dell\s+[a-z]+\s+[0-9]")
+_APPLE_MGN_RE = re.compile(r"mgn\d{2,3}")
+
+# Brand tanpa logika khusus: (keyword atau regex, seri), dicek berurutan - entri pertama
+# yang cocok menang. Literal dicari sekaligus (Aho-Corasick bila tersedia), regex
+# hanya dicek bila posisinya mendahului literal terbaik.
+_SERIES_KEYWORD_RULES = {
+    "acer": [
+        ("aspire", "Aspire"), ("swift", "Swift"), ("nitro", "Nitro"), ("predator", "Predator"),
+        ("spin", "Spin"), ("concept", "Concept"), ("switch", "Switch"),
+        ("travelmate", "TravelMate"), ("one", "One"), ("mate", "Mate"),
+        ("chromebook", "Chromebook"),
+    ],
+    "hp": [
         # Chromebook Series - High Priority
-        if "chromebook" in name_lower: return "Chromebook"
-        
+        ("chromebook", "Chromebook"),
         # Premium & Business Series
-        if "elite dragonfly" in name_lower: return "Elite Series"
-        if "elite folio" in name_lower: return "Elite Series"
-        if "dragonfly folio" in name_lower: return "Elite Series"
-        if "elitebook" in name_lower: return "EliteBook"
-        if "probook" in name_lower: return "ProBook"
-        if "zbook" in name_lower: return "ZBook"
-        
+        ("elite dragonfly", "Elite Series"), ("elite folio", "Elite Series"),
+        ("dragonfly folio", "Elite Series"), ("elitebook", "EliteBook"),
+        ("probook", "ProBook"), ("zbook", "ZBook"),
         # Gaming Series
-        if "omen" in name_lower: return "OMEN"
-        if "victus" in name_lower: return "Victus"
-        if "pav gaming" in name_lower or re.search(r"pav.*gaming", name_lower): return "Pavilion Gaming"
-        
+        ("omen", "OMEN"), ("victus", "Victus"),
+        (_HP_PAV_GAMING_RE, "Pavilion Gaming"),
         # Consumer Premium Series
-        if "spectre" in name_lower: return "Spectre"
-        if "envy" in name_lower: return "Envy"
-        
+        ("spectre", "Spectre"), ("envy", "Envy"),
         # Mainstream Consumer Series
-        if "pavilion" in name_lower: return "Pavilion"
-        
+        ("pavilion", "Pavilion"),
         # HP Essential Series (200 Series) - Business Entry Level
-        if re.search(r"\b(?:240r|250|255)\s+g[0-9]", name_lower): return "HP 200 Series"
-        if "240r g9" in name_lower: return "HP 200 Series"
-        if "250 g8" in name_lower: return "HP 200 Series"
-        if "255 g8" in name_lower: return "HP 200 Series"
-        
+        (_HP_200_SERIES_RE, "HP 200 Series"),
         # HP Laptop Series (Mainstream) - Enhanced patterns
-        if re.search(r"hp\s+15s", name_lower): return "HP Laptop"
-        if re.search(r"hp\s+15\s+(?:core|fd1)", name_lower): return "HP Laptop"
-        
-        # NEW: Enhanced HP 14 Series detection
-        if re.search(r"hp\s+14[-]\w{2}\d+", name_lower): return "HP Laptop"
-        if re.search(r"hp\s+14[-](?:ep|em|cf|fq)", name_lower): return "HP Laptop"
-        if "14-ep" in name_lower: return "HP Laptop"
-        if "14-em" in name_lower: return "HP Laptop"
-        if "14-cf" in name_lower: return "HP Laptop"
-        if "14-fq" in name_lower: return "HP Laptop"
-        
+        (_HP_LAPTOP_RE, "HP Laptop"),
         # Essential Series fallback patterns
-        if re.search(r"hp\s?14s|240 g\d|245 g\d", name_lower): return "Essential Series"
-        if re.search(r"hp\s+14\s+[a-z]", name_lower): return "Essential Series"
-        
+        (_HP_ESSENTIAL_RE, "Essential Series"),
         # Omnibook Series
-        if "omnibook" in name_lower: return "OmniBook"
-        
-        return "Unknown"
-
-    # === MSI ===
-    elif detected_brand == "msi":
+        ("omnibook", "OmniBook"),
+    ],
+    "msi": [
         # Gaming Series - Entry Level
-        if "katana" in name_lower: return "Katana"
-        if "cyborg" in name_lower: return "Cyborg"
-        if "bravo" in name_lower: return "Bravo"
-        if "thin" in name_lower: return "Thin"
-        
+        ("katana", "Katana"), ("cyborg", "Cyborg"), ("bravo", "Bravo"), ("thin", "Thin"),
         # Gaming Series - Mid Range
-        if "pulse" in name_lower: return "Pulse"
-        if "crosshair" in name_lower: return "Crosshair"
-        if "sword" in name_lower: return "Sword"
-        
+        ("pulse", "Pulse"), ("crosshair", "Crosshair"), ("sword", "Sword"),
         # Gaming Series - High Performance
-        if "leopard" in name_lower: return "Leopard"
-        if "raider" in name_lower: return "Raider"
-        if "vector" in name_lower: return "Vector"
-        if "stealth" in name_lower: return "Stealth"
-        
+        ("leopard", "Leopard"), ("raider", "Raider"), ("vector", "Vector"), ("stealth", "Stealth"),
         # Gaming Series - Flagship
-        if "titan" in name_lower: return "Titan"
-        
+        ("titan", "Titan"),
         # Content Creation & Workstation
-        if "creator" in name_lower: return "Creator"
-        if "workstation" in name_lower: return "Workstation"
-        
+        ("creator", "Creator"), ("workstation", "Workstation"),
         # Commercial/Business Series
-        if "commercial" in name_lower: return "Commercial"
-        if "modern" in name_lower: return "Modern"
-        if "prestige" in name_lower: return "Prestige"
-        if "summit" in name_lower: return "Summit"
-        
-        # Enhanced pattern matching untuk model codes
-        if re.search(r"\bgf\d{2}", name_lower): return "Katana"  # GF series = Katana/Thin
-        if re.search(r"\bgl\d{2}", name_lower): return "Pulse"   # GL series = Pulse
-        if re.search(r"\bgp\d{2}", name_lower): return "Leopard" # GP series = Leopard
-        if re.search(r"\bge\d{2}", name_lower): return "Raider"  # GE series = Raider
-        if re.search(r"\bgs\d{2}", name_lower): return "Stealth" # GS series = Stealth
-        if re.search(r"\bgt\d{2}", name_lower): return "Titan"   # GT series = Titan
-        
-        # Specific model pattern matching
-        if re.search(r"ws\d{2}", name_lower): return "Workstation"  # WS series
-        if re.search(r"wf\d{2}", name_lower): return "Workstation"  # WF series
-        
-        # Fallback untuk model codes yang umum
-        if re.search(r"b13v|b14v|a13v", name_lower): return "Pulse"  # Pulse series models
-        if re.search(r"b12u|a12u", name_lower): return "Crosshair"   # Crosshair series models
-        if re.search(r"d7w|d2x", name_lower): return "Crosshair"     # Crosshair AI models
-        if re.search(r"c1v", name_lower): return "Pulse"             # Pulse AI models
-        
-        return "Unknown"
-
-    # === Axioo ===
-    elif detected_brand == "axioo":
-        if "mybook" in name_lower: return "MyBook"
-        if "hype" in name_lower: return "Hype"
-        if "pongo" in name_lower: return "Pongo"
-        if "slimbook" in name_lower: return "SlimBook"
-        if "neon" in name_lower: return "Neon"
-        return "Unknown"
-
-    # === Advan ===
-    elif detected_brand == "advan":
+        ("commercial", "Commercial"), ("modern", "Modern"), ("prestige", "Prestige"),
+        ("summit", "Summit"),
+    ],
+    "axioo": [
+        ("mybook", "MyBook"), ("hype", "Hype"), ("pongo", "Pongo"), ("slimbook", "SlimBook"),
+        ("neon", "Neon"),
+    ],
+    "advan": [
         # NEW: AI Series - High Performance
-        if "ai gen" in name_lower: return "AI Gen"
-        
+        ("ai gen", "AI Gen"),
         # NEW: Gaming Series
-        if "pixwar" in name_lower: return "Pixwar"
-        
+        ("pixwar", "Pixwar"),
         # NEW: 2-in-1 Convertible Series
-        if "360" in name_lower: return "360 Stylus"
-        if "2in1 evo-x" in name_lower or "evo-x" in name_lower: return "2in1 Evo-X"
-        
+        ("360", "360 Stylus"), ("evo-x", "2in1 Evo-X"),
         # Existing series
-        if "soulmate" in name_lower: return "Soulmate"
-        if "chromebook" in name_lower: return "Chromebook"
-        if "workmate" in name_lower: return "Workmate"
-        if "tbook" in name_lower: return "Tbook"
-        if "workpro" in name_lower: return "Workpro"
-        if "workplus" in name_lower: return "Workplus"
-        return "Unknown"
+        ("soulmate", "Soulmate"), ("chromebook", "Chromebook"), ("workmate", "Workmate"),
+        ("tbook", "Tbook"), ("workpro", "Workpro"), ("workplus", "Workplus"),
+    ],
+    "avita": [
+        ("magus", "Magus"), ("essential", "Essential"), ("liber", "Liber"), ("admiror", "Admiror"),
+    ],
+    "huawei": [("matebook", "MateBook")],
+    "infinix": [("xbook", "Xbook"), ("inbook", "INbook"), ("gtbook", "GTbook")],
+    "microsoft": [("surface", "Surface")],
+    "spc": [("style", "Style"), ("life", "Life")],
+    "tecno": [("megabook", "Megabook")],
+    "toshiba": [("dynabook", "Dynabook"), ("satellite", "Satellite"), ("tecra", "Tecra")],
+    "xiaomi": [("redmibook", "RedmiBook")],
+    "zyrex": [
+        ("confidante", "Confidante"), ("bunaken", "Bunaken"), ("sky", "Sky"),
+        ("kintamani", "Kintamani"), ("lifebook", "Lifebook"), ("ultra", "Ultra"),
+        (_ZYREX_DTECH_RE, "D-Tech"), ("blaze", "Blaze"),
+    ],
+    "jumper": [("ezbook", "Ezbook")],
+    "samsung": [("galaxy book", "Galaxy Book"), ("chromebook", "Chromebook")],
+    "dell": [
+        # Gaming Series - Priority Order
+        ("alienware", "Alienware"), ("g15", "G Series"), ("g series", "G Series"),
+        ("g16", "G Series"),
+        # Business & Productivity Series
+        ("inspiron", "Inspiron"), ("vostro", "Vostro"), ("xps", "XPS"),
+        ("precision", "Precision"), ("latitude", "Latitude"), ("chromebook", "Chromebook"),
+        # NEW: Enhanced Dell pattern matching
+        (_DELL_INSPIRON_RE, "Inspiron"),
+    ],
+    "apple": [
+        ("macbook air", "Macbook Air"), ("macbook pro", "Macbook Pro"), ("macbook", "Macbook"),
+        # NEW: Enhanced Apple detection
+        (_APPLE_MGN_RE, "Macbook Air"),
+    ],
+}
 
-    # === Avita ===
-    elif detected_brand == "avita":
-        if "magus" in name_lower: return "Magus"
-        if "essential" in name_lower: return "Essential"
-        if "liber" in name_lower: return "Liber"
-        if "admiror" in name_lower: return "Admiror"
-        return "Unknown"
+def _compile_keyword_rules(rules):
+    """
+    Split an ordered (keyword or regex, label) list for _first_keyword_label.
+    Returns (labels, {keyword: first index}, [(index, regex)], automaton or None,
+    union regex of all keywords or None).
+    """
+    labels = [label for _, label in rules]
+    keywords, regexes = {}, []
+    for i, (rule, _) in enumerate(rules):
+        if isinstance(rule, str):
+            keywords.setdefault(rule, i)
+        else:
+            regexes.append((i, rule))
+    automaton = None
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for kw, i in keywords.items():
+            automaton.add_word(kw, i)
+        automaton.make_automaton()
+    # tanpa automaton: satu alternation (terpanjang dulu) menolak teks tanpa keyword
+    # apa pun sebelum loop `in` berurutan
+    keyword_re = None
+    if automaton is None and keywords:
+        keyword_re = re.compile('|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+    return labels, keywords, regexes, automaton, keyword_re
+
+def _first_keyword_label(rules, text):
+    """Label of the first rule (in list order) that matches text, or None."""
+    if rules is None:
+        return None
+    labels, keywords, regexes, automaton, keyword_re = rules
+    if automaton is not None:
+        best = min((i for _, i in automaton.iter(text)), default=len(labels))
+    elif keyword_re is None or not keyword_re.search(text):
+        best = len(labels)
+    else:
+        best = next((i for kw, i in keywords.items() if kw in text), len(labels))
+    # regex hanya menang bila urutannya sebelum literal terbaik
+    for i, pattern in regexes:
+        if i >= best:
+            break
+        if pattern.search(text):
+            return labels[i]
+    return labels[best] if best < len(labels) else None
+
+_SERIES_KEYWORD_MATCHERS = {brand: _compile_keyword_rules(rules)
+                            for brand, rules in _SERIES_KEYWORD_RULES.items()}
+
+def _extract_series_asus(name_lower):
+    """ASUS series, checked in priority order (name_lower is the lowercased product name)."""
+    # --- PRIORITY 1: Chromebook ---
+    if "chromebook" in name_lower:
+        return "Chromebook"
+
+    # --- PRIORITY 2: Zenbook ---
+    if "zenbook" in name_lower:
+        return "Zenbook"
+
+    # --- PRIORITY 3: Asus Gaming ---
+    if "asus gaming" in name_lower:
+        return "Asus Gaming"
+
+    # --- PRIORITY 4: Vivobook S (dengan model kode khusus) ---
+    if "vivobook s" in name_lower or _ASUS_VIVOBOOK_S_RE.search(name_lower):
+        return "Vivobook S"
+
+    # --- PRIORITY 5: Advantage Edition ---
+    if "advantage edition" in name_lower:
+        if "tuf" in name_lower or "fa617" in name_lower:
+            return "TUF Gaming"
+        if "rog" in name_lower or "g513qy" in name_lower:
+            return "ROG Strix"
 
-    # === Huawei ===
-    elif detected_brand == "huawei":
-        if "matebook" in name_lower: return "MateBook"
-        return "Unknown"
+    # --- PRIORITY 6: ROG Strix ---
+    if "zephyrus" in name_lower or _ASUS_ROG_RE.search(name_lower):
+        return "ROG Strix"
+
+    # --- PRIORITY 7: TUF Gaming ---
+    if _ASUS_TUF_RE.search(name_lower):
+        return "TUF Gaming"
+
+    # --- PRIORITY 8: ProArt Studiobook ---
+    if "creator" in name_lower or "proart" in name_lower or "pz" in name_lower:
+        return "ProArt Studiobook"
+
+    # --- PRIORITY 9: ExpertBook P & B ---
+    if _ASUS_EXPERTBOOK_P_RE.search(name_lower):
+        return "ExpertBook P"
+    if _ASUS_EXPERTBOOK_B_RE.search(name_lower):
+        return "ExpertBook B"
+
+    # --- PRIORITY 10: Pro Series ---
+    if _ASUS_PRO_SERIES_RE.search(name_lower):
+        return "Pro Series"
+
+    # --- PRIORITY 11: Vivobook Pro, Go, Flip ---
+    if "vivobook pro" in name_lower or _ASUS_VIVOBOOK_PRO_RE.search(name_lower):
+        return "Vivobook Pro"
+    if "vivobook go" in name_lower or _ASUS_VIVOBOOK_GO_RE.search(name_lower):
+        return "Vivobook Go"
+    if "vivobook flip" in name_lower or _ASUS_VIVOBOOK_FLIP_RE.search(name_lower):
+        return "Vivobook Flip"
+    if "vivobook" in name_lower:
+        return "Vivobook"
+
+    # --- PRIORITY 12: A-Series, X Series, M-Series, E-Series, BR Series ---
+    series = _first_rule_label(_ASUS_MODEL_PREFIX_RULES, name_lower)
+    if series:
+        return series
+
+    # --- ADVANTAGE EDITION FIXES ---
+    if "advantage edition" in name_lower:
+        if "fa617" in name_lower or "a16" in name_lower:
+            return "TUF Gaming"
+        if "g513qy" in name_lower or "g15" in name_lower:
+            return "ROG Strix"
 
-    # === Infinix ===
-    elif detected_brand == "infinix":
-        if "xbook" in name_lower: return "Xbook"
-        if "inbook" in name_lower: return "INbook"
-        if "gtbook" in name_lower: return "GTbook"
-        return "Unknown"
+    # --- NEW: Specific model code detection ---
+    if "fa617" in name_lower:
+        return "TUF Gaming"
+    if "g513qy" in name_lower:
+        return "ROG Strix"
 
-    # === Microsoft ===
-    elif detected_brand == "microsoft":
-        if "surface" in name_lower: return "Surface"
-        return "Unknown"
+    # --- EXPERTBOOK & PROART ---
+    if "expertbook" in name_lower:
+        return "ExpertBook"
+    if "proart" in name_lower:
+        return "ProArt Studiobook"
 
-    # === SPC ===
-    elif detected_brand == "spc":
-        if "style" in name_lower: return "Style"
-        if "life" in name_lower: return "Life"
-        return "Unknown"
+    # --- AUTO-ADDED (SAFE PATCH) ---
+    if _ASUS_TUF_FALLBACK_RE.search(name_lower):
+        return "TUF Gaming"
+    if "g513qy" in name_lower or "advantage edition" in name_lower:
+        return "ROG Strix"
 
-    # === Tecno ===
-    elif detected_brand == "tecno":
-        if "megabook" in name_lower: return "Megabook"
-        return "Unknown"
+    return "Unknown"
 
-    # === Toshiba ===
-    elif detected_brand == "toshiba":
-        if "dynabook" in name_lower: return "Dynabook"
-        if "satellite" in name_lower: return "Satellite"
-        if "tecra" in name_lower: return "Tecra"
+def _extract_series_lenovo(name_lower):
+    """Lenovo series (Revisi Final - Logika Jelas & Efektif)."""
+    # 1. Normalisasi nama (name_lower sudah dihitung di awal);
+    #    split/join merapikan spasi tanpa pass regex tambahan
+    name_clean = ' '.join(_LENOVO_CLEAN_RE.sub(' ', name_lower).split())
+    if not _LENOVO_SERIES_GATE_RE.search(name_clean):
         return "Unknown"
 
-    # === Xiaomi ===
-    elif detected_brand == "xiaomi":
-        if "redmibook" in name_lower: return "RedmiBook"
-        return "Unknown"
+    # 2. Cek pola prioritas: seri yang paling spesifik dulu
+    series = _first_rule_label(_LENOVO_PRIORITY_PATTERNS, name_clean)
+    if series:
+        return series
 
-    # === Zyrex ===
-    elif detected_brand == "zyrex":
-        if "confidante" in name_lower: return "Confidante"
-        if "bunaken" in name_lower: return "Bunaken"
-        if "sky" in name_lower: return "Sky"
-        if "kintamani" in name_lower: return "Kintamani"
-        if "lifebook" in name_lower: return "Lifebook"
-        if "ultra" in name_lower: return "Ultra"
-        if re.search(r"d.?tech", name_lower): return "D-Tech"
-        if "blaze" in name_lower: return "Blaze"
-        return "Unknown"
+    # 3. Jika tidak ada yang cocok, kembalikan "Unknown"
+    return "Unknown"
 
-    # === Jumper ===
-    elif detected_brand == "jumper":
-        if "ezbook" in name_lower: return "Ezbook"
+def _extract_series_msi(name_lower):
+    """MSI series: keyword table first, then the GF/GL/GP... model codes."""
+    series = _first_keyword_label(_SERIES_KEYWORD_MATCHERS["msi"], name_lower)
+    if series is None:
+        # Enhanced pattern matching untuk model codes
+        series = _first_rule_label(_MSI_MODEL_RULES, name_lower)
+    return series or "Unknown"
+
+def _keyword_series_handler(matcher):
+    """Handler for a brand without special logic: first matching rule of its keyword table."""
+    def handler(name_lower):
+        return _first_keyword_label(matcher, name_lower) or "Unknown"
+    return handler
+
+# Brand terdeteksi -> fungsi seri (satu lookup dict, bukan rantai if/elif per brand)
+_SERIES_BRAND_HANDLERS = {brand: _keyword_series_handler(matcher)
+                          for brand, matcher in _SERIES_KEYWORD_MATCHERS.items()}
+_SERIES_BRAND_HANDLERS.update(asus=_extract_series_asus, lenovo=_extract_series_lenovo,
+                              msi=_extract_series_msi)
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def extract_series(product_name: str) -> str:
+    """
+    Extracts laptop series from product_name (Final v15 - Auto Enhanced from Suggestions)
+    """
+    
+    if not isinstance(product_name, str) or product_name.strip() == "":
         return "Unknown"
 
-    # === Samsung ===
-    elif detected_brand == "samsung":
-        if "galaxy book" in name_lower: return "Galaxy Book"
-        if "chromebook" in name_lower: return "Chromebook"
-        return "Unknown"
+    name_lower = product_name.lower()
 
-    # === Dell ===
-    elif detected_brand == "dell":
-        # Gaming Series - Priority Order
-        if "alienware" in name_lower: return "Alienware"
-        if "g15" in name_lower or "g series" in name_lower: return "G Series"
-        if "g16" in name_lower: return "G Series"
-        
-        # Business & Productivity Series
-        if "inspiron" in name_lower: return "Inspiron"
-        if "vostro" in name_lower: return "Vostro"
-        if "xps" in name_lower: return "XPS"
-        if "precision" in name_lower: return "Precision"
-        if "latitude" in name_lower: return "Latitude"
-        if "chromebook" in name_lower: return "Chromebook"
-        
-        # NEW: Enhanced Dell pattern matching
-        if re.search(r"dell\s+[a-z]+\s+[0-9]", name_lower): return "Inspiron"
-        return "Unknown"
+    # === Deteksi brand (mendeteksi brand yang muncul paling awal dalam string) ===
+    detected_brand = _detect_series_brand(name_lower)
 
-    # === Apple ===
-    elif detected_brand == "apple":
-        if "macbook air" in name_lower: return "Macbook Air"
-        if "macbook pro" in name_lower: return "Macbook Pro"
-        if "macbook" in name_lower: return "Macbook"
-        # NEW: Enhanced Apple detection
-        if re.search(r"mgn\d{2,3}", name_lower): return "Macbook Air"
+    # === Jika brand tidak ditemukan, cek apakah mengandung kata kunci lenovo YANG EKSKLUSIF ===
+    if not detected_brand:
+        # Cek apakah mengandung kata kunci lenovo; brand lain pasti tidak ada
+        # karena _detect_series_brand tidak menemukan brand apa pun
+        if _has_lenovo_keyword(name_lower):
+            detected_brand = "lenovo"
+
+    if not detected_brand:
         return "Unknown"
-    
-    return "Unknown"
+
+    # === Seri per brand: ASUS / Lenovo / MSI punya logika sendiri, sisanya tabel keyword ===
+    handler = _SERIES_BRAND_HANDLERS.get(detected_brand)
+    return handler(name_lower) if handler is not None else "Unknown"
+
+# ---------------------------------------------------------------------------
+# extract_processor patterns. A formatter is either a match.expand() template
+# (\g<n> group references) or, for conditional cases, a callable that reads the
+# searched (uppercased) name from m.string, so the table can live at module level.
+# ---------------------------------------------------------------------------
+# Mapping pattern untuk berbagai tipe processor dengan prioritas
+_PROCESSOR_PATTERNS = (
+    # 0. SNAPDRAGON X SERIES - PATTERN BARU DIPINDAHKAN LEBIH TINGGI
+    (re.compile(r'SNAPDRAGON\s+X\s+ELITE\s+X?1E?-?\d{2}-?\d{2,3}'), 'SNAPDRAGON', 1,
+     r"Snapdragon X Elite"),
+    (re.compile(r'SNAPDRAGON\s+X\s+ELITE'), 'SNAPDRAGON', 1,
+     r"Snapdragon X Elite"),
+    (re.compile(r'SNAPDRAGON\s+X\s+PLUS\s+X?1P?-?\d{2}-?\d{2,3}'), 'SNAPDRAGON', 1,
+     r"Snapdragon X Plus"),
+    (re.compile(r'SNAPDRAGON\s+X\s+PLUS'), 'SNAPDRAGON', 1,
+     r"Snapdragon X Plus"),
+    (re.compile(r'SNAPDRAGON\s+X\s+X1[EP]'), 'SNAPDRAGON', 1,
+     r"Snapdragon X Series"),
+    (re.compile(r'SNAPDRAGON\s+X'), 'SNAPDRAGON', 1,
+     r"Snapdragon X"),
+
+    # 1. SNAPDRAGON TRADITIONAL SERIES (8xx series)
+    (re.compile(r'SNAPDRAGON\s+(\d{3}[A-Z]?)'), 'SNAPDRAGON', 1,
+     r"Snapdragon \g<1>"),
+    (re.compile(r'SNAPDRAGON\s+(\d{3})\s+CORE'), 'SNAPDRAGON', 1,
+     r"Snapdragon \g<1>"),
+
+    # 2. MICROSOFT SQ SERIES
+    (re.compile(r'MICROSOFT\s+SQ[12]'), 'MICROSOFT', 1,
+    lambda m: f"Microsoft {m.group(0).replace('MICROSOFT ', '')}"),
+    (re.compile(r'\bSQ[12]\b'), 'SQ', 1,
+    r"Microsoft \g<0>"),
+
+    # 3. AMD RYZEN AI MAX+ SERIES
+    (re.compile(r'(AMD\s+)?RYZEN\s+AI\s+MAX\s*[+]?\s*(\d{3})'), 'RYZEN', 1,
+     r"AMD Ryzen AI MAX+ \g<2>"),
+    (re.compile(r'(AMD\s+)?RYZEN\s+AI\s+MAX[+]?\s*(\d{3})'), 'RYZEN', 1,
+     r"AMD Ryzen AI MAX+ \g<2>"),
+    (re.compile(r'RYZEN\s+AI\s+MAX[+]?\s*(\d{3})'), 'RYZEN', 1,
+     r"AMD Ryzen AI MAX+ \g<1>"),
+
+    # 4. AMD RYZEN AI SERIES
+    (re.compile(r'(AMD\s+)?RYZEN\s+AI\s+([579])\s+(\d{3})'), 'RYZEN', 1,
+     r"AMD Ryzen AI \g<2> \g<3>"),
+    (re.compile(r'(AMD\s+)?RYZEN\s+AI\s+([579])\s*[-]?(\d{3})'), 'RYZEN', 1,
+     r"AMD Ryzen AI \g<2>-\g<3>"),
+
+    # 5. AMD RYZEN R-SERIES (R5, R7, R9) - PATTERN BARU
+    (re.compile(r'AMD\s+RYZEN\s+R([579])\s*[-]?(\d{4}[A-Z]*)'), 'RYZEN', 1,
+     r"AMD Ryzen \g<1> \g<2>"),
+    (re.compile(r'RYZEN\s+R([579])\s*[-]?(\d{4}[A-Z]*)'), 'RYZEN', 1,
+     r"AMD Ryzen \g<1> \g<2>"),
+    (re.compile(r'AMD\s+RYZEN\s+R([579])[-](\d{4}[A-Z]*)'), 'RYZEN', 1,
+     r"AMD Ryzen \g<1> \g<2>"),
+
+    # 6. AMD FX SERIES - PATTERN BARU
+    (re.compile(r'AMD\s+(FX\s*[-]?\s*(\d{4}[A-Z]?))'), 'AMD', 1,
+     r"AMD \g<1>"),
+    (re.compile(r'AMD\s+QUAD\s+CORE\s+(FX\s*[-]?\s*\d{4}[A-Z]?)'), 'QUAD', 1,
+     r"AMD \g<1>"),
+    (re.compile(r'\b(FX[-]?\d{4}[A-Z]?)\b'), 'FX', 1,
+     lambda m: f"AMD {m.group(1)}" if 'AMD' in m.string else None),
+
+    # 7. MediaTek Series
+    (re.compile(r'(MEDIATEK\s+(\d{4}[A-Z]?))'), 'MEDIATEK', 1,
+     r"MediaTek \g<2>"),
+    (re.compile(r'(MEDIATEK\s+([A-Z]?\d+))'), 'MEDIATEK', 1,
+     r"MediaTek \g<2>"),
+
+    # 8. Apple M Series
+    (re.compile(r'\b(APPLE\s+)?(M[1-9]\s*(?:PRO|MAX|ULTRA)?)\b'), 'M', 1,
+     r"Apple \g<2>"),
+
+    # 9. AMD Ryzen 3-digit (270, 370, dll)
+    (re.compile(r'AMD\s+RYZEN\s+([3579])\s+(\d{3})\b'), 'RYZEN', 1,
+     r"AMD Ryzen \g<1> \g<2>"),
+    (re.compile(r'RYZEN\s+([3579])\s+(\d{3})\b'), 'RYZEN', 1,
+     r"AMD Ryzen \g<1> \g<2>"),
+
+    # 10. Snapdragon X Series (traditional patterns)
+    (re.compile(r'(SNAPDRAGON\s+X\s+(ELITE\s+)?X?[1-9]E?-?\d{2,3}[A-Z]?)'), 'SNAPDRAGON', 1, 
+     lambda m: "Snapdragon X Elite" if 'ELITE' in m.group(0) else "Snapdragon X Series"),
+    (re.compile(r'(SNAPDRAGON\s+X\s+PLUS\s+X?1P-?\d{2}-?\d{2,3})'), 'SNAPDRAGON', 1,
+     r"Snapdragon X Plus"),
+
+    # 11. AMD A-Series (A4, A6, A8, A9, A10, A12)
+    (re.compile(r'AMD\s+(A[4689]|A10|A12)\s*[-]?(\d{4}[A-Z]?)'), 'AMD', 1,
+     r"AMD \g<1>-\g<2>"),
+    (re.compile(r'AMD\s+(A[4689]|A10|A12)\s*(\d{4}[A-Z]?)'), 'AMD', 1,
+     r"AMD \g<1>-\g<2>"),
+    (re.compile(r'\b(A[4689]|A10|A12)[-]?(\d{4}[A-Z]?)\b'), 'A', 1,
+     lambda m: f"AMD {m.group(1)}-{m.group(2)}" if 'AMD' in m.string else None),
+
+    # 12. AMD Dual Core A-series
+    (re.compile(r'AMD\s+DUAL\s+CORE\s+(A[4689][-]?\d{4}[A-Z]?)'), 'DUAL', 1,
+     r"AMD \g<1>"),
+
+    # 13. AMD Ryzen Series 4-digit dengan suffix lengkap (HS, H, U, dll)
+    (re.compile(r'AMD\s+RYZEN\s+([3579])\s+(\d{4}[A-Z]{1,2})'), 'RYZEN', 1,
+     r"AMD Ryzen \g<1> \g<2>"),
+    (re.compile(r'AMD\s+RYZEN\s+([3579])\s*[-]?(\d{4}[A-Z]{1,2})'), 'RYZEN', 1,
+     r"AMD Ryzen \g<1> \g<2>"),
+    (re.compile(r'RYZEN\s+([3579])\s+(\d{4}[A-Z]{1,2})'), 'RYZEN', 1,
+     r"AMD Ryzen \g<1> \g<2>"),
+
+    # 14. AMD Ryzen Series 4-digit standard (tanpa suffix atau suffix pendek)
+    (re.compile(r'AMD\s+RYZEN\s+([3579])\s+(\d{4}[A-Z]?)'), 'RYZEN', 1,
+     r"AMD Ryzen \g<1> \g<2>"),
+    (re.compile(r'AMD\s+RYZEN\s+([3579])\s*[-]?(\d{4}[A-Z]?)'), 'RYZEN', 1,
+     r"AMD Ryzen \g<1> \g<2>"),
+    (re.compile(r'RYZEN\s+([3579])\s+(\d{4}[A-Z]?)'), 'RYZEN', 1,
+     r"AMD Ryzen \g<1> \g<2>"),
+
+    # 15. Intel Core Ultra Series dengan suffix lengkap (HX, HK, dll) - PATTERN BARU DIPINDAHKAN LEBIH TINGGI
+    (re.compile(r'INTEL\s+CORE\s+ULTRA\s+([579])\s+(\d{3}[A-Z]{1,2})'), 'INTEL', 1,
+     r"Intel Core Ultra \g<1> \g<2>"),
+    (re.compile(r'CORE\s+ULTRA\s+([579])\s+(\d{3}[A-Z]{1,2})'), 'ULTRA', 1,
+     r"Intel Core Ultra \g<1> \g<2>"),
+    (re.compile(r'\b(ULTRA\s+[579]\s+\d{3}[A-Z]{1,2})\b'), 'ULTRA', 1,
+     r"Intel Core \g<1>"),
+
+    # 16. Intel Core i Series dengan suffix lengkap (HX, HK, HS, U, dll)
+    (re.compile(r'INTEL\s+CORE\s+(I[3579])\s+(\d{4,5}[A-Z]{1,2})'), 'INTEL', 1,
+     r"Intel Core \g<1>-\g<2>"),
+    (re.compile(r'CORE\s+(I[3579])\s+(\d{4,5}[A-Z]{1,2})'), 'CORE', 1,
+     r"Intel Core \g<1>-\g<2>"),
+    (re.compile(r'\b(I[3579][-]\d{4,5}[A-Z]{1,2})\b'), 'I', 1,
+     r"Intel Core \g<1>"),
+
+    # 17. Intel Core i Series dengan format angka lengkap (12450H, 13620H, 14900HX, dll)
+    (re.compile(r'INTEL\s+CORE\s+(I[3579])\s+(\d{5}[A-Z]{1,2})'), 'INTEL', 1,
+     r"Intel Core \g<1>-\g<2>"),
+    (re.compile(r'CORE\s+(I[3579])\s+(\d{5}[A-Z]{1,2})'), 'CORE', 1,
+     r"Intel Core \g<1>-\g<2>"),
+    (re.compile(r'\b(I[3579][-]\d{5}[A-Z]{1,2})\b'), 'I', 1,
+     r"Intel Core \g<1>"),
+
+    # 18. AMD Athlon Series
+    (re.compile(r'AMD\s+ATHLON\s+(\d{4}[A-Z]?)'), 'ATHLON', 1,
+     r"AMD Athlon \g<1>"),
+    (re.compile(r'AMD\s+ATHLON\s+(GOLD|SILVER)\s+(\d{4}[A-Z]?)'), 'ATHLON', 1,
+     r"AMD Athlon \g<1> \g<2>"),
+
+    # 19. Intel Xeon W-series (W-11855M, dll)
+    (re.compile(r'(XEON\s+(W-[1-9]\d{4}[A-Z]?))'), 'XEON', 1,
+     r"Intel Xeon \g<2>"),
+
+    # 20. AMD Ryzen AI Series (traditional)
+    (re.compile(r'(RYZEN\s+AI\s+([579])\s*(HX\s+)?(\d{3}))'), 'RYZEN', 1,
+     lambda m: f"AMD Ryzen AI {m.group(2)} {m.group(4)}" if not m.group(3) 
+     else f"AMD Ryzen AI {m.group(2)} HX {m.group(4)}"),
+
+    # 21. Intel Core Ultra Series (standard)
+    (re.compile(r'(CORE\s+ULTRA\s+([579])\s+(\d{3}[A-Z]))'), 'ULTRA', 2,
+     r"Intel Core Ultra \g<2> \g<3>"),
+
+    # 22. Intel Core i Series dengan berbagai format (standard)
+    (re.compile(r'(CORE\s+(I[3579])\s*[-]?(\d{4}[A-Z]?))'), 'CORE', 2,
+     r"Intel Core \g<2>-\g<3>"),
+    (re.compile(r'(CORE\s+(I[3579])\s+(\d{4}[A-Z]?))'), 'CORE', 2,
+     r"Intel Core \g<2> \g<3>"),
+    (re.compile(r'\b(I[3579][-]\d{4}[A-Z]?)\b'), 'I', 2,
+     r"Intel Core \g<1>"),
+
+    # 23. AMD Model Number dengan vendor eksplisit
+    (re.compile(r'AMD\s+(\d{4}[A-Z]{1,2})\b'), 'AMD', 2,
+     r"AMD \g<1>"),
+
+    # 24. Intel Core Standard Series
+    (re.compile(r'(CORE\s+([3579])\s+(\d{4}[A-Z]?))'), 'CORE', 2,
+     r"Intel Core \g<2> \g<3>"),
+
+    # 25. Intel Processor 4-digit dengan vendor eksplisit
+    (re.compile(r'INTEL\s+(\d{4}[A-Z])\b'), 'INTEL', 2,
+     r"Intel \g<1>"),
+
+    # 26. AMD Model Number Only (3020E, 3050U, 7735HS, etc)
+    (re.compile(r'\bAMD\s+(\d{4}[A-Z]{1,2})\b'), 'AMD', 2,
+     r"AMD \g<1>"),
+
+    # 27. Intel N Series
+    (re.compile(r'\b(INTEL\s+)?(N\d{3,4})\b'), 'N', 3,
+     r"Intel \g<2>"),
+
+    # 28. Intel Celeron/Pentium Specific
+    (re.compile(r'(CELERON\s+([NJ]?\d{4}[A-Z]?))'), 'CELERON', 3,
+     r"Intel Celeron \g<2>"),
+    (re.compile(r'(PENTIUM\s+(SILVER|GOLD)\s+([A-Z]?\d{4}))'), 'PENTIUM', 3,
+     r"Intel Pentium \g<2> \g<3>"),
+
+    # 29. Intel Xeon Series lainnya
+    (re.compile(r'(XEON\s+([E]\d?[-]\d{4}[A-Z]?)\s*(V\d+)?)'), 'XEON', 3,
+     lambda m: f"Intel Xeon {m.group(2)} {m.group(3)}" if m.group(3) 
+     else f"Intel Xeon {m.group(2)}"),
+    (re.compile(r'(XEON\s+([A-Z]?[1-9]\d{0,4}[A-Z]?))'), 'XEON', 3,
+     r"Intel Xeon \g<2>"),
+)
+
+_PROCESSOR_VENDOR_KEYWORDS = (
+    ('SNAPDRAGON X ELITE', 'Snapdragon X Elite'),
+    ('SNAPDRAGON X PLUS', 'Snapdragon X Plus'), 
+    ('SNAPDRAGON X', 'Snapdragon X'),
+    ('SNAPDRAGON 8', 'Snapdragon 8 Series'),
+    ('SNAPDRAGON 7', 'Snapdragon 7 Series'),
+    ('SNAPDRAGON 6', 'Snapdragon 6 Series'),
+    ('SNAPDRAGON 4', 'Snapdragon 4 Series'),
+    ('MICROSOFT SQ1', 'Microsoft SQ1'), 
+    ('MICROSOFT SQ2', 'Microsoft SQ2'), 
+    ('AMD RYZEN R5', 'AMD Ryzen 5'),
+    ('AMD RYZEN R7', 'AMD Ryzen 7'), 
+    ('AMD RYZEN R9', 'AMD Ryzen 9'),
+    ('AMD FX', 'AMD FX Series'),
+    ('AMD RYZEN AI MAX', 'AMD Ryzen AI MAX+ Series'),
+    ('AMD RYZEN AI', 'AMD Ryzen AI Series'),
+    ('MEDIATEK', 'MediaTek'),
+    ('AMD RYZEN 9', 'AMD Ryzen 9'),
+    ('AMD RYZEN 7', 'AMD Ryzen 7'),
+    ('AMD RYZEN 5', 'AMD Ryzen 5'),
+    ('AMD RYZEN 3', 'AMD Ryzen 3'),
+    ('AMD A4', 'AMD A4 Series'),
+    ('AMD A6', 'AMD A6 Series'),
+    ('AMD A8', 'AMD A8 Series'),
+    ('AMD A9', 'AMD A9 Series'),
+    ('AMD A10', 'AMD A10 Series'),
+    ('AMD DUAL CORE', 'AMD Dual Core'),
+    ('AMD ATHLON', 'AMD Athlon Series'),
+    ('SNAPDRAGON', 'Snapdragon Series'),
+    ('APPLE M1', 'Apple M1'),
+    ('APPLE M2', 'Apple M2'),
+    ('APPLE M3', 'Apple M3'),
+    ('INTEL XEON', 'Intel Xeon'),
+    ('INTEL CORE I7', 'Intel Core i7'),
+    ('INTEL CORE I5', 'Intel Core i5'),
+    ('INTEL CORE I3', 'Intel Core i3'),
+    ('INTEL CORE', 'Intel Core Series'),
+    ('INTEL CELERON', 'Intel Celeron'),
+    ('INTEL PENTIUM', 'Intel Pentium'),
+    ('INTEL ATOM', 'Intel Atom'),
+)
+# Satu scan Aho-Corasick untuk semua keyword vendor; entri paling awal di tabel tetap menang
+_PROCESSOR_VENDOR_MATCHER = _compile_keyword_rules(_PROCESSOR_VENDOR_KEYWORDS)
+
+_PROCESSOR_PATTERN_SET = _re2_rule_set([pattern.pattern for pattern, _, _, _ in _PROCESSOR_PATTERNS])
+_PROCESSOR_PATTERN_LITERALS = tuple(literal for _, literal, _, _ in _PROCESSOR_PATTERNS)
+
+_PROCESSOR_FINAL_PATTERNS = (
+    (re.compile(r'\b(MEDIATEK\s+\w+)'), 'MEDIATEK', r"\g<1>"),
+    (re.compile(r'\b(FX[-]?\d{4}[A-Z]?)\b'), 'FX', r"AMD \g<1>"),
+    (re.compile(r'\b(R[579][-]\d{4}[A-Z]?)\b'), 'R', r"AMD Ryzen \g<1>"),
+    (re.compile(r'\b(A[4689][-]?\d{4}[A-Z]?)\b'), 'A', r"AMD \g<1>"),
+    (re.compile(r'\b(I[3579][-]\d{4,5}[A-Z]{1,2})\b'), 'I', r"Intel Core \g<1>"),
+    (re.compile(r'\b(\d{4,5}[A-Z]{1,2})\b'), '', lambda m: f"AMD {m.group(1)}" if 'AMD' in m.string and not 'RADEON' in m.string else None),
+    (re.compile(r'\b(RYZEN\s+[3579]\s+\d{3,4}[A-Z]{0,2})\b'), 'RYZEN', r"AMD \g<1>"),
+    (re.compile(r'\b(CORE\s+[I3579]\s+\d{4,5}[A-Z]{0,2})\b'), 'CORE', r"Intel \g<1>"),
+    (re.compile(r'\b(I[3579])\s+(\d{4,5}[A-Z]{1,2})\b'), 'I', r"Intel Core \g<1>-\g<2>"),
+    (re.compile(r'\b(SNAPDRAGON\s+\d{3})'), 'SNAPDRAGON', lambda m: f"Snapdragon {m.group(1).replace('SNAPDRAGON ', '')}"),
+    (re.compile(r'\b(ULTRA\s+[579]\s+\d{3}[A-Z]{1,2})\b'), 'ULTRA', r"Intel Core \g<1>"),
+)
+_PROCESSOR_FINAL_PATTERN_SET = _re2_rule_set([pattern.pattern for pattern, _, _ in _PROCESSOR_FINAL_PATTERNS])
+_PROCESSOR_FINAL_PATTERN_LITERALS = tuple(literal for _, literal, _ in _PROCESSOR_FINAL_PATTERNS)
+
+# Kata yang menandakan angka/token milik spesifikasi lain (RAM, storage, GPU), bukan processor
+_NON_PROCESSOR_KEYWORDS = ('RAM', 'GB', 'SSD', 'HDD', 'VGA', 'RADEON', 'VEGA')
+
+def _follows_spec_keyword(text, token):
+    r"""
+    True if token occurs anywhere in text directly after one of _NON_PROCESSOR_KEYWORDS
+    (optionally separated by whitespace), i.e. re.search(r'(RAM|GB|...)\s*' + re.escape(token)).
+    """
+    start = text.find(token)
+    while start != -1:
+        if text[:start].rstrip().endswith(_NON_PROCESSOR_KEYWORDS):
+            return True
+        start = text.find(token, start + 1)
+    return False
 
 def extract_processor(product_name):
     """
     Extract and standardize the Processor name from the product name.
     """
-    name_upper = product_name.upper()
-    
-    # Mapping pattern untuk berbagai tipe processor dengan prioritas
-    processor_patterns = [
-        # 0. SNAPDRAGON X SERIES - PATTERN BARU DIPINDAHKAN LEBIH TINGGI
-        (r'SNAPDRAGON\s+X\s+ELITE\s+X?1E?-?\d{2}-?\d{2,3}', 1,
-         lambda m: "Snapdragon X Elite"),
-        (r'SNAPDRAGON\s+X\s+ELITE', 1,
-         lambda m: "Snapdragon X Elite"),
-        (r'SNAPDRAGON\s+X\s+PLUS\s+X?1P?-?\d{2}-?\d{2,3}', 1,
-         lambda m: "Snapdragon X Plus"),
-        (r'SNAPDRAGON\s+X\s+PLUS', 1,
-         lambda m: "Snapdragon X Plus"),
-        (r'SNAPDRAGON\s+X\s+X1[EP]', 1,
-         lambda m: "Snapdragon X Series"),
-        (r'SNAPDRAGON\s+X', 1,
-         lambda m: "Snapdragon X"),
-        
-        # 1. SNAPDRAGON TRADITIONAL SERIES (8xx series)
-        (r'SNAPDRAGON\s+(\d{3}[A-Z]?)', 1,
-         lambda m: f"Snapdragon {m.group(1)}"),
-        (r'SNAPDRAGON\s+(\d{3})\s+CORE', 1,
-         lambda m: f"Snapdragon {m.group(1)}"),
-        
-        # 2. MICROSOFT SQ SERIES
-        (r'MICROSOFT\s+SQ[12]', 1,
-        lambda m: f"Microsoft {m.group(0).replace('MICROSOFT ', '')}"),
-        (r'\bSQ[12]\b', 1,
-        lambda m: f"Microsoft {m.group(0)}"),
-
-        # 3. AMD RYZEN AI MAX+ SERIES
-        (r'(AMD\s+)?RYZEN\s+AI\s+MAX\s*[+]?\s*(\d{3})', 1,
-         lambda m: f"AMD Ryzen AI MAX+ {m.group(2)}"),
-        (r'(AMD\s+)?RYZEN\s+AI\s+MAX[+]?\s*(\d{3})', 1,
-         lambda m: f"AMD Ryzen AI MAX+ {m.group(2)}"),
-        (r'RYZEN\s+AI\s+MAX[+]?\s*(\d{3})', 1,
-         lambda m: f"AMD Ryzen AI MAX+ {m.group(1)}"),
-        
-        # 4. AMD RYZEN AI SERIES
-        (r'(AMD\s+)?RYZEN\s+AI\s+([579])\s+(\d{3})', 1,
-         lambda m: f"AMD Ryzen AI {m.group(2)} {m.group(3)}"),
-        (r'(AMD\s+)?RYZEN\s+AI\s+([579])\s*[-]?(\d{3})', 1,
-         lambda m: f"AMD Ryzen AI {m.group(2)}-{m.group(3)}"),
-        
-        # 5. AMD RYZEN R-SERIES (R5, R7, R9) - PATTERN BARU
-        (r'AMD\s+RYZEN\s+R([579])\s*[-]?(\d{4}[A-Z]*)', 1,
-         lambda m: f"AMD Ryzen {m.group(1)} {m.group(2)}"),
-        (r'RYZEN\s+R([579])\s*[-]?(\d{4}[A-Z]*)', 1,
-         lambda m: f"AMD Ryzen {m.group(1)} {m.group(2)}"),
-        (r'AMD\s+RYZEN\s+R([579])[-](\d{4}[A-Z]*)', 1,
-         lambda m: f"AMD Ryzen {m.group(1)} {m.group(2)}"),
-        
-        # 6. AMD FX SERIES - PATTERN BARU
-        (r'AMD\s+(FX\s*[-]?\s*(\d{4}[A-Z]?))', 1,
-         lambda m: f"AMD {m.group(1)}"),
-        (r'AMD\s+QUAD\s+CORE\s+(FX\s*[-]?\s*\d{4}[A-Z]?)', 1,
-         lambda m: f"AMD {m.group(1)}"),
-        (r'\b(FX[-]?\d{4}[A-Z]?)\b', 1,
-         lambda m: f"AMD {m.group(1)}" if 'AMD' in name_upper else None),
-        
-        # 7. MediaTek Series
-        (r'(MEDIATEK\s+(\d{4}[A-Z]?))', 1,
-         lambda m: f"MediaTek {m.group(2)}"),
-        (r'(MEDIATEK\s+([A-Z]?\d+))', 1,
-         lambda m: f"MediaTek {m.group(2)}"),
-        
-        # 8. Apple M Series
-        (r'\b(APPLE\s+)?(M[1-9]\s*(?:PRO|MAX|ULTRA)?)\b', 1,
-         lambda m: f"Apple {m.group(2)}"),
-        
-        # 9. AMD Ryzen 3-digit (270, 370, dll)
-        (r'AMD\s+RYZEN\s+([3579])\s+(\d{3})\b', 1,
-         lambda m: f"AMD Ryzen {m.group(1)} {m.group(2)}"),
-        (r'RYZEN\s+([3579])\s+(\d{3})\b', 1,
-         lambda m: f"AMD Ryzen {m.group(1)} {m.group(2)}"),
-        
-        # 10. Snapdragon X Series (traditional patterns)
-        (r'(SNAPDRAGON\s+X\s+(ELITE\s+)?X?[1-9]E?-?\d{2,3}[A-Z]?)', 1, 
-         lambda m: "Snapdragon X Elite" if 'ELITE' in m.group(0) else "Snapdragon X Series"),
-        (r'(SNAPDRAGON\s+X\s+PLUS\s+X?1P-?\d{2}-?\d{2,3})', 1,
-         lambda m: "Snapdragon X Plus"),
-        
-        # 11. AMD A-Series (A4, A6, A8, A9, A10, A12)
-        (r'AMD\s+(A[4689]|A10|A12)\s*[-]?(\d{4}[A-Z]?)', 1,
-         lambda m: f"AMD {m.group(1)}-{m.group(2)}"),
-        (r'AMD\s+(A[4689]|A10|A12)\s*(\d{4}[A-Z]?)', 1,
-         lambda m: f"AMD {m.group(1)}-{m.group(2)}"),
-        (r'\b(A[4689]|A10|A12)[-]?(\d{4}[A-Z]?)\b', 1,
-         lambda m: f"AMD {m.group(1)}-{m.group(2)}" if 'AMD' in name_upper else None),
-        
-        # 12. AMD Dual Core A-series
-        (r'AMD\s+DUAL\s+CORE\s+(A[4689][-]?\d{4}[A-Z]?)', 1,
-         lambda m: f"AMD {m.group(1)}"),
-        
-        # 13. AMD Ryzen Series 4-digit dengan suffix lengkap (HS, H, U, dll)
-        (r'AMD\s+RYZEN\s+([3579])\s+(\d{4}[A-Z]{1,2})', 1,
-         lambda m: f"AMD Ryzen {m.group(1)} {m.group(2)}"),
-        (r'AMD\s+RYZEN\s+([3579])\s*[-]?(\d{4}[A-Z]{1,2})', 1,
-         lambda m: f"AMD Ryzen {m.group(1)} {m.group(2)}"),
-        (r'RYZEN\s+([3579])\s+(\d{4}[A-Z]{1,2})', 1,
-         lambda m: f"AMD Ryzen {m.group(1)} {m.group(2)}"),
-        
-        # 14. AMD Ryzen Series 4-digit standard (tanpa suffix atau suffix pendek)
-        (r'AMD\s+RYZEN\s+([3579])\s+(\d{4}[A-Z]?)', 1,
-         lambda m: f"AMD Ryzen {m.group(1)} {m.group(2)}"),
-        (r'AMD\s+RYZEN\s+([3579])\s*[-]?(\d{4}[A-Z]?)', 1,
-         lambda m: f"AMD Ryzen {m.group(1)} {m.group(2)}"),
-        (r'RYZEN\s+([3579])\s+(\d{4}[A-Z]?)', 1,
-         lambda m: f"AMD Ryzen {m.group(1)} {m.group(2)}"),
-        
-        # 15. Intel Core Ultra Series dengan suffix lengkap (HX, HK, dll) - PATTERN BARU DIPINDAHKAN LEBIH TINGGI
-        (r'INTEL\s+CORE\s+ULTRA\s+([579])\s+(\d{3}[A-Z]{1,2})', 1,
-         lambda m: f"Intel Core Ultra {m.group(1)} {m.group(2)}"),
-        (r'CORE\s+ULTRA\s+([579])\s+(\d{3}[A-Z]{1,2})', 1,
-         lambda m: f"Intel Core Ultra {m.group(1)} {m.group(2)}"),
-        (r'\b(ULTRA\s+[579]\s+\d{3}[A-Z]{1,2})\b', 1,
-         lambda m: f"Intel Core {m.group(1)}"),
-        
-        # 16. Intel Core i Series dengan suffix lengkap (HX, HK, HS, U, dll)
-        (r'INTEL\s+CORE\s+(I[3579])\s+(\d{4,5}[A-Z]{1,2})', 1,
-         lambda m: f"Intel Core {m.group(1)}-{m.group(2)}"),
-        (r'CORE\s+(I[3579])\s+(\d{4,5}[A-Z]{1,2})', 1,
-         lambda m: f"Intel Core {m.group(1)}-{m.group(2)}"),
-        (r'\b(I[3579][-]\d{4,5}[A-Z]{1,2})\b', 1,
-         lambda m: f"Intel Core {m.group(1)}"),
-        
-        # 17. Intel Core i Series dengan format angka lengkap (12450H, 13620H, 14900HX, dll)
-        (r'INTEL\s+CORE\s+(I[3579])\s+(\d{5}[A-Z]{1,2})', 1,
-         lambda m: f"Intel Core {m.group(1)}-{m.group(2)}"),
-        (r'CORE\s+(I[3579])\s+(\d{5}[A-Z]{1,2})', 1,
-         lambda m: f"Intel Core {m.group(1)}-{m.group(2)}"),
-        (r'\b(I[3579][-]\d{5}[A-Z]{1,2})\b', 1,
-         lambda m: f"Intel Core {m.group(1)}"),
-        
-        # 18. AMD Athlon Series
-        (r'AMD\s+ATHLON\s+(\d{4}[A-Z]?)', 1,
-         lambda m: f"AMD Athlon {m.group(1)}"),
-        (r'AMD\s+ATHLON\s+(GOLD|SILVER)\s+(\d{4}[A-Z]?)', 1,
-         lambda m: f"AMD Athlon {m.group(1)} {m.group(2)}"),
-        
-        # 19. Intel Xeon W-series (W-11855M, dll)
-        (r'(XEON\s+(W-[1-9]\d{4}[A-Z]?))', 1,
-         lambda m: f"Intel Xeon {m.group(2)}"),
-        
-        # 20. AMD Ryzen AI Series (traditional)
-        (r'(RYZEN\s+AI\s+([579])\s*(HX\s+)?(\d{3}))', 1,
-         lambda m: f"AMD Ryzen AI {m.group(2)} {m.group(4)}" if not m.group(3) 
-         else f"AMD Ryzen AI {m.group(2)} HX {m.group(4)}"),
-        
-        # 21. Intel Core Ultra Series (standard)
-        (r'(CORE\s+ULTRA\s+([579])\s+(\d{3}[A-Z]))', 2,
-         lambda m: f"Intel Core Ultra {m.group(2)} {m.group(3)}"),
-        
-        # 22. Intel Core i Series dengan berbagai format (standard)
-        (r'(CORE\s+(I[3579])\s*[-]?(\d{4}[A-Z]?))', 2,
-         lambda m: f"Intel Core {m.group(2)}-{m.group(3)}"),
-        (r'(CORE\s+(I[3579])\s+(\d{4}[A-Z]?))', 2,
-         lambda m: f"Intel Core {m.group(2)} {m.group(3)}"),
-        (r'\b(I[3579][-]\d{4}[A-Z]?)\b', 2,
-         lambda m: f"Intel Core {m.group(1)}"),
-        
-        # 23. AMD Model Number dengan vendor eksplisit
-        (r'AMD\s+(\d{4}[A-Z]{1,2})\b', 2,
-         lambda m: f"AMD {m.group(1)}"),
-        
-        # 24. Intel Core Standard Series
-        (r'(CORE\s+([3579])\s+(\d{4}[A-Z]?))', 2,
-         lambda m: f"Intel Core {m.group(2)} {m.group(3)}"),
-        
-        # 25. Intel Processor 4-digit dengan vendor eksplisit
-        (r'INTEL\s+(\d{4}[A-Z])\b', 2,
-         lambda m: f"Intel {m.group(1)}"),
-        
-        # 26. AMD Model Number Only (3020E, 3050U, 7735HS, etc)
-        (r'\bAMD\s+(\d{4}[A-Z]{1,2})\b', 2,
-         lambda m: f"AMD {m.group(1)}"),
-        
-        # 27. Intel N Series
-        (r'\b(INTEL\s+)?(N\d{3,4})\b', 3,
-         lambda m: f"Intel {m.group(2)}"),
-        
-        # 28. Intel Celeron/Pentium Specific
-        (r'(CELERON\s+([NJ]?\d{4}[A-Z]?))', 3,
-         lambda m: f"Intel Celeron {m.group(2)}"),
-        (r'(PENTIUM\s+(SILVER|GOLD)\s+([A-Z]?\d{4}))', 3,
-         lambda m: f"Intel Pentium {m.group(2)} {m.group(3)}"),
-        
-        # 29. Intel Xeon Series lainnya
-        (r'(XEON\s+([E]\d?[-]\d{4}[A-Z]?)\s*(V\d+)?)', 3,
-         lambda m: f"Intel Xeon {m.group(2)} {m.group(3)}" if m.group(3) 
-         else f"Intel Xeon {m.group(2)}"),
-        (r'(XEON\s+([A-Z]?[1-9]\d{0,4}[A-Z]?))', 3,
-         lambda m: f"Intel Xeon {m.group(2)}"),
-    ]
+    return _extract_processor_upper(product_name.upper())
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _extract_processor_upper(name_upper):
+    """Cached core of extract_processor on the uppercased name (extract_specs uppercases once)."""
 
     # Cari pattern dengan priority tertinggi
-    for pattern, priority, formatter in processor_patterns:
-        match = re.search(pattern, name_upper)
+    # RE2 Set menyaring pattern yang cocok dalam satu pass; urutan prioritas tetap dari tabel
+    for i in _rule_candidates(_PROCESSOR_PATTERN_SET, _PROCESSOR_PATTERN_LITERALS, name_upper):
+        pattern, _, priority, formatter = _PROCESSOR_PATTERNS[i]
+        match = pattern.search(name_upper)
         if match:
-            result = formatter(match)
+            result = match.expand(formatter) if isinstance(formatter, str) else formatter(match)
             if result:  # Skip None results
                 return result
     
     # Fallback: Deteksi berdasarkan vendor dan pattern umum
-    vendor_keywords = [
-        ('SNAPDRAGON X ELITE', 'Snapdragon X Elite'),
-        ('SNAPDRAGON X PLUS', 'Snapdragon X Plus'), 
-        ('SNAPDRAGON X', 'Snapdragon X'),
-        ('SNAPDRAGON 8', 'Snapdragon 8 Series'),
-        ('SNAPDRAGON 7', 'Snapdragon 7 Series'),
-        ('SNAPDRAGON 6', 'Snapdragon 6 Series'),
-        ('SNAPDRAGON 4', 'Snapdragon 4 Series'),
-        ('MICROSOFT SQ1', 'Microsoft SQ1'), 
-        ('MICROSOFT SQ2', 'Microsoft SQ2'), 
-        ('AMD RYZEN R5', 'AMD Ryzen 5'),
-        ('AMD RYZEN R7', 'AMD Ryzen 7'), 
-        ('AMD RYZEN R9', 'AMD Ryzen 9'),
-        ('AMD FX', 'AMD FX Series'),
-        ('AMD RYZEN AI MAX', 'AMD Ryzen AI MAX+ Series'),
-        ('AMD RYZEN AI', 'AMD Ryzen AI Series'),
-        ('MEDIATEK', 'MediaTek'),
-        ('AMD RYZEN 9', 'AMD Ryzen 9'),
-        ('AMD RYZEN 7', 'AMD Ryzen 7'),
-        ('AMD RYZEN 5', 'AMD Ryzen 5'),
-        ('AMD RYZEN 3', 'AMD Ryzen 3'),
-        ('AMD A4', 'AMD A4 Series'),
-        ('AMD A6', 'AMD A6 Series'),
-        ('AMD A8', 'AMD A8 Series'),
-        ('AMD A9', 'AMD A9 Series'),
-        ('AMD A10', 'AMD A10 Series'),
-        ('AMD DUAL CORE', 'AMD Dual Core'),
-        ('AMD ATHLON', 'AMD Athlon Series'),
-        ('SNAPDRAGON', 'Snapdragon Series'),
-        ('APPLE M1', 'Apple M1'),
-        ('APPLE M2', 'Apple M2'),
-        ('APPLE M3', 'Apple M3'),
-        ('INTEL XEON', 'Intel Xeon'),
-        ('INTEL CORE I7', 'Intel Core i7'),
-        ('INTEL CORE I5', 'Intel Core i5'),
-        ('INTEL CORE I3', 'Intel Core i3'),
-        ('INTEL CORE', 'Intel Core Series'),
-        ('INTEL CELERON', 'Intel Celeron'),
-        ('INTEL PENTIUM', 'Intel Pentium'),
-        ('INTEL ATOM', 'Intel Atom'),
-    ]
-    
-    for keyword, processor_name in vendor_keywords:
-        if keyword in name_upper:
-            return processor_name
+    processor_name = _first_keyword_label(_PROCESSOR_VENDOR_MATCHER, name_upper)
+    if processor_name:
+        return processor_name
     
     # Final fallback: Cari berbagai pattern yang mungkin terlewat dengan pengecekan RADEON
-    final_patterns = [
-        (r'\b(MEDIATEK\s+\w+)', lambda m: m.group(1)),
-        (r'\b(FX[-]?\d{4}[A-Z]?)\b', lambda m: f"AMD {m.group(1)}"),
-        (r'\b(R[579][-]\d{4}[A-Z]?)\b', lambda m: f"AMD Ryzen {m.group(1)}"),
-        (r'\b(A[4689][-]?\d{4}[A-Z]?)\b', lambda m: f"AMD {m.group(1)}"),
-        (r'\b(I[3579][-]\d{4,5}[A-Z]{1,2})\b', lambda m: f"Intel Core {m.group(1)}"),
-        (r'\b(\d{4,5}[A-Z]{1,2})\b', lambda m: f"AMD {m.group(1)}" if 'AMD' in name_upper and not 'RADEON' in name_upper else None),
-        (r'\b(RYZEN\s+[3579]\s+\d{3,4}[A-Z]{0,2})\b', lambda m: f"AMD {m.group(1)}"),
-        (r'\b(CORE\s+[I3579]\s+\d{4,5}[A-Z]{0,2})\b', lambda m: f"Intel {m.group(1)}"),
-        (r'\b(I[3579])\s+(\d{4,5}[A-Z]{1,2})\b', lambda m: f"Intel Core {m.group(1)}-{m.group(2)}"),
-        (r'\b(SNAPDRAGON\s+\d{3})', lambda m: f"Snapdragon {m.group(1).replace('SNAPDRAGON ', '')}"),
-        (r'\b(ULTRA\s+[579]\s+\d{3}[A-Z]{1,2})\b', lambda m: f"Intel Core {m.group(1)}"),
-    ]
-    
-    for pattern, formatter in final_patterns:
-        match = re.search(pattern, name_upper)
+    for i in _rule_candidates(_PROCESSOR_FINAL_PATTERN_SET, _PROCESSOR_FINAL_PATTERN_LITERALS, name_upper):
+        pattern, _, formatter = _PROCESSOR_FINAL_PATTERNS[i]
+        match = pattern.search(name_upper)
         if match:
-            result = formatter(match)
+            result = match.expand(formatter) if isinstance(formatter, str) else formatter(match)
             # Pastikan ini bukan bagian dari spesifikasi lain dan BUKAN RADEON GPU
-            if result and not re.search(r'(RAM|GB|SSD|HDD|VGA|RADEON|VEGA)\s*' + re.escape(match.group(0)), name_upper):
-                logger.debug(f"Processor detected: {result} from '{product_name}'")
+            if result and not _follows_spec_keyword(name_upper, match.group(0)):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Processor detected: {result} from '{name_upper}'")
                 return result
     
-    logger.debug(f"Unknown processor in '{product_name}'")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Unknown processor in '{name_upper}'")
     return 'Unknown Processor'
 
+# Daftar model per kategori untuk standardize_processor. Semua token dicari sekaligus
+# (satu scan Aho-Corasick bila tersedia); hasilnya himpunan nama grup yang muncul.
+_PROCESSOR_MODEL_GROUPS = {
+    # Ryzen AI MAX+ (395 / 390 flagship, 385 mid-high)
+    'ai_max_9': (' 395', ' MAX+ 395', ' MAX 395', ' 390', ' MAX+ 390', ' MAX 390'),
+    'ai_max_7': (' 385', ' MAX+ 385', ' MAX 385'),
+    # Ryzen AI
+    'ai_9': (' AI 9', '365', '370', '375'),
+    'ai_7': (' AI 7', '350'),
+    'ai_5': (' AI 5', '340'),
+    # Ryzen AI (fallback di cabang RYZEN)
+    'ai_9_fallback': (' AI 9', '365', '370', '375', '395'),
+    'ai_7_fallback': (' AI 7', '350', '385'),
+    # Intel N-Series & low power
+    'n_series': (
+        ' N100', ' N150', ' N200', ' N300', ' N305', ' N355',
+        ' N3350', ' N3450', ' N4000', ' N4020', ' N4120', ' N4500',
+        ' N5000', ' N5030', ' N5100', ' N5105', ' N6000', ' N6210',
+        ' N6211', ' N6230', ' N6410', ' N6420'
+    ),
+    'core_n': ('-N100', '-N200', '-N300', '-N305', '-N355'),
+    # Intel Pentium/Celeron berdasarkan model
+    'pentium': ('6405', '4415', '4410', '5405', '4425', 'G6500', 'G6400', '7505'),
+    'celeron': ('5205', '5305', 'N5100', 'N4500', 'N4020', 'N4000', 'N3350', 'N3450'),
+    # Ryzen berdasarkan angka model
+    'ryzen_9': (' 6900', ' 6980', ' 7945', ' 7845', ' 8940', ' 8945', ' 9955'),
+    'ryzen_7': (' 5800', ' 5700', ' 6800', ' 7735', ' 8840', ' 7840', ' 7745', ' 8845H', ' 8845HS'),
+    'ryzen_5': (' 3500', ' 4500', ' 5500', ' 5600', ' 6600', ' 7520', ' 7530', ' 7535', ' 7640', ' 8645'),
+    'ryzen_3': (' 3200', ' 3250', ' 3300', ' 4300', ' 5300', ' 7320', ' 7330', ' 7425'),
+    # Apple Silicon
+    'apple_m': (' M1', ' M2', ' M3', ' M4'),
+}
+
+# Intel 4 digit + suffix tanpa nama seri (4305U, 6305U, 6405U, dll)
+_INTEL_4DIGIT_MODEL_RE = re.compile(r'\b(\d{4})[A-Z]\b')
+_INTEL_4DIGIT_PENTIUM = frozenset({'4305', '6305', '6405'})
+_INTEL_4DIGIT_CELERON = frozenset({'5205', '5305'})
+
+def _group_automaton(groups):
+    """Aho-Corasick automaton mapping each token to the groups that list it (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    token_groups = {}
+    for group, tokens in groups.items():
+        for token in tokens:
+            token_groups.setdefault(token, set()).add(group)
+    automaton = ahocorasick.Automaton()
+    for token, names in token_groups.items():
+        automaton.add_word(token, frozenset(names))
+    automaton.make_automaton()
+    return automaton
+
+_PROCESSOR_MODEL_AC = _group_automaton(_PROCESSOR_MODEL_GROUPS)
+
+def _processor_model_groups(processor_upper):
+    """Names of the _PROCESSOR_MODEL_GROUPS with at least one token in processor_upper."""
+    if _PROCESSOR_MODEL_AC is None:
+        return {group for group, tokens in _PROCESSOR_MODEL_GROUPS.items()
+                if any(token in processor_upper for token in tokens)}
+    return {group for _, names in _PROCESSOR_MODEL_AC.iter(processor_upper) for group in names}
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
 def standardize_processor(processor):
     """
     Standardize and group processors into more structured categories
@@ -884,6 +1059,7 @@ def standardize_processor(processor):
         return 'Unknown Category'
         
     processor_upper = str(processor).upper()
+    models = _processor_model_groups(processor_upper)
     
     # 1. INTEL XEON SERIES
     if 'XEON' in processor_upper:
@@ -896,46 +1072,34 @@ def standardize_processor(processor):
     # 3. AMD RYZEN AI MAX+ SERIES - PATTERN BARU (priority tertinggi)
     if 'RYZEN AI MAX+' in processor_upper or 'RYZEN AI MAX' in processor_upper:
         # Ryzen AI MAX+ 395 adalah flagship, setara dengan Ryzen 9
-        if any(model in processor_upper for model in [' 395', ' MAX+ 395', ' MAX 395']):
+        # 390 juga high-end, 385 mid-high end
+        if 'ai_max_9' in models:
             return 'AMD Ryzen 9'
-        elif any(model in processor_upper for model in [' 390', ' MAX+ 390', ' MAX 390']):
-            return 'AMD Ryzen 9'  # Juga high-end
-        elif any(model in processor_upper for model in [' 385', ' MAX+ 385', ' MAX 385']):
-            return 'AMD Ryzen 7'  # Mid-high end
+        elif 'ai_max_7' in models:
+            return 'AMD Ryzen 7'
         else:
             return 'AMD Ryzen 9'  # Default untuk AI MAX+ series
     
     # 4. AMD RYZEN AI SERIES
     if 'RYZEN AI' in processor_upper:
-        if 'RYZEN AI 9' in processor_upper or any(model in processor_upper for model in [' AI 9', '365', '370', '375']):
+        if 'RYZEN AI 9' in processor_upper or 'ai_9' in models:
             return 'AMD Ryzen 9'
-        elif 'RYZEN AI 7' in processor_upper or any(model in processor_upper for model in [' AI 7', '350']):
+        elif 'RYZEN AI 7' in processor_upper or 'ai_7' in models:
             return 'AMD Ryzen 7'
-        elif 'RYZEN AI 5' in processor_upper or any(model in processor_upper for model in [' AI 5', '340']):
+        elif 'RYZEN AI 5' in processor_upper or 'ai_5' in models:
             return 'AMD Ryzen 5'
         else:
             return 'AMD Ryzen Series'
     
     # 5. INTEL N-SERIES & LOW POWER
-    if any(n_series in processor_upper for n_series in [
-        ' N100', ' N150', ' N200', ' N300', ' N305', ' N355',
-        ' N3350', ' N3450', ' N4000', ' N4020', ' N4120', ' N4500', 
-        ' N5000', ' N5030', ' N5100', ' N5105', ' N6000', ' N6210',
-        ' N6211', ' N6230', ' N6410', ' N6420'
-    ]):
+    if 'n_series' in models:
         return 'Intel N-Series'
     
     # 6. INTEL PENTIUM/CELERON BERDASARKAN MODEL
-    pentium_models = ['6405', '4415', '4410', '5405', '4425', 'G6500', 'G6400', '7505']
-    celeron_models = ['5205', '5305', 'N5100', 'N4500', 'N4020', 'N4000', 'N3350', 'N3450']
-    
-    for model in pentium_models:
-        if model in processor_upper:
-            return 'Intel Pentium'
-    
-    for model in celeron_models:
-        if model in processor_upper:
-            return 'Intel Celeron'
+    if 'pentium' in models:
+        return 'Intel Pentium'
+    if 'celeron' in models:
+        return 'Intel Celeron'
     
     # 7. INTEL CORE SERIES (termasuk Core Ultra)
     if 'INTEL CORE ULTRA' in processor_upper:
@@ -949,7 +1113,7 @@ def standardize_processor(processor):
             return 'Intel Core i5'
         elif 'I3' in processor_upper:
             return 'Intel Core i3'
-        elif any(n_series in processor_upper for n_series in ['-N100', '-N200', '-N300', '-N305', '-N355']):
+        elif 'core_n' in models:
             return 'Intel Core i3'
         else:
             return 'Intel Core Series'
@@ -958,57 +1122,56 @@ def standardize_processor(processor):
     elif 'RYZEN' in processor_upper:
         # Fallback untuk Ryzen AI (seharusnya sudah ditangani di atas)
         if 'RYZEN AI' in processor_upper:
-            if any(model in processor_upper for model in [' AI 9', '365', '370', '375', '395']):
+            if 'ai_9_fallback' in models:
                 return 'AMD Ryzen 9'
-            elif any(model in processor_upper for model in [' AI 7', '350', '385']):
+            elif 'ai_7_fallback' in models:
                 return 'AMD Ryzen 7'
-            elif any(model in processor_upper for model in [' AI 5', '340']):
+            elif 'ai_5' in models:
                 return 'AMD Ryzen 5'
         
         # Standard Ryzen series - PERBAIKAN URUTAN DAN MODEL
-        if 'RYZEN 9' in processor_upper or any(model in processor_upper for model in [' 6900', ' 6980', ' 7945', ' 7845', ' 8940', ' 8945', ' 9955']):
+        if 'RYZEN 9' in processor_upper or 'ryzen_9' in models:
             return 'AMD Ryzen 9'
-        elif 'RYZEN 7' in processor_upper or any(model in processor_upper for model in [' 5800', ' 5700', ' 6800', ' 7735', ' 8840', ' 7840', ' 7745', ' 8845H', ' 8845HS']):
+        elif 'RYZEN 7' in processor_upper or 'ryzen_7' in models:
             return 'AMD Ryzen 7'
-        elif 'RYZEN 5' in processor_upper or any(model in processor_upper for model in [' 3500', ' 4500', ' 5500', ' 5600', ' 6600', ' 7520', ' 7530', ' 7535', ' 7640', ' 8645']):
+        elif 'RYZEN 5' in processor_upper or 'ryzen_5' in models:
             return 'AMD Ryzen 5'
-        elif 'RYZEN 3' in processor_upper or any(model in processor_upper for model in [' 3200', ' 3250', ' 3300', ' 4300', ' 5300', ' 7320', ' 7330', ' 7425']):
+        elif 'RYZEN 3' in processor_upper or 'ryzen_3' in models:
             return 'AMD Ryzen 3'
         else:
             return 'AMD Ryzen Series'
     
     # 9. AMD PROCESSOR dengan format angka saja (3020E, 7120U, dll) - REVISI MENJADI ENTRY-LEVEL
     elif processor_upper.startswith('AMD ') and any(char.isdigit() for char in processor_upper):
-        # Cek model Ryzen AI MAX+ (fallback)
-        if any(model in processor_upper for model in [' 395', ' 390']):
+        # Cek model Ryzen AI MAX+ (fallback): setiap token grup mengandung ' 395' / ' 390' / ' 385'
+        if 'ai_max_9' in models:
             return 'AMD Ryzen 9'
-        elif any(model in processor_upper for model in [' 385']):
+        elif 'ai_max_7' in models:
             return 'AMD Ryzen 7'
         
         # Cek model Ryzen berdasarkan angka - PERBAIKAN: SEMUA MODEL 4-DIGIT TANPA RYZEN ADALAH ENTRY-LEVEL
-        if any(model in processor_upper for model in [' 6900', ' 6980', ' 7945', ' 7845', ' 8940', ' 8945', ' 9955']):
+        if 'ryzen_9' in models:
             return 'AMD Ryzen 9'
-        elif any(model in processor_upper for model in [' 5800', ' 5700', ' 6800', ' 7735', ' 8840', ' 7840', ' 7745', ' 8845H', ' 8845HS']):
+        elif 'ryzen_7' in models:
             return 'AMD Ryzen 7'
-        elif any(model in processor_upper for model in [' 3500', ' 4500', ' 5500', ' 5600', ' 6600', ' 7520', ' 7530', ' 7535', ' 7640', ' 8645']):
+        elif 'ryzen_5' in models:
             return 'AMD Ryzen 5'
-        elif any(model in processor_upper for model in [' 3200', ' 3250', ' 3300', ' 4300', ' 5300', ' 7320', ' 7330', ' 7425']):
+        elif 'ryzen_3' in models:
             return 'AMD Ryzen 3'
         # SEMUA MODEL LAIN SEPERTI 3020E, 7120U, DLL ADALAH ENTRY-LEVEL
         else:
             return 'AMD Entry-Level'
     
     # 10. INTEL PROCESSOR 4-DIGIT (4305U, 6305U, 6405U, dll)
-    if processor_upper.startswith('INTEL ') and re.search(r'\b\d{4}[A-Z]\b', processor_upper):
-        model_match = re.search(r'\b(\d{4})[A-Z]\b', processor_upper)
-        if model_match:
-            model = model_match.group(1)
-            if model in ['4305', '6305', '6405']:
-                return 'Intel Pentium'
-            elif model in ['5205', '5305']:
-                return 'Intel Celeron'
-            else:
-                return 'Intel Other'
+    model_match = _INTEL_4DIGIT_MODEL_RE.search(processor_upper) if processor_upper.startswith('INTEL ') else None
+    if model_match:
+        model = model_match.group(1)
+        if model in _INTEL_4DIGIT_PENTIUM:
+            return 'Intel Pentium'
+        elif model in _INTEL_4DIGIT_CELERON:
+            return 'Intel Celeron'
+        else:
+            return 'Intel Other'
     
     # 11. INTEL PENTIUM/CELERON/ATOM (berdasarkan keyword)
     elif 'PENTIUM' in processor_upper:
@@ -1025,7 +1188,7 @@ def standardize_processor(processor):
         return 'AMD Entry-Level'
     
     # 13. APPLE SILICON
-    elif 'APPLE' in processor_upper or any(m_series in processor_upper for m_series in [' M1', ' M2', ' M3', ' M4']):
+    elif 'APPLE' in processor_upper or 'apple_m' in models:
         return 'Apple Silicon'
     
     # 14. QUALCOMM SNAPDRAGON
@@ -1046,32 +1209,229 @@ def standardize_processor(processor):
     else:
         return 'Unknown Category'
     
+# ---------------------------------------------------------------------------
+# extract_gpu patterns, compiled once at import
+# ---------------------------------------------------------------------------
+def _model_number(model):
+    """Leading digits of a model token as int ('940MX' -> 940); tokens come from \\d{3,4}... captures."""
+    end = 0
+    while end < len(model) and model[end].isdigit():
+        end += 1
+    return int(model[:end])
+
+# Deteksi produk Apple dengan M series processor
+_APPLE_M_GPU_RE = re.compile('|'.join([
+    r'APPLE\s+M[1-4]\s*(?:PRO|MAX|ULTRA)?\s*(?:\d+-CORE\s*CPU)?\s*(?:\d+-CORE\s*GPU)',
+    r'MACBOOK\s+(?:AIR|PRO)\s+M[1-4]',
+    r'APPLE\s+M[1-4][^.]*(?:CPU|GPU)',
+    r'MACBOOK[^.]*M[1-4]',
+]))
+_APPLE_GPU_KEYWORDS = (
+    'MACBOOK', 'IMAC', 'MAC MINI', 'MAC PRO', 'MAC STUDIO', 'APPLE M1', 'APPLE M2', 'APPLE M3', 'APPLE M4', 'MAC OS'
+)
+
+# Mapping pattern untuk berbagai tipe GPU dengan prioritas
+_GPU_PATTERN_TABLE = [
+    # 3. AMD Radeon Pro Series (Pro 555X, Pro 560X, dll) - PATTERN BARU DIPINDAHKAN LEBIH TINGGI
+    (r'RADEON\s+PRO\s+(\d{3,4}[A-Z]?)\b', 'RADEON', 1,
+     r"Radeon Pro \g<1>"),
+
+    # 4. AMD Radeon 800M Series (890M, 880M, dll)
+    (r'RADEON\s+(8[89]\dM)\b', 'RADEON', 1,
+     r"Radeon \g<1>"),
+
+    # 5. AMD Radeon 700M Series (780M, 760M, 740M, dll)
+    (r'RADEON\s+(7[4-8]\dM)\b', 'RADEON', 1,
+     r"Radeon \g<1>"),
+
+    # 6. AMD Radeon 600M Series (680M, 660M, 610M, dll)
+    (r'RADEON\s+(6[1-8]\dM)\b', 'RADEON', 1,
+     r"Radeon \g<1>"),
+
+    # 7. AMD Radeon Vega series (Vega 7, Vega 8, Vega 10, dll)
+    (r'(?:ATI\s)?RADEON\s+(VEGA\s?[2-9]|VEGA\s?10)\b', 'RADEON', 1,
+     r"Radeon \g<1>"),
+
+    # 8. AMD Radeon R series (R5, R7, R8, R9) - PATTERN REVISI: HANYA AMBIL R5/R7/R8/R9
+    (r'RADEON\s+(R[5-9])\s+[A-Z]\d+[A-Z]+\b', 'RADEON', 1,
+     r"Radeon \g<1>"),
+
+    # 9. AMD Radeon R series basic (R5, R7, R8, R9)
+    (r'RADEON\s+(R[5-9])\b', 'RADEON', 1,
+     r"Radeon \g<1>"),
+
+    # 10. NVIDIA RTX 40 series (4050, 4060, 4070, 4080, 4090)
+    (r'(RTX)\s*(\d{4})\b', 'RTX', 1,
+     r"\g<1> \g<2>"),
+
+    # 11. NVIDIA RTX 30 series (3050, 3060, 3070, 3080, 3090)
+    (r'(RTX)\s*(\d{4})\b', 'RTX', 1,
+     r"\g<1> \g<2>"),
+
+    # 12. NVIDIA RTX 20 series (2050, 2060, 2070, 2080)
+    (r'(RTX)\s*(\d{4})\b', 'RTX', 1,
+     r"\g<1> \g<2>"),
+
+    # 13. NVIDIA GTX 16 series (1650, 1660)
+    (r'(GTX)\s*(\d{4})\b', 'GTX', 1,
+     r"\g<1> \g<2>"),
+
+    # 14. NVIDIA GTX 10 series (1050, 1060, 1070, 1080)
+    (r'(GTX)\s*(\d{4})\b', 'GTX', 1,
+     r"\g<1> \g<2>"),
+
+    # 15. NVIDIA GeForce M-series (920M, 940M, 970M, dll) - DIPINDAH KE BAWAH
+    (r'(GEFORCE\s+)?(\d{3,4}[A-Z]?M)\b', 'M', 5,
+     lambda m: f"GTX {m.group(2)}" if _model_number(m.group(2)) >= 1000 
+     else f"GT{m.group(2)}"),
+
+    # 16. NVIDIA Quadro T-series (T600, T500, T1000, T2000)
+    (r'(QUADRO\s+)?(T[1-6]\d{2,3})\b', 'T', 2,
+     r"Quadro \g<2>"),
+
+    # 17. NVIDIA RTX A-series (A500, A1000, A2000, A3000, A4000, A5000)
+    (r'(RTX\s+)?(A[1-5]\d{3})\b', 'A', 2,
+     r"RTX \g<2>"),
+
+    # 18. NVIDIA GeForce RTX/GTX dengan Ti
+    (r'(RTX|GTX)\s*(\d{4})\s*(TI)', 'TI', 2,
+     r"\g<1> \g<2> Ti"),
+
+    # 19. NVIDIA GeForce MX series
+    (r'(MX\s*(\d{3}))', 'MX', 3,
+     r"MX \g<2>"),
+
+    # 20. NVIDIA GeForce GT series (tanpa X)
+    (r'(GT\s*\d{3,4}[A-Z]?)', 'GT', 3,
+     lambda m: m.group(1).replace(' ', '')),
+
+    # 21. NVIDIA Quadro P-series (P1000, P2000, P3200, P4200)
+    (r'(QUADRO\s+)?(P[1-4]\d{3}[A-Z]?)', 'P', 3,
+     r"Quadro \g<2>"),
+
+    # 22. NVIDIA Quadro M-series (M2000M, M3000M, M2200M)
+    (r'(QUADRO\s+)?(M[1-3]\d{3}[A-Z]?)', 'M', 3,
+     r"Quadro \g<2>"),
+
+    # 23. AMD Radeon RX series
+    (r'(RX\s*(\d{4})\s*([M]?))', 'RX', 3,
+     r"Radeon RX \g<2>\g<3>"),
+
+    # 24. Intel Iris Xe Graphics - PRIORITY DITINGKATKAN
+    (r'IRIS\s?XE', 'IRIS', 1,
+     r"Intel Iris Xe Graphics"),
+
+    # 25. Intel Arc Graphics - PATTERN BARU
+    (r'INTEL\s+ARC', 'INTEL', 1,
+     r"Intel Arc Graphics"),
+
+    # 26. Intel UHD/HD Graphics dengan seri spesifik
+    (r'INTEL\s+(UHD|HD)\s+GRAPHICS\s+(\d+)', 'GRAPHICS', 2,
+     r"Intel \g<1> Graphics \g<2>"),
+
+    # 27. Intel UHD Graphics
+    (r'INTEL\s+UHD', 'INTEL', 2,
+     r"Intel UHD Graphics"),
+
+    # 28. Intel HD Graphics
+    (r'INTEL\s+HD', 'INTEL', 2,
+     r"Intel HD Graphics"),
+
+    # 29. Intel Graphics basic
+    (r'VGA\s+INTEL', 'INTEL', 2,
+     r"Intel Graphics"),
+
+    # 30. Qualcomm Adreno GPU - PATTERN BARU
+    (r'QUALCOMM\s+ADRENO', 'QUALCOMM', 2,
+     r"Adreno Graphics"),
+
+    # 31. VGA NVIDIA dengan model spesifik
+    (r'VGA\s+(?:NVIDIA|GEFORCE)[^,]*?(RTX|GTX|MX|GT|QUADRO)\s*([A-Z]?\d{3,4}[A-Z]?)', 'VGA', 3,
+     lambda m: f"{m.group(1)} {m.group(2)}" if m.group(1) != 'QUADRO' else f"Quadro {m.group(2)}"),
+
+    # 32. AMD Radeon series dengan model angka (fallback)
+    (r'RADEON\s+(\d{3,4}M)\b', 'RADEON', 3,
+     r"Radeon \g<1>"),
+
+    # 33. AMD Radeon Vega series (fallback)
+    (r'(?:ATI\s)?RADEON\s+(VEGA\s?\d{1,2})', 'RADEON', 3,
+     r"Radeon \g<1>"),
+]
+def _unique_rules(rules):
+    """Drop (pattern, literal, priority, formatter) rules whose pattern + formatter already appeared earlier."""
+    seen, unique = set(), []
+    for pattern, literal, priority, formatter in rules:
+        if (pattern, formatter) not in seen:
+            seen.add((pattern, formatter))
+            unique.append((pattern, literal, priority, formatter))
+    return unique
+
+# diurutkan berdasarkan priority sekali saja (sort stabil: urutan dalam priority yang sama tetap).
+# Salinan identik (mis. RTX 40/30/20 series) tidak pernah bisa menghasilkan hasil lain, jadi dibuang.
+_GPU_PATTERNS = tuple(
+    (re.compile(pattern), literal, priority, formatter)
+    for pattern, literal, priority, formatter in _unique_rules(sorted(_GPU_PATTERN_TABLE, key=lambda x: x[2]))
+)
+# Satu pass untuk semua pattern hanya lewat RE2 Set. Alternation re biasa dengan named group
+# tidak dipakai: ia memberi match paling kiri (bukan priority tertinggi), dan pada korpus uji
+# lebih dari 2x lebih lambat daripada loop dengan prefilter literal, bahkan hanya sebagai gerbang
+_GPU_PATTERN_SET = _re2_rule_set([pattern.pattern for pattern, _, _, _ in _GPU_PATTERNS])
+_GPU_PATTERN_LITERALS = tuple(literal for _, literal, _, _ in _GPU_PATTERNS)
+
+# Fallback "VGA ..." description: nama GPU setelah kata VGA, lalu pola per vendor
+_VGA_NAME_RE = re.compile(r'VGA\s+([A-Z][A-Z0-9\s]+?)(?=,|\(|\)|RAM|SSD|HDD|LED|WIN|WINDOWS|READY)')
+_VGA_NVIDIA_PATTERNS = tuple(re.compile(p) for p in (
+    r'(RTX|GTX)\s*(\d{4})',
+    r'(RTX|GTX)\s*(\d{4})\s*(TI)',
+    r'(MX\s*(\d{3}))',
+    r'(GT\s*\d{3,4}[A-Z]?)',
+    r'(\d{3,4}[A-Z]?M)\b',
+    r'(QUADRO\s+\w+)'
+))
+_VGA_INTEL_PATTERNS = tuple(re.compile(p) for p in (
+    r'IRIS\s?XE',
+    r'INTEL\s+ARC',
+    r'INTEL\s+(UHD|HD)\s+GRAPHICS\s+(\d+)',
+    r'INTEL\s+UHD',
+    r'INTEL\s+HD'
+))
+_VGA_AMD_PATTERNS = tuple(re.compile(p) for p in (
+    r'RADEON\s+PRO\s+(\d{3,4}[A-Z]?)',
+    r'RADEON\s+(8[89]\dM)',
+    r'RADEON\s+(7[4-8]\dM)',
+    r'RADEON\s+(6[1-8]\dM)',
+    r'RADEON\s+(VEGA\s?[2-9]|VEGA\s?10)',
+    r'RADEON\s+(\d{3,4}M)',
+    # Pattern untuk Radeon R series dalam VGA description
+    r'RADEON\s+(R[5-9])\s+[A-Z]\d+[A-Z]+\b',
+    r'RADEON\s+(R[5-9])\b'
+))
+
+# Fallback untuk GPU vendor lain
+_GPU_VENDOR_KEYWORDS = (
+    ('POWERVR', 'PowerVR Graphics'),
+    ('MALI', 'Mali Graphics'),
+    ('ADRENO', 'Adreno Graphics'),
+    ('RADEON', 'AMD Radeon Graphics'),
+    ('INTEL', 'Intel Graphics')
+)
+
 def extract_gpu(gpu_name):
     """
     Extracting and standardizing GPU names from product names.
     """
-    name_upper = gpu_name.upper()
+    return _extract_gpu_upper(gpu_name.upper())
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _extract_gpu_upper(name_upper):
+    """Cached core of extract_gpu on the uppercased name."""
     
     # 1. APPLE SILICON GRAPHICS - PATTERN YANG LEBIH SPESIFIK (priority tertinggi)
     # Deteksi produk Apple dengan M series processor
-    apple_m_patterns = [
-        r'APPLE\s+M[1-4]\s*(?:PRO|MAX|ULTRA)?\s*(?:\d+-CORE\s*CPU)?\s*(?:\d+-CORE\s*GPU)',
-        r'MACBOOK\s+(?:AIR|PRO)\s+M[1-4]',
-        r'APPLE\s+M[1-4][^.]*(?:CPU|GPU)',
-        r'MACBOOK[^.]*M[1-4]'
-    ]
-    
-    # Cek apakah ini produk Apple dengan M series
-    is_apple_m_product = False
-    for pattern in apple_m_patterns:
-        if re.search(pattern, name_upper):
-            is_apple_m_product = True
-            break
+    is_apple_m_product = _APPLE_M_GPU_RE.search(name_upper) is not None
     
     # Juga cek keyword tambahan untuk memastikan ini produk Apple
-    has_apple_keywords = any(keyword in name_upper for keyword in [
-        'MACBOOK', 'IMAC', 'MAC MINI', 'MAC PRO', 'MAC STUDIO', 'APPLE M1', 'APPLE M2', 'APPLE M3', 'APPLE M4', 'MAC OS'
-    ])
+    has_apple_keywords = any(keyword in name_upper for keyword in _APPLE_GPU_KEYWORDS)
     
     if is_apple_m_product and has_apple_keywords:
         return "Apple Silicon Graphics"
@@ -1080,160 +1440,26 @@ def extract_gpu(gpu_name):
     if 'AMD' in name_upper and ('INTEGRATED AMD GRAPHICS' in name_upper or 'INTEGRATED GRAPHICS' in name_upper):
         return "Integrated AMD Graphics"
     
-    # Mapping pattern untuk berbagai tipe GPU dengan prioritas
-    gpu_patterns = [
-        # 3. AMD Radeon Pro Series (Pro 555X, Pro 560X, dll) - PATTERN BARU DIPINDAHKAN LEBIH TINGGI
-        (r'RADEON\s+PRO\s+(\d{3,4}[A-Z]?)\b', 1,
-         lambda m: f"Radeon Pro {m.group(1)}"),
-        
-        # 4. AMD Radeon 800M Series (890M, 880M, dll)
-        (r'RADEON\s+(8[89]\dM)\b', 1,
-         lambda m: f"Radeon {m.group(1)}"),
-        
-        # 5. AMD Radeon 700M Series (780M, 760M, 740M, dll)
-        (r'RADEON\s+(7[4-8]\dM)\b', 1,
-         lambda m: f"Radeon {m.group(1)}"),
-        
-        # 6. AMD Radeon 600M Series (680M, 660M, 610M, dll)
-        (r'RADEON\s+(6[1-8]\dM)\b', 1,
-         lambda m: f"Radeon {m.group(1)}"),
-        
-        # 7. AMD Radeon Vega series (Vega 7, Vega 8, Vega 10, dll)
-        (r'(?:ATI\s)?RADEON\s+(VEGA\s?[2-9]|VEGA\s?10)\b', 1,
-         lambda m: f"Radeon {m.group(1)}"),
-        
-        # 8. AMD Radeon R series (R5, R7, R8, R9) - PATTERN REVISI: HANYA AMBIL R5/R7/R8/R9
-        (r'RADEON\s+(R[5-9])\s+[A-Z]\d+[A-Z]+\b', 1,
-         lambda m: f"Radeon {m.group(1)}"),
-        
-        # 9. AMD Radeon R series basic (R5, R7, R8, R9)
-        (r'RADEON\s+(R[5-9])\b', 1,
-         lambda m: f"Radeon {m.group(1)}"),
-        
-        # 10. NVIDIA RTX 40 series (4050, 4060, 4070, 4080, 4090)
-        (r'(RTX)\s*(\d{4})\b', 1,
-         lambda m: f"{m.group(1)} {m.group(2)}"),
-        
-        # 11. NVIDIA RTX 30 series (3050, 3060, 3070, 3080, 3090)
-        (r'(RTX)\s*(\d{4})\b', 1,
-         lambda m: f"{m.group(1)} {m.group(2)}"),
-        
-        # 12. NVIDIA RTX 20 series (2050, 2060, 2070, 2080)
-        (r'(RTX)\s*(\d{4})\b', 1,
-         lambda m: f"{m.group(1)} {m.group(2)}"),
-        
-        # 13. NVIDIA GTX 16 series (1650, 1660)
-        (r'(GTX)\s*(\d{4})\b', 1,
-         lambda m: f"{m.group(1)} {m.group(2)}"),
-        
-        # 14. NVIDIA GTX 10 series (1050, 1060, 1070, 1080)
-        (r'(GTX)\s*(\d{4})\b', 1,
-         lambda m: f"{m.group(1)} {m.group(2)}"),
-        
-        # 15. NVIDIA GeForce M-series (920M, 940M, 970M, dll) - DIPINDAH KE BAWAH
-        (r'(GEFORCE\s+)?(\d{3,4}[A-Z]?M)\b', 5,
-         lambda m: f"GTX {m.group(2)}" if int(re.search(r'\d+', m.group(2)).group()) >= 1000 
-         else f"GT{m.group(2)}"),
-        
-        # 16. NVIDIA Quadro T-series (T600, T500, T1000, T2000)
-        (r'(QUADRO\s+)?(T[1-6]\d{2,3})\b', 2,
-         lambda m: f"Quadro {m.group(2)}"),
-        
-        # 17. NVIDIA RTX A-series (A500, A1000, A2000, A3000, A4000, A5000)
-        (r'(RTX\s+)?(A[1-5]\d{3})\b', 2,
-         lambda m: f"RTX {m.group(2)}"),
-        
-        # 18. NVIDIA GeForce RTX/GTX dengan Ti
-        (r'(RTX|GTX)\s*(\d{4})\s*(TI)', 2,
-         lambda m: f"{m.group(1)} {m.group(2)} Ti"),
-        
-        # 19. NVIDIA GeForce MX series
-        (r'(MX\s*(\d{3}))', 3,
-         lambda m: f"MX {m.group(2)}"),
-        
-        # 20. NVIDIA GeForce GT series (tanpa X)
-        (r'(GT\s*\d{3,4}[A-Z]?)', 3,
-         lambda m: m.group(1).replace(' ', '')),
-        
-        # 21. NVIDIA Quadro P-series (P1000, P2000, P3200, P4200)
-        (r'(QUADRO\s+)?(P[1-4]\d{3}[A-Z]?)', 3,
-         lambda m: f"Quadro {m.group(2)}"),
-        
-        # 22. NVIDIA Quadro M-series (M2000M, M3000M, M2200M)
-        (r'(QUADRO\s+)?(M[1-3]\d{3}[A-Z]?)', 3,
-         lambda m: f"Quadro {m.group(2)}"),
-        
-        # 23. AMD Radeon RX series
-        (r'(RX\s*(\d{4})\s*([M]?))', 3,
-         lambda m: f"Radeon RX {m.group(2)}{m.group(3)}"),
-        
-        # 24. Intel Iris Xe Graphics - PRIORITY DITINGKATKAN
-        (r'IRIS\s?XE', 1,
-         lambda m: 'Intel Iris Xe Graphics'),
-        
-        # 25. Intel Arc Graphics - PATTERN BARU
-        (r'INTEL\s+ARC', 1,
-         lambda m: 'Intel Arc Graphics'),
-        
-        # 26. Intel UHD/HD Graphics dengan seri spesifik
-        (r'INTEL\s+(UHD|HD)\s+GRAPHICS\s+(\d+)', 2,
-         lambda m: f"Intel {m.group(1)} Graphics {m.group(2)}"),
-        
-        # 27. Intel UHD Graphics
-        (r'INTEL\s+UHD', 2,
-         lambda m: 'Intel UHD Graphics'),
-        
-        # 28. Intel HD Graphics
-        (r'INTEL\s+HD', 2,
-         lambda m: 'Intel HD Graphics'),
-        
-        # 29. Intel Graphics basic
-        (r'VGA\s+INTEL', 2,
-         lambda m: 'Intel Graphics'),
-        
-        # 30. Qualcomm Adreno GPU - PATTERN BARU
-        (r'QUALCOMM\s+ADRENO', 2,
-         lambda m: 'Adreno Graphics'),
-        
-        # 31. VGA NVIDIA dengan model spesifik
-        (r'VGA\s+(?:NVIDIA|GEFORCE)[^,]*?(RTX|GTX|MX|GT|QUADRO)\s*([A-Z]?\d{3,4}[A-Z]?)', 3,
-         lambda m: f"{m.group(1)} {m.group(2)}" if m.group(1) != 'QUADRO' else f"Quadro {m.group(2)}"),
-        
-        # 32. AMD Radeon series dengan model angka (fallback)
-        (r'RADEON\s+(\d{3,4}M)\b', 3,
-         lambda m: f"Radeon {m.group(1)}"),
-        
-        # 33. AMD Radeon Vega series (fallback)
-        (r'(?:ATI\s)?RADEON\s+(VEGA\s?\d{1,2})', 3,
-         lambda m: f"Radeon {m.group(1)}"),
-    ]
 
-    # Cari pattern dengan priority tertinggi (diurutkan berdasarkan priority)
-    sorted_patterns = sorted(gpu_patterns, key=lambda x: x[1])
-    for pattern, priority, formatter in sorted_patterns:
-        match = re.search(pattern, name_upper)
+    # Cari pattern dengan priority tertinggi; RE2 Set menyaring kandidat dalam satu pass
+    for i in _rule_candidates(_GPU_PATTERN_SET, _GPU_PATTERN_LITERALS, name_upper):
+        pattern, _, priority, formatter = _GPU_PATTERNS[i]
+        match = pattern.search(name_upper)
         if match:
-            result = formatter(match)
+            result = match.expand(formatter) if isinstance(formatter, str) else formatter(match)
             if result:  # Skip None results
                 return result
     
     # Fallback: Deteksi berdasarkan kata kunci VGA
     if 'VGA ' in name_upper:
-        vga_match = re.search(r'VGA\s+([A-Z][A-Z0-9\s]+?)(?=,|\(|\)|RAM|SSD|HDD|LED|WIN|WINDOWS|READY)', name_upper)
+        vga_match = _VGA_NAME_RE.search(name_upper)
         if vga_match:
             vga_name = vga_match.group(1).strip()
             if any(keyword in vga_name for keyword in ['NVIDIA', 'GEFORCE', 'QUADRO']):
                 # Coba ekstrak model NVIDIA dari VGA description
-                nvidia_patterns = [
-                    r'(RTX|GTX)\s*(\d{4})',
-                    r'(RTX|GTX)\s*(\d{4})\s*(TI)',
-                    r'(MX\s*(\d{3}))',
-                    r'(GT\s*\d{3,4}[A-Z]?)',
-                    r'(\d{3,4}[A-Z]?M)\b',
-                    r'(QUADRO\s+\w+)'
-                ]
-                for nv_pattern in nvidia_patterns:
-                    nv_match = re.search(nv_pattern, vga_name)
+                for nv_re in _VGA_NVIDIA_PATTERNS:
+                    nv_pattern = nv_re.pattern
+                    nv_match = nv_re.search(vga_name)
                     if nv_match:
                         if 'QUADRO' in nv_match.group(0):
                             return nv_match.group(0)
@@ -1246,21 +1472,15 @@ def extract_gpu(gpu_name):
                             return f"MX {nv_match.group(2)}"
                         elif 'M' in nv_match.group(0) and nv_match.group(0)[0].isdigit():
                             model = nv_match.group(0)
-                            return f"GT{model}" if int(re.search(r'\d+', model).group()) < 1000 else f"GTX {model}"
+                            return f"GT{model}" if _model_number(model) < 1000 else f"GTX {model}"
                         else:
                             return nv_match.group(0)
                 return 'Integrated Graphics'
             elif 'INTEL' in vga_name:
                 # Cek tipe Intel Graphics yang spesifik
-                intel_patterns = [
-                    r'IRIS\s?XE',
-                    r'INTEL\s+ARC',
-                    r'INTEL\s+(UHD|HD)\s+GRAPHICS\s+(\d+)',
-                    r'INTEL\s+UHD',
-                    r'INTEL\s+HD'
-                ]
-                for intel_pattern in intel_patterns:
-                    intel_match = re.search(intel_pattern, vga_name)
+                for intel_re in _VGA_INTEL_PATTERNS:
+                    intel_pattern = intel_re.pattern
+                    intel_match = intel_re.search(vga_name)
                     if intel_match:
                         if 'IRIS XE' in intel_pattern:
                             return 'Intel Iris Xe Graphics'
@@ -1275,19 +1495,9 @@ def extract_gpu(gpu_name):
                 return 'Intel Graphics'
             elif any(keyword in vga_name for keyword in ['AMD', 'ATI', 'RADEON']):
                 # Cek apakah ini AMD Radeon iGPU spesifik atau Radeon Pro
-                amd_patterns = [
-                    r'RADEON\s+PRO\s+(\d{3,4}[A-Z]?)',
-                    r'RADEON\s+(8[89]\dM)',
-                    r'RADEON\s+(7[4-8]\dM)',
-                    r'RADEON\s+(6[1-8]\dM)',
-                    r'RADEON\s+(VEGA\s?[2-9]|VEGA\s?10)',
-                    r'RADEON\s+(\d{3,4}M)',
-                    # Pattern untuk Radeon R series dalam VGA description
-                    r'RADEON\s+(R[5-9])\s+[A-Z]\d+[A-Z]+\b',
-                    r'RADEON\s+(R[5-9])\b'
-                ]
-                for amd_pattern in amd_patterns:
-                    amd_match = re.search(amd_pattern, vga_name)
+                for amd_re in _VGA_AMD_PATTERNS:
+                    amd_pattern = amd_re.pattern
+                    amd_match = amd_re.search(vga_name)
                     if amd_match:
                         if 'PRO' in amd_pattern:
                             return f"Radeon Pro {amd_match.group(1)}"
@@ -1301,22 +1511,35 @@ def extract_gpu(gpu_name):
                 return 'Adreno Graphics'
     
     # Fallback untuk GPU vendor lain
-    vendor_patterns = [
-        ('POWERVR', 'PowerVR Graphics'),
-        ('MALI', 'Mali Graphics'),
-        ('ADRENO', 'Adreno Graphics'),
-        ('RADEON', 'AMD Radeon Graphics'),
-        ('INTEL', 'Intel Graphics')
-    ]
-    
-    for keyword, gpu_name in vendor_patterns:
+    for keyword, gpu_name in _GPU_VENDOR_KEYWORDS:
         if keyword in name_upper:
-            logger.debug(f"GPU detected: {gpu_name} from '{gpu_name}' input")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"GPU detected: {gpu_name} from '{name_upper}' input")
             return gpu_name
     
-    logger.debug(f"Unknown GPU in '{gpu_name}'")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Unknown GPU in '{name_upper}'")
     return 'Unknown Graphics'
 
+# Model NVIDIA yang dicocokkan sebagai substring di standardize_gpu
+_GPU_QUADRO_RTX_MODELS = ('RTX 1000', 'RTX 2000', 'RTX 3000', 'RTX 4000', 'RTX 5000', 'RTX 3500')
+_GPU_ENTRY_MODELS = ('GT920', 'GT940', 'GTX 920', 'GTX 940')
+_GPU_MAINSTREAM_MODELS = ('GTX 1050', 'GTX 1060', 'GTX 1070', 'GTX 1080', 'GTX 1650', 'GTX 1660')
+_GPU_PERFORMANCE_MODELS = (
+    'RTX 2050', 'RTX 2060', 'RTX 2070', 'RTX 2080', 'RTX 3050', 'RTX 3060', 'RTX 3070', 'RTX 3080'
+)
+_GPU_HIGHEND_MODELS = (
+    'RTX 4050', 'RTX 4060', 'RTX 4070', 'RTX 4080', 'RTX 4090',
+    'RTX 5050', 'RTX 5060', 'RTX 5070', 'RTX 5080', 'RTX 5090'
+)
+# Label tetap dari extract_gpu (bentuk uppercase), di luar nomor model di atas
+_GPU_CANONICAL_LABELS = (
+    'INTEL GRAPHICS', 'INTEL IRIS XE GRAPHICS', 'INTEL ARC GRAPHICS', 'INTEL UHD GRAPHICS',
+    'INTEL HD GRAPHICS', 'AMD RADEON GRAPHICS', 'INTEGRATED AMD GRAPHICS', 'APPLE SILICON GRAPHICS',
+    'POWERVR GRAPHICS', 'MALI GRAPHICS', 'ADRENO GRAPHICS', 'UNKNOWN GRAPHICS'
+)
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
 def standardize_gpu(gpu_name):
     """
     Standardize and group GPUs into more structured categories
@@ -1325,6 +1548,14 @@ def standardize_gpu(gpu_name):
         return 'Integrated Graphics'
         
     gpu_upper = str(gpu_name).upper()
+    # Nama kanonik hasil extract_gpu (mis. 'RTX 4060') langsung dari tabel, tanpa tangga substring
+    category = _GPU_CATEGORY.get(gpu_upper)
+    if category is not None:
+        return category
+    return _standardize_gpu_upper(gpu_upper)
+
+def _standardize_gpu_upper(gpu_upper):
+    """Branch ladder of standardize_gpu on the uppercased GPU name."""
     
     # 1. INTEL INTEGRATED GRAPHICS - REVISI: SEMUA iGPU INTEL DIKELOMPOKKAN SEBAGAI INTEL INTEGRATED GRAPHICS
     if any(intel_igpu in gpu_upper for intel_igpu in [
@@ -1360,34 +1591,23 @@ def standardize_gpu(gpu_name):
     
     # 6. NVIDIA QUADRO WORKSTATION (REVISI - tambah RTX series workstation)
     if (gpu_upper.startswith('QUADRO') or gpu_upper.startswith('RTX A') or 
-        any(quadro in gpu_upper for quadro in [
-            'RTX 1000', 'RTX 2000', 'RTX 3000', 'RTX 4000', 'RTX 5000', 'RTX 3500'
-        ])):
+        any(quadro in gpu_upper for quadro in _GPU_QUADRO_RTX_MODELS)):
         return 'NVIDIA Quadro Workstation'
     
     # 7. NVIDIA GEFORCE ENTRY-LEVEL
-    if gpu_upper.startswith('MX ') or any(entry in gpu_upper for entry in [
-        'GT920', 'GT940', 'GTX 920', 'GTX 940'
-    ]):
+    if gpu_upper.startswith('MX ') or any(entry in gpu_upper for entry in _GPU_ENTRY_MODELS):
         return 'NVIDIA GeForce Entry-Level'
     
     # 8. NVIDIA GEFORCE MAINSTREAM
-    if any(mainstream in gpu_upper for mainstream in [
-        'GTX 1050', 'GTX 1060', 'GTX 1070', 'GTX 1080', 'GTX 1650', 'GTX 1660'
-    ]):
+    if any(mainstream in gpu_upper for mainstream in _GPU_MAINSTREAM_MODELS):
         return 'NVIDIA GeForce Mainstream'
     
     # 9. NVIDIA GEFORCE PERFORMANCE
-    if any(performance in gpu_upper for performance in [
-        'RTX 2050', 'RTX 2060', 'RTX 2070', 'RTX 2080', 'RTX 3050', 'RTX 3060', 'RTX 3070', 'RTX 3080'
-    ]):
+    if any(performance in gpu_upper for performance in _GPU_PERFORMANCE_MODELS):
         return 'NVIDIA GeForce Performance'
     
     # 10. NVIDIA GEFORCE HIGH-END
-    if any(highend in gpu_upper for highend in [
-        'RTX 4050', 'RTX 4060', 'RTX 4070', 'RTX 4080', 'RTX 4090',
-        'RTX 5050', 'RTX 5060', 'RTX 5070', 'RTX 5080', 'RTX 5090'
-    ]):
+    if any(highend in gpu_upper for highend in _GPU_HIGHEND_MODELS):
         return 'NVIDIA GeForce High-End'
     
     # 11. AMD RADEON RX DEDICATED (Consumer/Gaming)
@@ -1419,43 +1639,60 @@ def standardize_gpu(gpu_name):
     
     return 'Other GPU'
 
+# Kategori untuk setiap nama kanonik, dihitung sekali dengan tangga yang sama
+_GPU_CATEGORY = {
+    name: _standardize_gpu_upper(name)
+    for name in (_GPU_CANONICAL_LABELS + _GPU_QUADRO_RTX_MODELS + _GPU_ENTRY_MODELS
+                 + _GPU_MAINSTREAM_MODELS + _GPU_PERFORMANCE_MODELS + _GPU_HIGHEND_MODELS)
+}
+
+# Pattern untuk mengekstrak RAM dengan berbagai format (priority tinggi)
+_RAM_PATTERNS = tuple((re.compile(pattern), literal, priority) for pattern, literal, priority in (
+    # Pattern 1: Format Apple dengan frekuensi - "8GB 2133MHz LPDDR3", "16GB 2400MHz DDR4"
+    (r'(\d+)\s*GB\s*\d+[KM]?HZ\s*(?:LPDDR|DDR)[345]', 'GB', 1),
+    # Pattern 2: Format Apple dengan MHz - "8GB 2133MHz", "16GB 2400MHz"
+    (r'(\d+)\s*GB\s*\d+[KM]?HZ', 'GB', 1),
+    # Pattern 3: "RAM 4GB", "RAM 8 GB", "RAM 16GB", dll - dengan kata kunci RAM
+    (r'RAM\s*(\d+)\s*GB', 'RAM', 2),
+    # Pattern 4: "Memori 4GB", "Memori 8 GB", "Memori 16GB", dll
+    (r'MEMORI\s*(\d+)\s*GB', 'MEMORI', 2),
+    # Pattern 5: "Memory Ram 8GB", "Memory 16GB", dll
+    (r'MEMORY\s*(?:RAM)?\s*(\d+)\s*GB', 'MEMORY', 2),
+    # Pattern 6: "2x16GB DDR4", "2x8GB DDR5", dll (RAM dengan multiplier)
+    (r'(\d+)[X*]\s*(\d+)\s*GB\s*(?:DDR|RAM)', 'GB', 2),
+    # Pattern 7: "4GB DDR3L", "8GB DDR4", "16GB DDR5", dll - dengan DDR
+    (r'(\d+)\s*GB\s*DDR[345]?[A-Z]?', 'DDR', 2),
+    # Pattern 8: "DDR4 8GB", "DDR5 16GB", dll - HARUS dengan DDR
+    (r'DDR[345]?[A-Z]?\s*(\d+)\s*GB', 'DDR', 2),
+    # Pattern 9: "8GB RAM", "16GB RAM", dll - HARUS dengan kata RAM setelahnya
+    (r'(\d+)\s*GB\s*RAM', 'RAM', 2),
+    # Pattern 10: "8GB Memory", "16GB Memory", dll - HARUS dengan kata Memory setelahnya
+    (r'(\d+)\s*GB\s*MEMORY', 'MEMORY', 2),
+    # Pattern 11: Angka + GB yang diikuti oleh spesifikasi processor/storage
+    (r'(\d+)\s*GB\s*(?:DDR|,|\s+[A-Z]|\s+SSD|\s+HDD|\s+INTEL|\s+AMD|\s+RYZEN|\s+CORE)', 'GB', 2),
+    # Pattern 12: Angka + GB di dalam kurung sebelum spesifikasi lain
+    (r'\([^)]*?(\d+)\s*GB\s*[^)]*?\)', 'GB', 2),
+))
+_RAM_PATTERN_SET = _re2_rule_set([pattern.pattern for pattern, _, _ in _RAM_PATTERNS])
+_RAM_PATTERN_LITERALS = tuple(literal for _, literal, _ in _RAM_PATTERNS)
+_COMMON_RAM_SIZES = frozenset({2, 4, 8, 16, 32, 64, 128})
+# Hanya angka + GB yang berdiri sendiri atau sebelum kata tertentu
+_RAM_FALLBACK_RE = re.compile(r'\b(\d+)\s*GB\b')
+
 def extract_ram(ram_size):
     """
     Extracting and standardizing RAM size from product names.
     """
-    name_upper = str(ram_size).upper()
-    
-    # Pattern untuk mengekstrak RAM dengan berbagai format (priority tinggi)
-    ram_patterns = [
-        # Pattern 1: Format Apple dengan frekuensi - "8GB 2133MHz LPDDR3", "16GB 2400MHz DDR4"
-        (r'(\d+)\s*GB\s*\d+[KM]?HZ\s*(?:LPDDR|DDR)[345]', 1),
-        # Pattern 2: Format Apple dengan MHz - "8GB 2133MHz", "16GB 2400MHz"
-        (r'(\d+)\s*GB\s*\d+[KM]?HZ', 1),
-        # Pattern 3: "RAM 4GB", "RAM 8 GB", "RAM 16GB", dll - dengan kata kunci RAM
-        (r'RAM\s*(\d+)\s*GB', 2),
-        # Pattern 4: "Memori 4GB", "Memori 8 GB", "Memori 16GB", dll
-        (r'MEMORI\s*(\d+)\s*GB', 2),
-        # Pattern 5: "Memory Ram 8GB", "Memory 16GB", dll
-        (r'MEMORY\s*(?:RAM)?\s*(\d+)\s*GB', 2),
-        # Pattern 6: "2x16GB DDR4", "2x8GB DDR5", dll (RAM dengan multiplier)
-        (r'(\d+)[X*]\s*(\d+)\s*GB\s*(?:DDR|RAM)', 2),
-        # Pattern 7: "4GB DDR3L", "8GB DDR4", "16GB DDR5", dll - dengan DDR
-        (r'(\d+)\s*GB\s*DDR[345]?[A-Z]?', 2),
-        # Pattern 8: "DDR4 8GB", "DDR5 16GB", dll - HARUS dengan DDR
-        (r'DDR[345]?[A-Z]?\s*(\d+)\s*GB', 2),
-        # Pattern 9: "8GB RAM", "16GB RAM", dll - HARUS dengan kata RAM setelahnya
-        (r'(\d+)\s*GB\s*RAM', 2),
-        # Pattern 10: "8GB Memory", "16GB Memory", dll - HARUS dengan kata Memory setelahnya
-        (r'(\d+)\s*GB\s*MEMORY', 2),
-        # Pattern 11: Angka + GB yang diikuti oleh spesifikasi processor/storage
-        (r'(\d+)\s*GB\s*(?:DDR|,|\s+[A-Z]|\s+SSD|\s+HDD|\s+INTEL|\s+AMD|\s+RYZEN|\s+CORE)', 2),
-        # Pattern 12: Angka + GB di dalam kurung sebelum spesifikasi lain
-        (r'\([^)]*?(\d+)\s*GB\s*[^)]*?\)', 2),
-    ]
+    return _extract_ram_upper(str(ram_size).upper())
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _extract_ram_upper(name_upper):
+    """Cached core of extract_ram on the uppercased name."""
     
-    # Cari pattern dengan priority tertinggi
-    for pattern, priority in ram_patterns:
-        match = re.search(pattern, name_upper)
+    # Cari pattern dengan priority tertinggi; RE2 Set menyaring kandidat dalam satu pass
+    for i in _rule_candidates(_RAM_PATTERN_SET, _RAM_PATTERN_LITERALS, name_upper):
+        pattern, _, priority = _RAM_PATTERNS[i]
+        match = pattern.search(name_upper)
         if match:
             # Handle pattern dengan multiplier (2x16GB)
             if len(match.groups()) == 2:
@@ -1466,72 +1703,81 @@ def extract_ram(ram_size):
                 total_ram = int(match.group(1))
             
             # Validasi ukuran RAM yang umum
-            if total_ram in [2, 4, 8, 16, 32, 64, 128]:
+            if total_ram in _COMMON_RAM_SIZES:
                 return f"{total_ram}GB"
             elif 1 <= total_ram <= 256:  # Fallback untuk ukuran tidak umum
                 return f"{total_ram}GB"
     
-    # Pattern fallback yang LEBIH KETAT (priority rendah)
-    fallback_patterns = [
-        # Hanya angka + GB yang berdiri sendiri atau sebelum kata tertentu
-        (r'\b(\d+)\s*GB\b', lambda m: not any(storage in name_upper for storage in [
-            'SSD', 'HDD', 'STORAGE', 'SSD'+m.group(1)+'GB', 'HDD'+m.group(1)+'GB',
-            'SSD '+m.group(1)+'GB', 'HDD '+m.group(1)+'GB'
-        ])),
-    ]
-    
-    for pattern, condition in fallback_patterns:
-        match = re.search(pattern, name_upper)
-        if match and condition(match):
-            ram_size = int(match.group(1))
-            # Hanya terima ukuran RAM yang umum dalam fallback
-            if ram_size in [2, 4, 8, 16, 32, 64, 128]:
-                logger.debug(f"RAM detected: {ram_size}GB from '{ram_size}' input")
-                return f"{ram_size}GB"
-    
-    logger.debug(f"Unknown RAM in '{ram_size}'")
+    # Pattern fallback yang LEBIH KETAT (priority rendah): angka + GB yang berdiri sendiri,
+    # hanya bila nama tidak menyebut storage sama sekali
+    match = _RAM_FALLBACK_RE.search(name_upper)
+    if match and not any(storage in name_upper for storage in ('SSD', 'HDD', 'STORAGE')):
+        ram_size = int(match.group(1))
+        # Hanya terima ukuran RAM yang umum dalam fallback
+        if ram_size in _COMMON_RAM_SIZES:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"RAM detected: {ram_size}GB from '{name_upper}' input")
+            return f"{ram_size}GB"
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Unknown RAM in '{name_upper}'")
     return 'Unknown RAM'
 
+# Pattern untuk mengekstrak storage dengan berbagai format
+_STORAGE_PATTERNS = tuple((re.compile(pattern), literal, storage_type) for pattern, literal, storage_type in (
+    # Pattern 1: SSHD + kapasitas (1TB SSHD)
+    (r'(\d+)\s*(GB|TB)\s*SSHD', 'SSHD', 'SSHD'),
+    # Pattern 2: SSHD + kapasitas (SSHD 1TB)
+    (r'SSHD\s*(\d+)\s*(GB|TB)', 'SSHD', 'SSHD'),
+    # Pattern 3: eMMC + kapasitas (eMMC 128GB, EMMC 32GB)
+    (r'(?:EMMC|E?MMC)\s*(\d+)\s*(GB|TB)', '', 'eMMC'),
+    # Pattern 4: SSD + kapasitas (SSD 256GB, SSD 512GB, SSD 1TB)
+    (r'SSD\s*(\d+)\s*(GB|TB)', 'SSD', 'SSD'),
+    # Pattern 5: HDD + kapasitas (HDD 1TB, HDD 2TB)
+    (r'HDD\s*(\d+)\s*(GB|TB)', 'HDD', 'HDD'),
+    # Pattern 6: NVMe + kapasitas (NVMe 512GB, NVME 1TB)
+    (r'NVME?\s*(\d+)\s*(GB|TB)', 'NVM', 'NVMe'),
+    # Pattern 7: Storage + kapasitas (Storage 128GB, Storage 256GB)
+    (r'STORAGE\s*(\d+)\s*(GB|TB)', 'STORAGE', 'Storage'),
+    # Pattern 8: Kapasitas + SSD (256GB SSD, 512GB SSD, 1TB SSD)
+    (r'(\d+)\s*(GB|TB)\s*SSD', 'SSD', 'SSD'),
+    # Pattern 9: Kapasitas + HDD (1TB HDD, 2TB HDD)
+    (r'(\d+)\s*(GB|TB)\s*HDD', 'HDD', 'HDD'),
+    # Pattern 10: Kapasitas + eMMC (128GB eMMC, 32GB EMMC)
+    (r'(\d+)\s*(GB|TB)\s*(?:EMMC|E?MMC)', '', 'eMMC'),
+    # Pattern 11: Kapasitas + NVMe (512GB NVMe, 1TB NVME)
+    (r'(\d+)\s*(GB|TB)\s*NVME?', 'NVM', 'NVMe'),
+    # Pattern 12: Kapasitas + SSHD (1TB SSHD)
+    (r'(\d+)\s*(GB|TB)\s*SSHD', 'SSHD', 'SSHD'),
+))
+_STORAGE_PATTERN_SET = _re2_rule_set([pattern.pattern for pattern, _, _ in _STORAGE_PATTERNS])
+_STORAGE_PATTERN_LITERALS = tuple(literal for _, literal, _ in _STORAGE_PATTERNS)
+# Pattern fallback yang lebih ketat, hanya dipakai bila tidak ada pattern eksplisit yang match
+_STORAGE_FALLBACK_PATTERNS = tuple((re.compile(pattern), storage_type) for pattern, storage_type in (
+    # Pattern 13: Kapasitas saja - hanya di konteks yang jelas storage
+    (r'\b(\d+)\s*(GB|TB)\s*(?=STORAGE|SSD|HDD|EMMC|NVME|SSHD|$|,|\))', 'Storage'),
+    # Pattern 14: Kapasitas setelah koma atau di akhir deskripsi
+    (r',\s*(\d+)\s*(GB|TB)\s*(?:,|\)|$)', 'Storage'),
+    # Pattern 15: Kapasitas dalam kurung yang jelas storage context
+    (r'\(\s*(\d+)\s*(GB|TB)\s*[^)]*\)', 'Storage'),
+))
+
 def extract_storage(storage_size):
     """
     Extract and standardize storage specifications from product names.
     """
-    name_upper = str(storage_size).upper()
+    return _extract_storage_upper(str(storage_size).upper())
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _extract_storage_upper(name_upper):
+    """Cached core of extract_storage on the uppercased name."""
     
     storage_specs = []
-    
-    # Pattern untuk mengekstrak storage dengan berbagai format
-    storage_patterns = [
-        # Pattern 1: SSHD + kapasitas (1TB SSHD)
-        (r'(\d+)\s*(GB|TB)\s*SSHD', 'SSHD'),
-        # Pattern 2: SSHD + kapasitas (SSHD 1TB)
-        (r'SSHD\s*(\d+)\s*(GB|TB)', 'SSHD'),
-        # Pattern 3: eMMC + kapasitas (eMMC 128GB, EMMC 32GB)
-        (r'(?:EMMC|E?MMC)\s*(\d+)\s*(GB|TB)', 'eMMC'),
-        # Pattern 4: SSD + kapasitas (SSD 256GB, SSD 512GB, SSD 1TB)
-        (r'SSD\s*(\d+)\s*(GB|TB)', 'SSD'),
-        # Pattern 5: HDD + kapasitas (HDD 1TB, HDD 2TB)  
-        (r'HDD\s*(\d+)\s*(GB|TB)', 'HDD'),
-        # Pattern 6: NVMe + kapasitas (NVMe 512GB, NVME 1TB)
-        (r'NVME?\s*(\d+)\s*(GB|TB)', 'NVMe'),
-        # Pattern 7: Storage + kapasitas (Storage 128GB, Storage 256GB)
-        (r'STORAGE\s*(\d+)\s*(GB|TB)', 'Storage'),
-        # Pattern 8: Kapasitas + SSD (256GB SSD, 512GB SSD, 1TB SSD)
-        (r'(\d+)\s*(GB|TB)\s*SSD', 'SSD'),
-        # Pattern 9: Kapasitas + HDD (1TB HDD, 2TB HDD)
-        (r'(\d+)\s*(GB|TB)\s*HDD', 'HDD'),
-        # Pattern 10: Kapasitas + eMMC (128GB eMMC, 32GB EMMC)
-        (r'(\d+)\s*(GB|TB)\s*(?:EMMC|E?MMC)', 'eMMC'),
-        # Pattern 11: Kapasitas + NVMe (512GB NVMe, 1TB NVME)
-        (r'(\d+)\s*(GB|TB)\s*NVME?', 'NVMe'),
-        # Pattern 12: Kapasitas + SSHD (1TB SSHD)
-        (r'(\d+)\s*(GB|TB)\s*SSHD', 'SSHD'),
-    ]
-    
-    # Cari semua pattern storage yang eksplisit
-    for pattern, storage_type in storage_patterns:
-        matches = re.finditer(pattern, name_upper)
-        for match in matches:
+
+    # Cari semua pattern storage yang eksplisit; RE2 Set menyaring pattern yang match dalam satu pass
+    for i in _rule_candidates(_STORAGE_PATTERN_SET, _STORAGE_PATTERN_LITERALS, name_upper):
+        pattern, _, storage_type = _STORAGE_PATTERNS[i]
+        for match in pattern.finditer(name_upper):
             capacity = int(match.group(1))
             unit = match.group(2)
             
@@ -1546,23 +1792,13 @@ def extract_storage(storage_size):
                 'unit': unit,
                 'capacity_gb': capacity_gb,
                 'type': storage_type,
-                'pattern_used': pattern
+                'pattern_used': pattern.pattern
             })
     
     # Jika tidak ada pattern eksplisit, cari pattern fallback yang lebih ketat
     if not storage_specs:
-        fallback_patterns = [
-            # Pattern 13: Kapasitas saja - hanya di konteks yang jelas storage
-            (r'\b(\d+)\s*(GB|TB)\s*(?=STORAGE|SSD|HDD|EMMC|NVME|SSHD|$|,|\))', 'Storage'),
-            # Pattern 14: Kapasitas setelah koma atau di akhir deskripsi
-            (r',\s*(\d+)\s*(GB|TB)\s*(?:,|\)|$)', 'Storage'),
-            # Pattern 15: Kapasitas dalam kurung yang jelas storage context
-            (r'\(\s*(\d+)\s*(GB|TB)\s*[^)]*\)', 'Storage'),
-        ]
-        
-        for pattern, storage_type in fallback_patterns:
-            matches = re.finditer(pattern, name_upper)
-            for match in matches:
+        for pattern, storage_type in _STORAGE_FALLBACK_PATTERNS:
+            for match in pattern.finditer(name_upper):
                 capacity = int(match.group(1))
                 unit = match.group(2)
                 
@@ -1582,7 +1818,7 @@ def extract_storage(storage_size):
                     'unit': unit,
                     'capacity_gb': capacity_gb,
                     'type': storage_type,
-                    'pattern_used': pattern
+                    'pattern_used': pattern.pattern
                 })
     
     # Proses hasil ekstraksi - AMBIL HANYA SATU YANG UTAMA
@@ -1594,9 +1830,11 @@ def extract_storage(storage_size):
     
     # Return hanya kapasitasnya saja
     result = f"{main_storage['capacity']}{main_storage['unit']}"
-    logger.debug(f"Storage detected: {result} from '{storage_size}' input")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Storage detected: {result} from '{name_upper}' input")
     return result
 
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
 def extract_display(display_size):
     """
     Extract and standardize screen sizes from product names
@@ -1880,8 +2118,83 @@ def extract_display(display_size):
         if size.endswith('.0'):
             size = size[:-2]
         result = f'{size}"'
-        logger.debug(f"Display detected: {result} from '{display_size}' input")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Display detected: {result} from '{display_size}' input")
         return result
 
-    logger.debug(f"Unknown display in '{display_size}'")
-    return 'Unknown'
\ No newline at end of file
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Unknown display in '{display_size}'")
+    return 'Unknown'
+
+# Kolom hasil extract_specs(), urutannya sama dengan tuple yang dikembalikan
+SPEC_COLUMNS = [
+    'series', 'processor_detail', 'processor_category',
+    'gpu', 'gpu_category', 'ram', 'storage', 'display'
+]
+# Kolom hasil extract_all(): brand + SPEC_COLUMNS
+FEATURE_COLUMNS = ['brand'] + SPEC_COLUMNS
+# Semua label yang bisa dikembalikan standardize_processor / standardize_gpu,
+# dipakai sebagai kategori tetap (kode int8) untuk kolom processor_category / gpu_category
+PROCESSOR_CATEGORIES = (
+    'Intel Core Ultra', 'Intel Core i9', 'Intel Core i7', 'Intel Core i5', 'Intel Core i3',
+    'Intel Core Series', 'Intel N-Series', 'Intel Pentium', 'Intel Celeron', 'Intel Atom',
+    'Intel Xeon', 'Intel Other', 'AMD Ryzen 9', 'AMD Ryzen 7', 'AMD Ryzen 5', 'AMD Ryzen 3',
+    'AMD Ryzen Series', 'AMD Entry-Level', 'AMD Other', 'Apple Silicon', 'Qualcomm Snapdragon',
+    'MediaTek', 'Unknown Category'
+)
+GPU_CATEGORIES = (
+    'NVIDIA GeForce High-End', 'NVIDIA GeForce Performance', 'NVIDIA GeForce Mainstream',
+    'NVIDIA GeForce Entry-Level', 'NVIDIA Quadro Workstation', 'AMD Radeon Dedicated',
+    'AMD Radeon Pro Workstation', 'AMD Integrated Graphics', 'Intel Integrated Graphics',
+    'Apple Silicon Graphics', 'Other Mobile Graphics', 'Integrated Graphics', 'Other GPU'
+)
+
+def extract_brands(product_names, brand_list):
+    """
+    Vectorized extract_brand for a whole pandas Series of product names.
+    All brands are matched with one union regex per name instead of one re.search per brand;
+    the result is identical to extract_brand row by row (first brand in brand_list order wins).
+    """
+    brands_key = tuple(brand_list)
+    brand_re, rank = _brand_matcher(brands_key)
+    names_lower = product_names.str.strip().str.lower()
+
+    # non-string input -> NaN from .str, same 'Other' as extract_brand
+    if re2 is not None:
+        # pandas .str only accepts the stdlib re engine, so RE2 is driven directly
+        brand_re = _brand_re2(brands_key)
+        found = [brand_re.findall(name) if isinstance(name, str) else None for name in names_lower]
+        brands = pd.Series([_pick_brand(f, rank) for f in found], index=product_names.index, dtype=object)
+    else:
+        brands = names_lower.str.findall(brand_re).map(lambda f: _pick_brand(f, rank))
+    # Special check for Lenovo Legion models
+    is_legion = names_lower.str.contains(_LEGION_MODEL_RE, regex=True, na=False)
+    return brands.mask(is_legion, 'Lenovo')
+
+def extract_specs(product_name):
+    """
+    Extract every feature except brand from a single product name in one pass.
+    Returns a tuple ordered like SPEC_COLUMNS.
+    """
+    # satu kali upper() untuk semua extractor berbasis huruf besar
+    name_upper = product_name.upper()
+    processor = _extract_processor_upper(name_upper)
+    gpu = _extract_gpu_upper(name_upper)
+    return (
+        extract_series(product_name),
+        processor,
+        standardize_processor(processor),
+        gpu,
+        standardize_gpu(gpu),
+        _extract_ram_upper(name_upper),
+        _extract_storage_upper(name_upper),
+        extract_display(product_name),
+    )
+
+def extract_all(product_name, brand_list):
+    """
+    Extract all features from a single product name in one pass.
+    Returns a tuple ordered like FEATURE_COLUMNS, so the ETL can build all
+    feature columns from one loop instead of nine separate .apply() passes.
+    """
+    return (extract_brand(product_name, brand_list),) + extract_specs(product_name)
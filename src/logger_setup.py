@@ -1,14 +1,91 @@
+import atexit
 import logging
+import multiprocessing
 import os
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 LOG_DIR = "logs"
 LOG_FILE = "pipeline.log"
+LOG_MAX_BYTES = 50_000_000
+LOG_BACKUP_COUNT = 5
+# Ukuran file asli dibaca ulang tiap sekian record (proses lain ikut menulis ke file yang sama)
+LOG_SIZE_CHECK_EVERY = 100
 
 os.makedirs(LOG_DIR, exist_ok=True)
 
-def setup_logger(name: str):
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
+# Semua logger berbagi satu QueueHandler; file & console ditulis oleh thread QueueListener,
+# jadi logger.info() di jalur ETL cukup memasukkan record ke antrian. Antriannya multiprocessing.Queue:
+# worker Pool (fork) mewarisinya dan mengirim record ke listener yang sama, sehingga hanya satu
+# proses yang menulis dan me-rotate pipeline.log
+_queue_handler = None
+_listener = None
+
+
+class CountingRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that keeps the file size in memory. The stdlib handler does a
+    seek + tell on every record to decide on rollover; here the size is counted in
+    encoded bytes per written message and re-read from the file every
+    LOG_SIZE_CHECK_EVERY records and before any rollover.
+
+    pipeline.log is shared by main.py and its subprocesses (scraper, etl), each with its
+    own handler: the re-check picks up their writes, and if another process already
+    rotated the file, this one reopens the new pipeline.log instead of rotating again.
+    """
+
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, **kwargs)
+        self._bytes_written = 0
+        self._records_since_check = 0
+        self._sync_with_file()
+
+    def _sync_with_file(self):
+        """Refresh the byte count from disk; reopen if the file was rotated by another process."""
+        self._records_since_check = 0
+        try:
+            on_disk = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            on_disk = None
+        if self.stream is not None:
+            current = os.fstat(self.stream.fileno())
+            if on_disk is None or (on_disk.st_dev, on_disk.st_ino) != (current.st_dev, current.st_ino):
+                # stream kita menunjuk ke file yang sudah di-rename (pipeline.log.1)
+                self.stream.close()
+                self.stream = self._open()
+                on_disk = os.fstat(self.stream.fileno())
+        self._bytes_written = on_disk.st_size if on_disk is not None else 0
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.encoding or "utf-8", "replace"))
+            self._records_since_check += 1
+            will_overflow = self.maxBytes > 0 and self._bytes_written + size >= self.maxBytes
+            if will_overflow or self._records_since_check >= LOG_SIZE_CHECK_EVERY:
+                self._sync_with_file()
+            # sama seperti stdlib: file kosong tidak di-rotate
+            if self.maxBytes > 0 and self._bytes_written and self._bytes_written + size >= self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self.flush()
+            self._bytes_written += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self._bytes_written = 0
+        self._records_since_check = 0
+
+
+def _get_queue_handler():
+    global _queue_handler, _listener
+    if _queue_handler is not None:
+        return _queue_handler
 
     # Format log rapi
     formatter = logging.Formatter(
@@ -16,19 +93,55 @@ def setup_logger(name: str):
         datefmt="%Y-%m-%d %H:%M:%S"
     )
 
-    # File handler (semua file share 1 file log)
-    file_handler = logging.FileHandler(os.path.join(LOG_DIR, LOG_FILE))
+    # File handler (semua file share 1 file log, di-rotate per LOG_MAX_BYTES)
+    file_handler = CountingRotatingFileHandler(
+        os.path.join(LOG_DIR, LOG_FILE), maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8"
+    )
     file_handler.setFormatter(formatter)
-    file_handler.setLevel(logging.INFO)
 
     # Console handler (opsional)
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    console_handler.setLevel(logging.INFO)
+
+    log_queue = multiprocessing.Queue(-1)
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    # flush sisa antrian saat proses selesai
+    atexit.register(_listener.stop)
+
+    _queue_handler = QueueHandler(log_queue)
+    return _queue_handler
+
+
+def _level_from_name(level_name: str):
+    """Numeric level for a level name such as 'DEBUG' or '10'; None when the name is unknown."""
+    level_name = level_name.strip().upper()
+    if level_name.isdigit():
+        return int(level_name)
+    if hasattr(logging, "getLevelNamesMapping"):  # Python 3.11+
+        return logging.getLevelNamesMapping().get(level_name)
+    level = logging.getLevelName(level_name)
+    return level if isinstance(level, int) else None
+
+
+def setup_logger(name: str, default_level: int = logging.INFO):
+    """
+    Logger sharing the pipeline queue handler. The level comes from the LOG_LEVEL
+    env var (e.g. LOG_LEVEL=DEBUG) when set, otherwise default_level; handlers
+    do not filter further, so the logger level is the only gate. An unknown
+    LOG_LEVEL falls back to default_level with a warning instead of failing at import.
+    """
+    logger = logging.getLogger(name)
+    env_level = os.environ.get("LOG_LEVEL")
+    level = _level_from_name(env_level) if env_level else default_level
+    logger.setLevel(default_level if level is None else level)
 
     # Hindari duplicate handler
     if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        logger.addHandler(_get_queue_handler())
+
+    if level is None:
+        logger.warning(f"Unknown LOG_LEVEL={env_level!r}, using {logging.getLevelName(default_level)}")
 
     return logger
@@ -125,7 +125,11 @@ def save_snapshot_dedup(rows: List[Dict], db_path: str = DB_PATH):
         deduped.append(r)
     now_iso = datetime.utcnow().isoformat(sep=' ', timespec='seconds')  # e.g. '2025-11-24 21:38:00'
     conn = sqlite3.connect(db_path)
+    # DB raw dibaca ETL dengan mode=ro, jadi tetap journal rollback (bukan WAL);
+    # drop + create + insert dalam satu transaksi = satu commit dan snapshot atomik
+    conn.execute("PRAGMA synchronous=NORMAL")
     cur = conn.cursor()
+    cur.execute("BEGIN")
     cur.execute("DROP TABLE IF EXISTS products_raw;")
     cur.execute("""
         CREATE TABLE products_raw (
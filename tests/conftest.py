@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Modul di src/ saling impor dengan nama datar (from extractors import ...), seperti saat dijalankan
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
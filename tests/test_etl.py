@@ -0,0 +1,141 @@
+import json
+import multiprocessing
+import sqlite3
+
+import numpy as np
+import pytest
+
+import etl
+
+BASE_ROWS = [(f"ASUS Vivobook {i} Intel Core i5 8GB 512GB SSD", 8500000, "2025-01-01") for i in range(7)]
+
+
+@pytest.fixture
+def etl_paths(tmp_path):
+    return {
+        "input_db_path": str(tmp_path / "raw.db"),
+        "current_db_path": str(tmp_path / "current.db"),
+        "history_db_path": str(tmp_path / "history.db"),
+        "meta_db_path": str(tmp_path / "meta.db"),
+    }
+
+
+def write_raw(path, rows):
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("DROP TABLE IF EXISTS products_raw;")
+        conn.execute(
+            "CREATE TABLE products_raw (id INTEGER PRIMARY KEY, product_name TEXT, price_raw INTEGER, scraped_at TEXT);"
+        )
+        conn.executemany("INSERT INTO products_raw (product_name, price_raw, scraped_at) VALUES (?, ?, ?);", rows)
+    conn.close()
+
+
+def second_snapshot():
+    # 5 tidak berubah, 1 harga berubah, 1 hilang (discontinued), 1 produk baru
+    return BASE_ROWS[:5] + [
+        (BASE_ROWS[5][0], 9000000, "2025-01-02"),
+        ("Lenovo IdeaPad Slim 3 Ryzen 5 16GB 512GB SSD", 7000000, "2025-01-02"),
+    ]
+
+
+@pytest.mark.parametrize("clear_record_hash", [False, True])
+def test_new_product_does_not_flag_unchanged_prices(etl_paths, clear_record_hash):
+    write_raw(etl_paths["input_db_path"], BASE_ROWS)
+    assert etl.run_etl(**etl_paths)["new_products"] == 7
+
+    if clear_record_hash:
+        # baris dari sebelum kolom record_hash ada
+        conn = sqlite3.connect(etl_paths["current_db_path"])
+        with conn:
+            conn.execute("UPDATE products_current SET record_hash = NULL;")
+        conn.close()
+
+    write_raw(etl_paths["input_db_path"], second_snapshot())
+    result = etl.run_etl(**etl_paths)
+
+    assert result["status"] == "ok"
+    assert result["new_products"] == 1
+    assert result["price_updates"] == 1
+    assert result["attribute_updates"] == 0
+    assert result["discontinued"] == 1
+    assert result["unchanged"] == 5
+
+    conn = sqlite3.connect(etl_paths["meta_db_path"])
+    details = [
+        json.loads(row[0]) for row in conn.execute(
+            "SELECT details_json FROM changes_log WHERE run_id = ? AND change_type = 'price_update';",
+            (result["meta_run_id"],)
+        )
+    ]
+    conn.close()
+    assert details == [{"price_raw": {"old": 8500000, "new": 9000000}}]
+
+
+def test_missing_record_hash_is_backfilled(etl_paths):
+    write_raw(etl_paths["input_db_path"], BASE_ROWS)
+    etl.run_etl(**etl_paths)
+    conn = sqlite3.connect(etl_paths["current_db_path"])
+    with conn:
+        conn.execute("UPDATE products_current SET record_hash = NULL;")
+    conn.close()
+
+    write_raw(etl_paths["input_db_path"], second_snapshot())
+    etl.run_etl(**etl_paths)
+
+    conn = sqlite3.connect(etl_paths["current_db_path"])
+    missing = conn.execute("SELECT COUNT(*) FROM products_current WHERE record_hash IS NULL;").fetchone()[0]
+    conn.close()
+    # termasuk versi yang ditutup (harga berubah / discontinued) pada run yang sama
+    assert missing == 0
+
+
+def test_etl_connection_uses_rollback_journal_on_all_files(etl_paths):
+    # file lama dari run WAL sebelumnya harus kembali ke rollback journal (commit atomik lintas file)
+    for key in ("current_db_path", "history_db_path"):
+        conn = sqlite3.connect(etl_paths[key])
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.close()
+
+    conn = etl.open_etl_connection(
+        etl_paths["current_db_path"], etl_paths["history_db_path"], etl_paths["meta_db_path"]
+    )
+    try:
+        modes = {
+            schema: conn.execute(f"PRAGMA {schema}.journal_mode;").fetchone()[0]
+            for schema in ("main", etl.HISTORY_SCHEMA, etl.META_SCHEMA)
+        }
+    finally:
+        conn.close()
+    assert modes == dict.fromkeys(("main", etl.HISTORY_SCHEMA, etl.META_SCHEMA), "truncate")
+
+
+def test_parallel_extraction_matches_inline(monkeypatch):
+    names = [name for name, _, _ in BASE_ROWS + second_snapshot()] + [
+        "Apple MacBook Air M2 8GB 256GB",
+        "Acer Nitro V15 Ryzen 7 7735HS RTX 4050 16GB 1TB SSD 15.6\"",
+        "HP Victus 15 i5-12450H GTX 1650 8GB RAM 512GB",
+    ]
+    pool_sizes = []
+    get_context = multiprocessing.get_context
+
+    def spy_context(method=None):
+        context = get_context(method)
+        pool = context.Pool
+
+        def spy_pool(processes):
+            pool_sizes.append(processes)
+            return pool(processes)
+
+        monkeypatch.setattr(context, "Pool", spy_pool)
+        return context
+
+    monkeypatch.setattr(etl, "PARALLEL_EXTRACT_MIN_ROWS", 1)
+    monkeypatch.setattr(etl.os, "cpu_count", lambda: 3)
+    monkeypatch.setattr(etl.multiprocessing, "get_context", spy_context)
+
+    rows = etl.extract_features_parallel(np.array(names, dtype=object))
+
+    # jalur pool benar-benar dipakai, dengan lebih dari satu worker
+    assert pool_sizes == [3]
+    assert rows == etl.extract_spec_features(names)
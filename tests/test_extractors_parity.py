@@ -0,0 +1,97 @@
+"""
+Parity of src/extractors.py with the original extractors.
+
+tests/data/extractor_parity.jsonl.gz holds one JSON row per product name:
+[name, brand, series, processor_detail, processor_category, gpu, gpu_category, ram, storage, display]
+as returned by the extractors at the baseline commit (741f98b), before the performance work.
+Names are scraped-style listings plus random combinations of the literals the extractors look
+for (model codes, series names, unit suffixes, non-ASCII characters).
+
+Every optional accelerator (google-re2, pyahocorasick) must give the same results as the
+pure-stdlib path, so the module is loaded fresh once per combination.
+"""
+import gzip
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import extractors
+
+DATA_FILE = Path(__file__).parent / "data" / "extractor_parity.jsonl.gz"
+COLUMNS = ["name"] + extractors.FEATURE_COLUMNS
+
+
+@pytest.fixture(scope="module")
+def expected():
+    with gzip.open(DATA_FILE, "rt", encoding="utf-8") as f:
+        return pd.DataFrame([json.loads(line) for line in f], columns=COLUMNS)
+
+
+@pytest.fixture(scope="module", params=[(), ("re2",), ("ahocorasick",), ("re2", "ahocorasick")],
+                ids=["installed", "no-re2", "no-ahocorasick", "stdlib-only"])
+def module(request):
+    """extractors loaded fresh with the given optional modules made unimportable."""
+    saved = {name: sys.modules.get(name) for name in request.param}
+    sys.modules.update(dict.fromkeys(request.param))
+    try:
+        spec = importlib.util.spec_from_file_location(f"extractors_{'_'.join(request.param)}", extractors.__file__)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+    finally:
+        for name, original in saved.items():
+            if original is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = original
+    for name in request.param:
+        assert getattr(mod, name) is None
+    return mod
+
+
+def _mismatches(expected_col, actual):
+    actual = pd.Series(list(actual), index=expected_col.index, dtype=object)
+    bad = expected_col.ne(actual)
+    return list(zip(expected_col.index[bad][:5], expected_col[bad][:5], actual[bad][:5]))
+
+
+def test_extract_all_matches_baseline(module, expected):
+    brands = module.get_brands()
+    rows = [module.extract_all(name, brands) for name in expected["name"]]
+    for i, col in enumerate(module.FEATURE_COLUMNS):
+        assert _mismatches(expected[col], (row[i] for row in rows)) == [], col
+
+
+def test_single_extractors_match_baseline(module, expected):
+    names = expected["name"]
+    brands = module.get_brands()
+    checks = {
+        "brand": (module.extract_brand(name, brands) for name in names),
+        "series": map(module.extract_series, names),
+        "processor_detail": map(module.extract_processor, names),
+        "processor_category": map(module.standardize_processor, expected["processor_detail"]),
+        "gpu": map(module.extract_gpu, names),
+        "gpu_category": map(module.standardize_gpu, expected["gpu"]),
+        "ram": map(module.extract_ram, names),
+        "storage": map(module.extract_storage, names),
+        "display": map(module.extract_display, names),
+    }
+    for col, actual in checks.items():
+        assert _mismatches(expected[col], actual) == [], col
+
+
+def test_extract_brands_matches_baseline(module, expected):
+    actual = module.extract_brands(expected["name"], module.get_brands())
+    assert _mismatches(expected["brand"], actual) == []
+
+
+@pytest.mark.parametrize("table", ["_PROCESSOR_PATTERNS", "_PROCESSOR_FINAL_PATTERNS", "_GPU_PATTERNS",
+                                   "_RAM_PATTERNS", "_STORAGE_PATTERNS"])
+def test_rule_literals_appear_in_their_patterns(table):
+    """The prefilter literal of every rule must be text its pattern spells out verbatim."""
+    for rule in getattr(extractors, table):
+        pattern, literal = rule[0].pattern, rule[1]
+        assert literal in pattern, (table, pattern, literal)
@@ -0,0 +1,87 @@
+import logging
+
+import pytest
+
+import logger_setup
+
+
+@pytest.mark.parametrize("env_level, expected", [
+    ("debug", logging.DEBUG),
+    (" Error ", logging.ERROR),
+    ("10", logging.DEBUG),
+    ("verbose", logging.WARNING),  # typo: default_level, bukan ValueError
+])
+def test_log_level_from_env(monkeypatch, env_level, expected):
+    monkeypatch.setenv("LOG_LEVEL", env_level)
+    logger = logger_setup.setup_logger(f"test_level_{env_level.strip()}", logging.WARNING)
+    assert logger.level == expected
+
+
+def test_default_level_without_env(monkeypatch):
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+    assert logger_setup.setup_logger("test_level_default", logging.INFO).level == logging.INFO
+
+
+WORKER_SCRIPT = """
+import logging, multiprocessing, sys
+sys.path.insert(0, {src!r})
+import logger_setup
+logger_setup.LOG_MAX_BYTES = 100_000
+
+logger = logger_setup.setup_logger("fork_test")
+
+def work(worker):
+    for i in range(2000):
+        logger.info("worker %d line %d", worker, i)
+    return worker
+
+if __name__ == "__main__":
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        pool.map(work, range(4))
+        pool.close()
+        pool.join()
+"""
+
+
+@pytest.mark.skipif("fork" not in __import__("multiprocessing").get_all_start_methods(), reason="needs fork")
+def test_forked_workers_log_through_one_writer(tmp_path):
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    src = str(Path(logger_setup.__file__).resolve().parent)
+    script = tmp_path / "run.py"
+    script.write_text(WORKER_SCRIPT.format(src=src))
+    subprocess.run([sys.executable, str(script)], cwd=tmp_path, check=True, capture_output=True)
+
+    paths = list((tmp_path / "logs").glob("pipeline.log*"))
+    # satu penulis: rollover terkoordinasi, tidak ada file yang tumbuh melewati LOG_MAX_BYTES
+    assert all(path.stat().st_size <= 100_000 for path in paths)
+    lines = [line for path in paths for line in path.read_text().splitlines()]
+    # setiap baris utuh (tidak tertimpa rollover dari proses lain) dan tidak ada yang hilang
+    assert all(" | INFO     | fork_test | worker " in line for line in lines)
+    assert len(lines) == 4 * 2000
+    assert {line.split(" | ")[-1] for line in lines} == {
+        f"worker {w} line {i}" for w in range(4) for i in range(2000)
+    }
+
+
+def test_rotating_handler_counts_bytes_and_follows_other_writers(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger_setup, "LOG_SIZE_CHECK_EVERY", 1)
+    path = tmp_path / "pipeline.log"
+    # dua handler = dua proses (main.py + subprocess) yang menulis ke file yang sama
+    handlers = [
+        logger_setup.CountingRotatingFileHandler(str(path), maxBytes=2_000, backupCount=50, encoding="utf-8")
+        for _ in range(2)
+    ]
+    for i in range(200):
+        record = logging.LogRecord("t", logging.INFO, __file__, 0, "📥 baris %d", (i,), None)
+        handlers[i % 2].emit(record)
+    for handler in handlers:
+        handler.close()
+
+    paths = list(tmp_path.glob("pipeline.log*"))
+    # ukuran dihitung dalam byte (emoji = 4 byte), dan rotasi proses lain tidak membuat file membengkak
+    assert all(p.stat().st_size <= 2_000 for p in paths)
+    lines = [line for p in paths for line in p.read_text(encoding="utf-8").splitlines()]
+    assert sorted(lines) == sorted(f"📥 baris {i}" for i in range(200))